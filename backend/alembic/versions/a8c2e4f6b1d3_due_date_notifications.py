@@ -0,0 +1,47 @@
+"""notification table and task due-date index
+
+Revision ID: a8c2e4f6b1d3
+Revises: f7b1d4e5a6c8
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c2e4f6b1d3"
+down_revision: Union[str, None] = "f7b1d4e5a6c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_task_due_date_status", "task", ["due_date", "status"])
+    op.create_table(
+        "notification",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=30), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=True),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("message", sa.String(length=255), nullable=False),
+        sa.Column("dedupe_key", sa.String(length=150), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["task_id"], ["task.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("dedupe_key"),
+    )
+    op.create_index("ix_notification_id", "notification", ["id"])
+    op.create_index("ix_notification_user_id", "notification", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notification_user_id", table_name="notification")
+    op.drop_index("ix_notification_id", table_name="notification")
+    op.drop_table("notification")
+    op.drop_index("ix_task_due_date_status", table_name="task")
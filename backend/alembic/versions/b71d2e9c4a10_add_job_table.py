@@ -0,0 +1,48 @@
+"""add job table for background operations
+
+Revision ID: b71d2e9c4a10
+Revises: 8f6a0b0f9c1a
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b71d2e9c4a10"
+down_revision: Union[str, None] = "8f6a0b0f9c1a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_STATUS_ENUM = sa.Enum("queued", "running", "succeeded", "failed", name="job_status")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("status", JOB_STATUS_ENUM, nullable=False, server_default="queued"),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.String(length=500), nullable=True),
+        sa.Column("progress_current", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("progress_total", sa.Integer(), nullable=True),
+        sa.Column("created_by", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["created_by"], ["user.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_job_id", "job", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_id", table_name="job")
+    op.drop_table("job")
+    JOB_STATUS_ENUM.drop(op.get_bind(), checkfirst=False)
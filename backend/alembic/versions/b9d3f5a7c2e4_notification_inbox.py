@@ -0,0 +1,35 @@
+"""notification read state and per-user unread counter
+
+Revision ID: b9d3f5a7c2e4
+Revises: a8c2e4f6b1d3
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b9d3f5a7c2e4"
+down_revision: Union[str, None] = "a8c2e4f6b1d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("notification", sa.Column("read_at", sa.DateTime(), nullable=True))
+    op.add_column(
+        "user",
+        sa.Column("unread_notifications", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        "UPDATE user SET unread_notifications = "
+        "(SELECT COUNT(*) FROM notification WHERE notification.user_id = user.id AND notification.read_at IS NULL)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user", "unread_notifications")
+    op.drop_column("notification", "read_at")
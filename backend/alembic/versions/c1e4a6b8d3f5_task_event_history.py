@@ -0,0 +1,42 @@
+"""task_event history table
+
+Revision ID: c1e4a6b8d3f5
+Revises: b9d3f5a7c2e4
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1e4a6b8d3f5"
+down_revision: Union[str, None] = "b9d3f5a7c2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_event",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("actor_id", sa.Integer(), nullable=True),
+        sa.Column("action", sa.String(length=20), nullable=False),
+        sa.Column("changes", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_task_event_task_created", "task_event", ["task_id", "created_at"])
+    op.create_index("ix_task_event_project_created", "task_event", ["project_id", "created_at"])
+    op.create_index("ix_task_event_created_at", "task_event", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_event_created_at", table_name="task_event")
+    op.drop_index("ix_task_event_project_created", table_name="task_event")
+    op.drop_index("ix_task_event_task_created", table_name="task_event")
+    op.drop_table("task_event")
@@ -0,0 +1,55 @@
+"""add progress rollup table
+
+Revision ID: c4e8a1f2d3b5
+Revises: b71d2e9c4a10
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a1f2d3b5"
+down_revision: Union[str, None] = "b71d2e9c4a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROGRESS_SCOPE_ENUM = sa.Enum("project", "task", name="progress_scope")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "progress_rollup",
+        sa.Column("scope", PROGRESS_SCOPE_ENUM, nullable=False),
+        sa.Column("scope_id", sa.Integer(), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("done_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.PrimaryKeyConstraint("scope", "scope_id"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO progress_rollup (scope, scope_id, total_count, done_count)
+        SELECT 'project', project_id, COUNT(*), SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END)
+        FROM task
+        WHERE project_id IS NOT NULL
+        GROUP BY project_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO progress_rollup (scope, scope_id, total_count, done_count)
+        SELECT 'task', parent_task_id, COUNT(*), SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END)
+        FROM task
+        WHERE parent_task_id IS NOT NULL
+        GROUP BY parent_task_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("progress_rollup")
+    PROGRESS_SCOPE_ENUM.drop(op.get_bind(), checkfirst=False)
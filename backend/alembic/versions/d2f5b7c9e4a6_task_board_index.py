@@ -0,0 +1,25 @@
+"""composite index for per-status board columns
+
+Revision ID: d2f5b7c9e4a6
+Revises: c1e4a6b8d3f5
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f5b7c9e4a6"
+down_revision: Union[str, None] = "c1e4a6b8d3f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_task_project_status_due", "task", ["project_id", "status", "due_date", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_project_status_due", table_name="task")
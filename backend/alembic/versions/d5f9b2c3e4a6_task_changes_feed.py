@@ -0,0 +1,41 @@
+"""task changes feed: updated_at index and deletion log
+
+Revision ID: d5f9b2c3e4a6
+Revises: c4e8a1f2d3b5
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f9b2c3e4a6"
+down_revision: Union[str, None] = "c4e8a1f2d3b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE task SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL")
+    op.create_index("ix_task_updated_at", "task", ["updated_at"])
+
+    op.create_table(
+        "task_deletion",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("creator_id", sa.Integer(), nullable=True),
+        sa.Column("is_personal", sa.Boolean(), nullable=False, server_default=sa.text("0")),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_task_deletion_id", "task_deletion", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_deletion_id", table_name="task_deletion")
+    op.drop_table("task_deletion")
+    op.drop_index("ix_task_updated_at", table_name="task")
@@ -0,0 +1,69 @@
+"""task change outbox replaces the deletion log
+
+Revision ID: e3a6c8d1f5b7
+Revises: d2f5b7c9e4a6
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a6c8d1f5b7"
+down_revision: Union[str, None] = "d2f5b7c9e4a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_change",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=True),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("creator_id", sa.Integer(), nullable=True),
+        sa.Column("is_personal", sa.Boolean(), nullable=False, server_default=sa.text("0")),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("deleted", sa.Boolean(), nullable=False, server_default=sa.text("0")),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_task_change_created_at", "task_change", ["created_at"])
+
+    # Seed the outbox so a full sync (no cursor) still returns every live task and known tombstone.
+    op.execute(
+        "INSERT INTO task_change (task_id, project_id, creator_id, is_personal, user_id, deleted, created_at) "
+        "SELECT id, project_id, creator_id, is_personal, NULL, 0, COALESCE(updated_at, created_at, CURRENT_TIMESTAMP) "
+        "FROM task WHERE deleted_at IS NULL ORDER BY updated_at, id"
+    )
+    op.execute(
+        "INSERT INTO task_change (task_id, project_id, creator_id, is_personal, user_id, deleted, created_at) "
+        "SELECT task_id, project_id, creator_id, is_personal, NULL, 1, deleted_at "
+        "FROM task_deletion ORDER BY id"
+    )
+    op.drop_index("ix_task_deletion_id", table_name="task_deletion")
+    op.drop_table("task_deletion")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "task_deletion",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("task_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=True),
+        sa.Column("creator_id", sa.Integer(), nullable=True),
+        sa.Column("is_personal", sa.Boolean(), nullable=False, server_default=sa.text("0")),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_task_deletion_id", "task_deletion", ["id"])
+    op.execute(
+        "INSERT INTO task_deletion (task_id, project_id, creator_id, is_personal, deleted_at) "
+        "SELECT task_id, project_id, creator_id, is_personal, created_at "
+        "FROM task_change WHERE deleted = 1 AND task_id IS NOT NULL AND user_id IS NULL ORDER BY id"
+    )
+    op.drop_index("ix_task_change_created_at", table_name="task_change")
+    op.drop_table("task_change")
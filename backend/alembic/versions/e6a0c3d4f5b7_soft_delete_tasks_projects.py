@@ -0,0 +1,32 @@
+"""soft delete columns on task and project
+
+Revision ID: e6a0c3d4f5b7
+Revises: d5f9b2c3e4a6
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a0c3d4f5b7"
+down_revision: Union[str, None] = "d5f9b2c3e4a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("project", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_project_deleted_at", "project", ["deleted_at"])
+    op.add_column("task", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_task_deleted_at", "task", ["deleted_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_deleted_at", table_name="task")
+    op.drop_column("task", "deleted_at")
+    op.drop_index("ix_project_deleted_at", table_name="project")
+    op.drop_column("project", "deleted_at")
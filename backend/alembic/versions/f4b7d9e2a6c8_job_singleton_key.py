@@ -0,0 +1,28 @@
+"""job singleton key so only one purge can be queued across workers
+
+Revision ID: f4b7d9e2a6c8
+Revises: e3a6c8d1f5b7
+Create Date: 2026-10-19 21:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b7d9e2a6c8"
+down_revision: Union[str, None] = "e3a6c8d1f5b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("job", sa.Column("singleton_key", sa.String(length=50), nullable=True))
+    op.create_unique_constraint("uq_job_singleton_key", "job", ["singleton_key"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_job_singleton_key", "job", type_="unique")
+    op.drop_column("job", "singleton_key")
@@ -0,0 +1,33 @@
+"""normalized user search columns
+
+Revision ID: f7b1d4e5a6c8
+Revises: e6a0c3d4f5b7
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f7b1d4e5a6c8"
+down_revision: Union[str, None] = "e6a0c3d4f5b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("user", sa.Column("username_lower", sa.String(length=50), nullable=True))
+    op.add_column("user", sa.Column("display_name_lower", sa.String(length=100), nullable=True))
+    op.execute("UPDATE user SET username_lower = LOWER(username), display_name_lower = LOWER(display_name)")
+    op.create_index("ix_user_username_lower", "user", ["username_lower"])
+    op.create_index("ix_user_display_name_lower", "user", ["display_name_lower"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_display_name_lower", table_name="user")
+    op.drop_index("ix_user_username_lower", table_name="user")
+    op.drop_column("user", "display_name_lower")
+    op.drop_column("user", "username_lower")
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Response, status
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from ..models.health import HealthResponse, PoolStatus, ReadinessResponse
+from ...core.tracing import TracedRoute
+from ...db.database import engine, primary_pool_options
+
+router = APIRouter(route_class=TracedRoute)
+
+
+def _pool_status() -> PoolStatus:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return PoolStatus()
+    return PoolStatus(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        max_overflow=primary_pool_options.get("max_overflow", 0),
+    )
+
+
+def _pool_exhausted(pool: PoolStatus) -> bool:
+    if pool.size is None:
+        return False
+    return pool.checked_out >= pool.size + max(pool.max_overflow, 0)
+
+
+@router.get("/healthz", response_model=HealthResponse)
+def healthz():
+    """Liveness: the worker process is up and serving requests; never touches the database."""
+    return HealthResponse(status="ok")
+
+
+@router.get("/readyz", response_model=ReadinessResponse)
+def readyz(response: Response):
+    """Readiness: the database answers and this worker still has pool capacity."""
+    pool = _pool_status()
+    if _pool_exhausted(pool):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return ReadinessResponse(status="unavailable", database="unknown", pool=pool, detail="connection pool exhausted")
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception as exc:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return ReadinessResponse(
+            status="unavailable",
+            database="unreachable",
+            pool=_pool_status(),
+            detail=exc.__class__.__name__,
+        )
+    return ReadinessResponse(status="ok", database="ok", pool=_pool_status())
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from ..models.job import JobResponse
+from ...core.security import get_user_by_token
+from ...core.tracing import TracedRoute
+from ...db.database import get_db
+from ...db.db_structure import Job, User
+
+router = APIRouter(route_class=TracedRoute)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+    user = db.query(User).filter(User.username == username).first()
+    if user is None or not user.is_active:
+        raise HTTPException(status_code=404, detail="User not found or inactive")
+
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if job is None or (job.created_by != user.id and user.role != "admin"):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
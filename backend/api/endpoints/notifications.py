@@ -0,0 +1,135 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ..models.notification import NotificationPage, NotificationResponse, UnreadCount
+from ...core.cursor import decode_cursor, encode_cursor
+from ...core.realtime import hub, missed_notifications
+from ...core.security import decode_access_token, get_user_by_token
+from ...core.tracing import TracedRoute
+from ...db.database import SessionLocal, get_db
+from ...db.db_structure import Notification, User
+from ...db.notifications import mark_read
+
+router = APIRouter(route_class=TracedRoute)
+
+# Cap on notifications replayed to a reconnecting socket; the unread count covers the rest.
+REPLAY_LIMIT = 50
+
+
+def _get_user_or_404(db: Session, username: str) -> User:
+    user = db.query(User).filter(User.username == username).first()
+    if user is None or not user.is_active:
+        raise HTTPException(status_code=404, detail="User not found or inactive")
+    return user
+
+
+def _user_id_for_token(token: str):
+    try:
+        username = decode_access_token(token).get("sub")
+    except HTTPException:
+        return None
+    db = SessionLocal()
+    try:
+        return db.query(User.id).filter(User.username == username, User.is_active.is_(True)).scalar()
+    finally:
+        db.close()
+
+
+@router.get("/notifications/", response_model=NotificationPage)
+def list_notifications(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    unread_only: bool = Query(False),
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
+    user = _get_user_or_404(db, username)
+    query = db.query(Notification).filter(Notification.user_id == user.id)
+    if unread_only:
+        query = query.filter(Notification.read_at.is_(None))
+    if cursor:
+        try:
+            before_id = int(decode_cursor(cursor)["before"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(Notification.id < before_id)
+
+    # Newest first; the id keyset keeps deep pages as cheap as the first one.
+    rows = query.order_by(Notification.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return NotificationPage(
+        items=rows,
+        unread_count=user.unread_notifications,
+        next_cursor=encode_cursor({"before": rows[-1].id}) if has_more else None,
+    )
+
+
+@router.get("/notifications/unread-count", response_model=UnreadCount)
+def unread_notification_count(db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+    count = (
+        db.query(User.unread_notifications)
+        .filter(User.username == username, User.is_active.is_(True))
+        .scalar()
+    )
+    if count is None:
+        raise HTTPException(status_code=404, detail="User not found or inactive")
+    return UnreadCount(unread_count=count)
+
+
+@router.post("/notifications/read-all", response_model=UnreadCount)
+def mark_all_notifications_read(db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+    user = _get_user_or_404(db, username)
+    mark_read(db, user.id)
+    db.commit()
+    db.refresh(user)
+    return UnreadCount(unread_count=user.unread_notifications)
+
+
+@router.post("/notifications/{notification_id}/read", response_model=NotificationResponse)
+def mark_notification_read(
+    notification_id: int,
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
+    user = _get_user_or_404(db, username)
+    mark_read(db, user.id, [notification_id])
+    db.commit()
+    notification = (
+        db.query(Notification)
+        .filter(Notification.id == notification_id, Notification.user_id == user.id)
+        .first()
+    )
+    if notification is None:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return notification
+
+
+@router.websocket("/ws/notifications")
+async def notifications_socket(
+    websocket: WebSocket,
+    token: str = Query(...),
+    last_id: Optional[int] = Query(None, description="Highest notification id the client has seen"),
+):
+    user_id = await run_in_threadpool(_user_id_for_token, token)
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    hub.connect(user_id, websocket)
+    try:
+        if last_id is not None:
+            # Registered first so nothing falls between the replay and live pushes;
+            # a notification may arrive twice and clients skip ids they have seen.
+            for payload in await run_in_threadpool(missed_notifications, user_id, last_id, REPLAY_LIMIT):
+                await websocket.send_json(payload)
+        while True:
+            # Clients only listen; anything they send just keeps the connection alive.
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        hub.disconnect(user_id, websocket)
@@ -0,0 +1,64 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from ..models.profile import ProfileReportSummary, RouteProfile
+from ...core.profiling import DETERMINISTIC, continuous_profiler, list_reports, load_report
+from ...core.security import get_user_by_token
+from ...core.tracing import TracedRoute
+from ...db.database import get_db
+from ...db.db_structure import User
+
+router = APIRouter(route_class=TracedRoute)
+
+
+def _require_admin(db: Session, username: str):
+    user = db.query(User).filter(User.username == username).first()
+    if user is None or not user.is_active or user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can read profiles")
+
+
+@router.get("/profiles/", response_model=List[ProfileReportSummary])
+def list_profiles(db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+    _require_admin(db, username)
+    return list_reports()
+
+
+@router.get("/profiles/routes", response_model=List[RouteProfile])
+def route_profiles(
+    top: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
+    """Stacks sampled by the continuous profiler in this worker, busiest route first."""
+    _require_admin(db, username)
+    return continuous_profiler.snapshot(top)
+
+
+@router.get("/profiles/routes/folded", response_class=PlainTextResponse)
+def download_route_profile(
+    route: str,
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
+    _require_admin(db, username)
+    folded = continuous_profiler.folded(route)
+    if folded is None:
+        raise HTTPException(status_code=404, detail="No samples for this route")
+    return PlainTextResponse(folded)
+
+
+@router.get("/profiles/{report_id}", response_class=PlainTextResponse)
+def download_profile(report_id: str, db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+    """The report body: folded stacks for ``sample`` mode, pstats text for ``deterministic``."""
+    _require_admin(db, username)
+    report = load_report(report_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    extension = "txt" if report["mode"] == DETERMINISTIC else "folded"
+    return PlainTextResponse(
+        report["report"],
+        headers={"Content-Disposition": f'attachment; filename="profile-{report_id}.{extension}"'},
+    )
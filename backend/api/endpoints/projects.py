@@ -1,25 +1,35 @@
-from typing import List, Optional, Set
+from typing import Dict, List, Literal, Optional, Set
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session, joinedload, selectinload
 
 from ..models.project import (
     ProjectCreate,
     ProjectMemberAdd,
     ProjectMemberRoleUpdate,
+    ProjectMembershipDiff,
     ProjectResponse,
     ProjectRole,
+    ProjectSummary,
     ProjectUpdate,
 )
 from ..models.project import ProjectMemberSummary
+from ..models.user import UserSummary
 from ...core.security import get_user_by_token
-from ...db.database import get_db
+from ...core.timezone import now_vietnam
+from ...core.tracing import TracedRoute
+from ...db.access import get_project_role, invalidate_project_roles
+from ...db.database import get_db, get_read_db
 from ...db.db_structure import Project, ProjectMember, Task, User
+from ...db.notifications import notify
+from ...db.task_changes import record_project_access, record_task_changes
+from ...db.task_events import record_unassignments
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
 
 SYSTEM_CREATE_ROLES = {"admin", "manager"}
+MEMBER_PREVIEW_SIZE = 5
 
 
 def _project_query(db: Session):
@@ -28,11 +38,86 @@ def _project_query(db: Session):
         .options(
             joinedload(Project.owner),
             selectinload(Project.project_members).joinedload(ProjectMember.user),
-            selectinload(Project.tasks),
+            joinedload(Project.progress),
         )
     )
 
 
+def _project_header_query(db: Session):
+    # Owner and rollup are one row each; memberships are fetched separately and only as needed.
+    return db.query(Project).options(joinedload(Project.owner), joinedload(Project.progress))
+
+
+def _project_fields(project: Project) -> dict:
+    return {
+        "id": project.id,
+        "name": project.name,
+        "description": project.description,
+        "color": project.color,
+        "archived": project.archived,
+        "owner": UserSummary.model_validate(project.owner),
+        "task_count": project.task_count,
+        "done_count": project.done_count,
+        "created_at": project.created_at,
+        "updated_at": project.updated_at,
+    }
+
+
+def _member_counts(db: Session, project_ids: List[int]) -> Dict[int, int]:
+    rows = (
+        db.query(ProjectMember.project_id, func.count())
+        .filter(ProjectMember.project_id.in_(project_ids))
+        .group_by(ProjectMember.project_id)
+        .all()
+    )
+    return dict(rows)
+
+
+def _member_previews(db: Session, project_ids: List[int]) -> Dict[int, List[UserSummary]]:
+    position = func.row_number().over(
+        partition_by=ProjectMember.project_id,
+        order_by=(ProjectMember.joined_at.asc(), ProjectMember.user_id.asc()),
+    ).label("position")
+    ranked = (
+        select(ProjectMember.project_id, ProjectMember.user_id, position)
+        .where(ProjectMember.project_id.in_(project_ids))
+        .subquery()
+    )
+    rows = (
+        db.query(ranked.c.project_id, User)
+        .join(User, User.id == ranked.c.user_id)
+        .filter(ranked.c.position <= MEMBER_PREVIEW_SIZE)
+        .order_by(ranked.c.project_id, ranked.c.position)
+        .all()
+    )
+    previews: Dict[int, List[UserSummary]] = {}
+    for project_id, member in rows:
+        previews.setdefault(project_id, []).append(UserSummary.model_validate(member))
+    return previews
+
+
+def _summarize_projects(db: Session, projects: List[Project], viewer: User) -> List[ProjectSummary]:
+    if not projects:
+        return []
+    project_ids = [project.id for project in projects]
+    counts = _member_counts(db, project_ids)
+    previews = _member_previews(db, project_ids)
+    viewer_roles = dict(
+        db.query(ProjectMember.project_id, ProjectMember.role)
+        .filter(ProjectMember.project_id.in_(project_ids), ProjectMember.user_id == viewer.id)
+        .all()
+    )
+    return [
+        ProjectSummary(
+            **_project_fields(project),
+            member_count=counts.get(project.id, 0),
+            member_preview=previews.get(project.id, []),
+            viewer_role=viewer_roles.get(project.id),
+        )
+        for project in projects
+    ]
+
+
 def _get_user_or_404(db: Session, username: str) -> User:
     user = db.query(User).filter(User.username == username).first()
     if not user or not user.is_active:
@@ -103,9 +188,10 @@ def _add_member_to_project(
     membership = ProjectMember(user_id=user.id, role=role.value)
     project.project_members.append(membership)
     db.flush()
+    record_project_access(db, project.id, granted=[user.id])
 
 
-def _remove_member_from_project(db: Session, project: Project, user_id: int):
+def _remove_member_from_project(db: Session, project: Project, user_id: int, actor_id: int):
     if user_id == project.owner_id:
         raise HTTPException(status_code=400, detail="Cannot remove the project owner")
     membership = _get_membership(project, user_id)
@@ -113,10 +199,30 @@ def _remove_member_from_project(db: Session, project: Project, user_id: int):
         raise HTTPException(status_code=404, detail="Member not found in this project")
     project.project_members.remove(membership)
     db.flush()
+    record_project_access(db, project.id, revoked=[user_id])
+    record_unassignments(db, project.id, [user_id], actor_id)
+    record_task_changes(db, Task.project_id == project.id, Task.assignee_id == user_id)
     db.query(Task).filter(
         Task.project_id == project.id,
         Task.assignee_id == user_id,
-    ).update({Task.assignee_id: None})
+    ).update({Task.assignee_id: None, Task.updated_at: now_vietnam()})
+
+
+def _notify_membership(
+    db: Session,
+    project: Project,
+    user_ids: List[int],
+    kind: str,
+    actor: User,
+    role: Optional[ProjectRole] = None,
+):
+    if kind == "project_added":
+        message = f"You were added to '{project.name}'"
+    elif kind == "project_removed":
+        message = f"You were removed from '{project.name}'"
+    else:
+        message = f"Your role in '{project.name}' is now {role.value}"
+    notify(db, user_ids, kind, message, project_id=project.id, actor_id=actor.id)
 
 
 def _serialize_memberships(project: Project) -> List[ProjectMemberSummary]:
@@ -155,20 +261,22 @@ def create_project(
         if member.id == owner.id:
             continue
         _add_member_to_project(db, new_project, member)
+    _notify_membership(db, new_project, project.member_ids, "project_added", owner)
 
     db.commit()
+    invalidate_project_roles(new_project.id)
     return _get_project_or_404(db, new_project.id)
 
 
-@router.get("/projects/", response_model=List[ProjectResponse])
+@router.get("/projects/", response_model=List[ProjectSummary])
 def list_projects(
     archived: Optional[bool] = Query(None),
     search: Optional[str] = Query(None, min_length=1),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     username: str = Depends(get_user_by_token),
 ):
     user = _get_user_or_404(db, username)
-    query = _project_query(db)
+    query = _project_header_query(db)
 
     if not _is_admin(user):
         query = query.filter(Project.project_members.any(ProjectMember.user_id == user.id))
@@ -181,19 +289,31 @@ def list_projects(
         query = query.filter(func.lower(Project.name).like(like))
 
     projects = query.order_by(Project.updated_at.desc()).all()
-    return projects
+    return _summarize_projects(db, projects, user)
 
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
 def get_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    include: Optional[Literal["members"]] = Query(None),
+    db: Session = Depends(get_read_db),
     username: str = Depends(get_user_by_token),
 ):
     user = _get_user_or_404(db, username)
-    project = _get_project_or_404(db, project_id)
-    _require_project_member(user, project)
-    return project
+    if include == "members":
+        project = _get_project_or_404(db, project_id)
+        _require_project_member(user, project)
+        return project
+
+    project = _project_header_query(db).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not _is_admin(user) and get_project_role(db, project_id, user.id) is None:
+        raise HTTPException(status_code=403, detail="You are not a member of this project")
+    return ProjectResponse(
+        **_project_fields(project),
+        member_count=_member_counts(db, [project_id]).get(project_id, 0),
+    )
 
 
 @router.put("/projects/{project_id}", response_model=ProjectResponse)
@@ -225,7 +345,9 @@ def add_project_member(
 
     member = _ensure_member_exists(db, payload.user_id)
     _add_member_to_project(db, project, member, payload.role)
+    _notify_membership(db, project, [member.id], "project_added", requester)
     db.commit()
+    invalidate_project_roles(project_id, member.id)
     project = _get_project_or_404(db, project_id)
     return _serialize_memberships(project)
 
@@ -250,8 +372,11 @@ def update_project_member_role(
     if payload.role == ProjectRole.OWNER and membership.user_id != project.owner_id:
         raise HTTPException(status_code=400, detail="Use ownership transfer flow to change owners")
 
-    membership.role = payload.role.value
+    if membership.role != payload.role.value:
+        membership.role = payload.role.value
+        _notify_membership(db, project, [user_id], "project_role", requester, payload.role)
     db.commit()
+    invalidate_project_roles(project_id, user_id)
     project = _get_project_or_404(db, project_id)
     return _serialize_memberships(project)
 
@@ -267,12 +392,107 @@ def remove_project_member(
     project = _get_project_or_404(db, project_id)
     _require_project_roles(requester, project, [ProjectRole.OWNER, ProjectRole.MANAGER])
 
-    _remove_member_from_project(db, project, user_id)
+    _remove_member_from_project(db, project, user_id, requester.id)
+    _notify_membership(db, project, [user_id], "project_removed", requester)
     db.commit()
+    invalidate_project_roles(project_id, user_id)
     project = _get_project_or_404(db, project_id)
     return _serialize_memberships(project)
 
 
+@router.put("/projects/{project_id}/members", response_model=List[ProjectMemberSummary])
+def replace_project_members(
+    project_id: int,
+    diff: ProjectMembershipDiff,
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
+    """Apply a membership diff with a handful of set-based statements in one transaction."""
+    requester = _get_user_or_404(db, username)
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    desired = {entry.user_id: entry.role for entry in diff.upsert}
+    removed_ids = set(diff.remove)
+    if len(desired) != len(diff.upsert) or desired.keys() & removed_ids:
+        raise HTTPException(status_code=400, detail="Each user may appear only once in the diff")
+    if project.owner_id in removed_ids or project.owner_id in desired:
+        raise HTTPException(status_code=400, detail="The project owner's membership cannot be changed here")
+    if ProjectRole.OWNER in desired.values():
+        raise HTTPException(status_code=400, detail="Cannot assign owner role via membership API")
+
+    current = dict(
+        db.query(ProjectMember.user_id, ProjectMember.role)
+        .filter(ProjectMember.project_id == project_id)
+        .all()
+    )
+    inserts = [user_id for user_id in desired if user_id not in current]
+    role_changes = {
+        user_id: role for user_id, role in desired.items()
+        if user_id in current and current[user_id] != role.value
+    }
+    deletes = sorted(removed_ids & current.keys())
+
+    if role_changes:
+        _require_owner_or_admin(requester, project)
+    elif inserts or deletes:
+        requester_role = current.get(requester.id)
+        if not _is_admin(requester) and requester_role not in {ProjectRole.OWNER.value, ProjectRole.MANAGER.value}:
+            raise HTTPException(status_code=403, detail="Action not allowed for your project role")
+
+    if inserts:
+        active = db.query(func.count(User.id)).filter(User.id.in_(inserts), User.is_active.is_(True)).scalar()
+        if active != len(inserts):
+            raise HTTPException(status_code=404, detail="User not found or inactive")
+        db.execute(
+            insert(ProjectMember),
+            [{"project_id": project_id, "user_id": user_id, "role": desired[user_id].value} for user_id in inserts],
+        )
+        record_project_access(db, project_id, granted=inserts)
+    for role in set(role_changes.values()):
+        db.execute(
+            update(ProjectMember)
+            .where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id.in_([user_id for user_id, value in role_changes.items() if value == role]),
+            )
+            .values(role=role.value)
+            .execution_options(synchronize_session=False)
+        )
+    if deletes:
+        db.execute(
+            delete(ProjectMember)
+            .where(ProjectMember.project_id == project_id, ProjectMember.user_id.in_(deletes))
+            .execution_options(synchronize_session=False)
+        )
+        record_project_access(db, project_id, revoked=deletes)
+        record_unassignments(db, project_id, deletes, requester.id)
+        record_task_changes(db, Task.project_id == project_id, Task.assignee_id.in_(deletes))
+        db.execute(
+            update(Task)
+            .where(Task.project_id == project_id, Task.assignee_id.in_(deletes))
+            .values(assignee_id=None, updated_at=now_vietnam())
+            .execution_options(synchronize_session=False)
+        )
+    _notify_membership(db, project, inserts, "project_added", requester)
+    _notify_membership(db, project, deletes, "project_removed", requester)
+    for role in set(role_changes.values()):
+        changed = [user_id for user_id, value in role_changes.items() if value == role]
+        _notify_membership(db, project, changed, "project_role", requester, role)
+    db.commit()
+    invalidate_project_roles(project_id)
+
+    memberships = (
+        db.query(ProjectMember)
+        .options(joinedload(ProjectMember.user))
+        .filter(ProjectMember.project_id == project_id)
+        .order_by(ProjectMember.joined_at.asc(), ProjectMember.user_id.asc())
+        .all()
+    )
+    return [ProjectMemberSummary.model_validate(member) for member in memberships]
+
+
 @router.post("/projects/{project_id}/archive", response_model=ProjectResponse)
 def archive_project(
     project_id: int,
@@ -308,9 +528,20 @@ def delete_project(
     username: str = Depends(get_user_by_token),
 ):
     requester = _get_user_or_404(db, username)
-    project = _get_project_or_404(db, project_id)
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
     if not (_is_admin(requester) or project.owner_id == requester.id):
         raise HTTPException(status_code=403, detail="Only owner or admin can delete project")
-    db.delete(project)
+    # Tasks and memberships are hard-deleted later by the background purge, but
+    # sync clients hear about it now: once deleted_at is set the project drops
+    # out of every visibility filter, so later tombstones would never reach them.
+    member_ids = [
+        user_id for (user_id,) in db.query(ProjectMember.user_id).filter(ProjectMember.project_id == project_id)
+    ]
+    record_task_changes(db, Task.project_id == project_id, Task.deleted_at.is_(None), deleted=True)
+    record_project_access(db, project_id, revoked=member_ids)
+    project.deleted_at = now_vietnam()
     db.commit()
+    invalidate_project_roles(project_id)
     return None
@@ -1,49 +1,57 @@
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
 from collections import defaultdict
 from typing import Dict, List, Optional, Set
 
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, func, literal, or_, select, union_all, update
+from sqlalchemy.orm import Session, joinedload
 
 from ..models.project import ProjectRole
-from ..models.task import TaskCreate, TaskResponse, TaskStatus, TaskUpdate
+from ..models.task import (
+    BoardColumn,
+    ProjectBoard,
+    TaskChanges,
+    TaskCreate,
+    TaskEventPage,
+    TaskResponse,
+    TaskStatus,
+    TaskTombstone,
+    TaskTreeNode,
+    TaskUpdate,
+)
+from ...core.cursor import decode_cursor, encode_cursor
 from ...core.security import get_user_by_token
-from ...db.database import get_db
-from ...db.db_structure import Project, ProjectMember, Task, User
-
-router = APIRouter()
+from ...core.timezone import now_vietnam, to_vietnam_naive
+from ...core.tracing import TracedRoute
+from ...db.access import get_project_role
+from ...db.database import get_db, get_read_db, get_write_db
+from ...db.db_structure import Project, Task, TaskChange, TaskEvent, User
+from ...db.notifications import notify
+from ...db.rollups import record_subtree_removal, record_task_change, task_state
+from ...db.task_changes import record_task_changes, settled_change_id
+from ...db.task_events import record_bulk_events, record_task_event, task_snapshot
+from ...db.task_tree import load_subtree_rows, load_task_tree
+
+router = APIRouter(route_class=TracedRoute)
+
+TASK_TREE_MAX_DEPTH = 50
+BOARD_COLUMNS = (TaskStatus.TO_DO, TaskStatus.IN_PROGRESS, TaskStatus.DONE)
+CHANGES_EPOCH = datetime(1970, 1, 1)
 
 active_connections: Set[WebSocket] = set()
 
 
-VIETNAM_TZ = timezone(timedelta(hours=7))
-
-
-def _now_vietnam() -> datetime:
-    """Return current Vietnam time as a timezone-naive datetime."""
-    return datetime.now(VIETNAM_TZ).replace(tzinfo=None)
-
-
-def _to_vietnam_naive(dt: Optional[datetime]) -> Optional[datetime]:
-    """Convert aware datetimes to Vietnam time and drop tzinfo for storage."""
-    if dt is None:
-        return None
-    if dt.tzinfo is None:
-        return dt
-    return dt.astimezone(VIETNAM_TZ).replace(tzinfo=None)
-
-
 def _normalize_task_datetime_fields(task_data: dict):
     for date_field in ("start_date", "end_date", "due_date"):
         value = task_data.get(date_field)
         if isinstance(value, datetime):
-            task_data[date_field] = _to_vietnam_naive(value)
+            task_data[date_field] = to_vietnam_naive(value)
 
 
 def _prepare_task_dates(task_data: dict, start_date: Optional[datetime]):
     """Ensure start/end dates follow the creation rules."""
-    normalized_start = _to_vietnam_naive(start_date)
-    task_data["start_date"] = normalized_start or _now_vietnam()
+    normalized_start = to_vietnam_naive(start_date)
+    task_data["start_date"] = normalized_start or now_vietnam()
     task_data["end_date"] = None
 
 
@@ -55,50 +63,149 @@ def _get_user_or_404(db: Session, username: str) -> User:
 
 
 def _get_project_or_404(db: Session, project_id: int) -> Project:
-    project = (
-        db.query(Project)
-        .options(selectinload(Project.project_members).joinedload(ProjectMember.user))
-        .filter(Project.id == project_id)
-        .first()
-    )
+    project = db.query(Project).filter(Project.id == project_id).first()
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
-def _get_project_membership(project: Project, user_id: int) -> Optional[ProjectMember]:
-    return next((member for member in project.project_members if member.user_id == user_id), None)
+def _ensure_task_found(task: Optional[Task]):
+    """404 for missing tasks and for tasks whose project has been soft-deleted."""
+    if task is None or (task.project_id is not None and task.project is None):
+        raise HTTPException(status_code=404, detail="Task not found")
 
 
-def _project_role_for_user(project: Project, user_id: int) -> Optional[ProjectRole]:
+def _project_role_for_user(db: Session, project: Project, user_id: int) -> Optional[ProjectRole]:
     if project.owner_id == user_id:
         return ProjectRole.OWNER
-    membership = _get_project_membership(project, user_id)
-    if membership is None:
+    role = get_project_role(db, project.id, user_id)
+    if role is None:
         return None
     try:
-        return ProjectRole(membership.role)
+        return ProjectRole(role)
     except ValueError:
         return None
 
 
-def _ensure_project_member(user: User, project: Project):
+def _ensure_project_member(db: Session, user: User, project: Project):
     if user.role == "admin":
         return
-    member_ids = {member.id for member in project.members}
-    member_ids.add(project.owner_id)
-    if user.id not in member_ids:
+    if project.owner_id == user.id:
+        return
+    if get_project_role(db, project.id, user.id) is None:
         raise HTTPException(status_code=403, detail="You are not a member of this project")
 
 
 def _project_ids_for_user(db: Session, user: User) -> List[int]:
     if user.role == "admin":
         return [pid for (pid,) in db.query(Project.id).all()]
-    ids = {project.id for project in user.projects}
+    # Memberships of soft-deleted projects load their project as None.
+    ids = {project.id for project in user.projects if project is not None}
     ids.update(project.id for project in user.owned_projects)
     return list(ids)
 
 
+def _visibility_filter(model, user: User, project_ids: List[int]):
+    """Tasks (or task change rows) in the user's projects plus their own personal tasks."""
+    filters = [and_(model.is_personal.is_(True), model.creator_id == user.id)]
+    if project_ids:
+        filters.append(model.project_id.in_(project_ids))
+    return or_(*filters)
+
+
+def _task_event_page(query, limit: int, cursor: Optional[str]) -> TaskEventPage:
+    """Newest-first keyset page over ``(created_at, id)``."""
+    if cursor:
+        try:
+            data = decode_cursor(cursor)
+            before_at, before_id = datetime.fromisoformat(data["t"]), int(data["i"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(or_(
+            TaskEvent.created_at < before_at,
+            and_(TaskEvent.created_at == before_at, TaskEvent.id < before_id),
+        ))
+    rows = query.order_by(TaskEvent.created_at.desc(), TaskEvent.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor({"t": rows[-1].created_at.isoformat(), "i": rows[-1].id})
+    return TaskEventPage(items=rows, next_cursor=next_cursor)
+
+
+def _build_task_tree(rows, subtree, max_depth: int) -> TaskTreeNode:
+    """Nest ``rows`` (cut at ``max_depth``) with counts taken from the whole, unbounded ``subtree``."""
+    nodes: Dict[int, TaskTreeNode] = {}
+    root: Optional[TaskTreeNode] = None
+    for row in rows:
+        parent = nodes.get(row.parent_task_id)
+        if row.depth > max_depth:
+            if parent is not None:
+                parent.truncated = True
+            continue
+        node = TaskTreeNode(
+            id=row.id,
+            title=row.title,
+            status=row.status,
+            priority=row.priority,
+            assignee_id=row.assignee_id,
+            due_date=row.due_date,
+            parent_task_id=row.parent_task_id,
+            depth=row.depth,
+        )
+        nodes[node.id] = node
+        if root is None:
+            root = node
+        elif parent is not None:
+            parent.children.append(node)
+
+    # Subtree rows arrive ordered by depth, so walking them backwards rolls counts up bottom-first.
+    totals: Dict[int, int] = defaultdict(int)
+    done: Dict[int, int] = defaultdict(int)
+    for row in reversed(subtree):
+        if root is None or row.id == root.id:
+            continue
+        totals[row.parent_task_id] += totals[row.id] + 1
+        done[row.parent_task_id] += done[row.id] + (1 if row.status == TaskStatus.DONE.value else 0)
+    for node in nodes.values():
+        node.total_count = totals[node.id]
+        node.done_count = done[node.id]
+    return root
+
+
+def _notify_task_changes(
+    db: Session,
+    task: Task,
+    actor: User,
+    previous_assignee_id: Optional[int],
+    previous_status: Optional[str],
+):
+    """Record inbox notifications for assignment and status changes, in the caller's transaction."""
+    assignee_id = task.assignee.id if task.assignee is not None else None
+    if assignee_id is not None and assignee_id != previous_assignee_id:
+        notify(
+            db,
+            [assignee_id],
+            "task_assigned",
+            f"You were assigned '{task.title}'",
+            task_id=task.id,
+            project_id=task.project_id,
+            actor_id=actor.id,
+        )
+    status = getattr(task.status, "value", task.status)
+    if previous_status is not None and status != getattr(previous_status, "value", previous_status):
+        notify(
+            db,
+            [assignee_id, task.creator_id],
+            "task_status",
+            f"'{task.title}' moved to {status}",
+            task_id=task.id,
+            project_id=task.project_id,
+            actor_id=actor.id,
+        )
+
+
 def _create_task_record(current_user: User, task: TaskCreate, db: Session) -> Task:
     if task.is_personal:
         if task.project_id is not None:
@@ -113,19 +220,21 @@ def _create_task_record(current_user: User, task: TaskCreate, db: Session) -> Ta
         task_data["assignee_id"] = current_user.id
         task_data["creator_id"] = current_user.id
         task_data["is_personal"] = True
+        related = {"creator": current_user, "assignee": current_user, "project": None}
     else:
         if task.project_id is None:
             raise HTTPException(status_code=400, detail="Project is required for team tasks")
         project = _get_project_or_404(db, task.project_id)
-        _ensure_project_member(current_user, project)
+        _ensure_project_member(db, current_user, project)
         if project.archived:
             raise HTTPException(status_code=400, detail="Archived projects cannot accept new tasks")
 
+        assignee = None
         if task.assignee_id:
             assignee = db.query(User).filter(User.id == task.assignee_id).first()
             if assignee is None:
                 raise HTTPException(status_code=404, detail="Assignee not found")
-            _ensure_project_member(assignee, project)
+            _ensure_project_member(db, assignee, project)
 
         if task.parent_task_id:
             parent_task = db.query(Task).filter(Task.id == task.parent_task_id).first()
@@ -135,13 +244,19 @@ def _create_task_record(current_user: User, task: TaskCreate, db: Session) -> Ta
         task_data = task.dict(exclude_unset=True)
         _normalize_task_datetime_fields(task_data)
         task_data["creator_id"] = current_user.id
+        related = {"creator": current_user, "assignee": assignee, "project": project}
 
     _prepare_task_dates(task_data, task.start_date)
 
-    db_task = Task(**task_data)
+    # Attach the already-loaded rows so serializing the response needs no lazy loads.
+    db_task = Task(**task_data, **related)
     db.add(db_task)
+    db.flush()
+    record_task_change(db, None, task_state(db_task))
+    record_task_event(db, db_task, "created", current_user.id)
+    record_task_changes(db, Task.id == db_task.id)
+    _notify_task_changes(db, db_task, current_user, None, None)
     db.commit()
-    db.refresh(db_task)
     return db_task
 
 
@@ -159,7 +274,7 @@ async def websocket_endpoint(client_id: int, websocket: WebSocket):
 
 
 @router.post("/tasks/", response_model=TaskResponse, status_code=201)
-def create_task(task: TaskCreate, db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+def create_task(task: TaskCreate, db: Session = Depends(get_write_db), username: str = Depends(get_user_by_token)):
     current_user = _get_user_or_404(db, username)
     return _create_task_record(current_user, task, db)
 
@@ -168,7 +283,7 @@ def create_task(task: TaskCreate, db: Session = Depends(get_db), username: str =
 def create_project_task(
     project_id: int,
     task: TaskCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     username: str = Depends(get_user_by_token),
 ):
     current_user = _get_user_or_404(db, username)
@@ -181,7 +296,7 @@ def read_tasks(
     skip: int = 0,
     limit: int = 20,
     project_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     username: str = Depends(get_user_by_token)
 ):
     current_user = _get_user_or_404(db, username)
@@ -205,17 +320,10 @@ def read_tasks(
     # Otherwise, return all tasks visible to the user:
     # 1. Tasks in projects they are a member of
     # 2. Personal tasks they created
-
-    from sqlalchemy import or_, and_
-
-    visibility_filters = [and_(Task.is_personal == True, Task.creator_id == current_user.id)]
-    if project_ids:
-        visibility_filters.append(Task.project_id.in_(project_ids))
-
     tasks = (
         db.query(Task)
         .options(joinedload(Task.project), joinedload(Task.assignee), joinedload(Task.creator))
-        .filter(or_(*visibility_filters))
+        .filter(_visibility_filter(Task, current_user, project_ids))
         .order_by(Task.due_date.is_(None), Task.due_date.asc())
         .offset(skip)
         .limit(limit)
@@ -229,12 +337,12 @@ def read_project_tasks(
     project_id: int,
     status_filter: Optional[TaskStatus] = Query(None, alias="status"),
     assignee_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     username: str = Depends(get_user_by_token),
 ):
     current_user = _get_user_or_404(db, username)
     project = _get_project_or_404(db, project_id)
-    _ensure_project_member(current_user, project)
+    _ensure_project_member(db, current_user, project)
 
     query = (
         db.query(Task)
@@ -246,7 +354,7 @@ def read_project_tasks(
         query = query.filter(Task.status == status_filter)
 
     if assignee_id is not None:
-        membership = next((member for member in project.members if member.id == assignee_id), None)
+        membership = get_project_role(db, project.id, assignee_id)
         if membership is None and assignee_id != project.owner_id:
             raise HTTPException(status_code=400, detail="Assignee is not part of this project")
         query = query.filter(Task.assignee_id == assignee_id)
@@ -264,6 +372,142 @@ def read_project_tasks(
     }
 
 
+def _decode_board_cursor(cursor: Optional[str]):
+    if not cursor:
+        return None
+    try:
+        data = decode_cursor(cursor)
+        due = datetime.fromisoformat(data["d"]) if data["d"] is not None else None
+        return due, int(data["i"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _column_segments(filters: list, column: TaskStatus, after, limit: int) -> list:
+    """Selects for the next ``limit + 1`` ids of one column, after the ``(due_date, id)`` cursor.
+
+    Cards are ordered by due date with undated cards last. Dated and undated
+    cards are separate range scans of ``ix_task_project_status_due``, so
+    neither needs a sort or reads past its limit.
+    """
+    scoped = [*filters, Task.status == column.value]
+    segments = []
+    if after is None or after[0] is not None:
+        dated = [*scoped, Task.due_date.isnot(None)]
+        if after is not None:
+            dated.append(or_(Task.due_date > after[0], and_(Task.due_date == after[0], Task.id > after[1])))
+        segments.append(
+            select(literal(column.value).label("board_status"), Task.id, Task.due_date)
+            .where(*dated)
+            .order_by(Task.due_date, Task.id)
+            .limit(limit + 1)
+        )
+    undated = [*scoped, Task.due_date.is_(None)]
+    if after is not None and after[0] is None:
+        undated.append(Task.id > after[1])
+    segments.append(
+        select(literal(column.value).label("board_status"), Task.id, Task.due_date)
+        .where(*undated)
+        .order_by(Task.id)
+        .limit(limit + 1)
+    )
+    return segments
+
+
+def _board_columns(db: Session, filters: list, cursors: Dict[TaskStatus, object], limit: int) -> List[BoardColumn]:
+    """First page of each requested column: one UNION ALL for the ids, one query for the cards, one for totals."""
+    segments = [
+        segment.subquery()
+        for column, after in cursors.items()
+        for segment in _column_segments(filters, column, after, limit)
+    ]
+    rows = db.execute(union_all(*(select(segment) for segment in segments))).all()
+
+    picked: Dict[str, list] = defaultdict(list)
+    for row in sorted(rows, key=lambda row: (row.due_date is None, row.due_date or CHANGES_EPOCH, row.id)):
+        picked[row.board_status].append(row)
+
+    totals = dict(
+        db.query(Task.status, func.count(Task.id))
+        .filter(*filters, Task.status.in_([column.value for column in cursors]))
+        .group_by(Task.status)
+        .all()
+    )
+    ids = [row.id for column_rows in picked.values() for row in column_rows[:limit]]
+    tasks = {
+        task.id: task
+        for task in db.query(Task)
+        .options(joinedload(Task.project), joinedload(Task.assignee), joinedload(Task.creator))
+        .filter(Task.id.in_(ids))
+    } if ids else {}
+
+    columns = []
+    for column in cursors:
+        column_rows = picked.get(column.value, [])
+        next_cursor = None
+        if len(column_rows) > limit:
+            last = column_rows[limit - 1]
+            next_cursor = encode_cursor({
+                "d": last.due_date.isoformat() if last.due_date is not None else None,
+                "i": last.id,
+            })
+        columns.append(BoardColumn(
+            status=column,
+            total=totals.get(column.value, 0),
+            items=[tasks[row.id] for row in column_rows[:limit] if row.id in tasks],
+            next_cursor=next_cursor,
+        ))
+    return columns
+
+
+def _board_filters(db: Session, project: Project, assignee_id: Optional[int]) -> list:
+    filters = [Task.project_id == project.id]
+    if assignee_id is not None:
+        membership = get_project_role(db, project.id, assignee_id)
+        if membership is None and assignee_id != project.owner_id:
+            raise HTTPException(status_code=400, detail="Assignee is not part of this project")
+        filters.append(Task.assignee_id == assignee_id)
+    return filters
+
+
+@router.get("/projects/{project_id}/board", response_model=ProjectBoard)
+def read_project_board(
+    project_id: int,
+    status_filter: Optional[TaskStatus] = Query(None, alias="status"),
+    assignee_id: Optional[int] = Query(None),
+    limit: int = Query(25, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+    username: str = Depends(get_user_by_token),
+):
+    """First ``limit`` cards of every status column, with per-column totals and cursors."""
+    current_user = _get_user_or_404(db, username)
+    project = _get_project_or_404(db, project_id)
+    _ensure_project_member(db, current_user, project)
+
+    filters = _board_filters(db, project, assignee_id)
+    statuses = (status_filter,) if status_filter else BOARD_COLUMNS
+    return ProjectBoard(columns=_board_columns(db, filters, dict.fromkeys(statuses), limit))
+
+
+@router.get("/projects/{project_id}/board/{column}", response_model=BoardColumn)
+def read_project_board_column(
+    project_id: int,
+    column: TaskStatus,
+    cursor: Optional[str] = Query(None, description="next_cursor of the column; omit for its first page"),
+    assignee_id: Optional[int] = Query(None),
+    limit: int = Query(25, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+    username: str = Depends(get_user_by_token),
+):
+    """Next page of one column as the board is scrolled."""
+    current_user = _get_user_or_404(db, username)
+    project = _get_project_or_404(db, project_id)
+    _ensure_project_member(db, current_user, project)
+
+    filters = _board_filters(db, project, assignee_id)
+    return _board_columns(db, filters, {column: _decode_board_cursor(cursor)}, limit)[0]
+
+
 @router.get("/tasks/personal/", response_model=List[TaskResponse])
 def read_personal_tasks(
     skip: int = 0,
@@ -284,6 +528,93 @@ def read_personal_tasks(
     return tasks
 
 
+def _decode_changes_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        return int(decode_cursor(cursor)["c"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/tasks/changes", response_model=TaskChanges)
+def read_task_changes(
+    since: Optional[str] = Query(None, description="Cursor returned by the previous call; omit for a full sync"),
+    limit: int = Query(200, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
+    """Replay the ``task_change`` outbox after ``since``, newest state per task.
+
+    Upserts are re-read from ``task`` and re-checked against current
+    visibility, so a task the caller can no longer see comes back as a
+    tombstone rather than stale data.
+    """
+    current_user = _get_user_or_404(db, username)
+    after = _decode_changes_cursor(since)
+    ceiling = settled_change_id(db)
+    personal = TaskChange.user_id == current_user.id
+    if current_user.role == "admin":
+        project_ids = None
+        shared = TaskChange.user_id.is_(None)
+    else:
+        project_ids = _project_ids_for_user(db, current_user)
+        shared = and_(TaskChange.user_id.is_(None), _visibility_filter(TaskChange, current_user, project_ids))
+
+    rows = (
+        db.query(TaskChange)
+        .filter(TaskChange.id > after, TaskChange.id <= ceiling, or_(personal, shared))
+        .order_by(TaskChange.id.asc())
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_id = rows[-1].id if has_more else max(after, ceiling)
+
+    latest: Dict[int, TaskChange] = {}
+    removed_projects: List[int] = []
+    for row in rows:
+        if row.task_id is not None:
+            latest.pop(row.task_id, None)
+            latest[row.task_id] = row
+            continue
+        # Anything queued for the project before access was lost is moot.
+        for task_id in [task_id for task_id, entry in latest.items() if entry.project_id == row.project_id]:
+            del latest[task_id]
+        if row.project_id not in removed_projects:
+            removed_projects.append(row.project_id)
+
+    upsert_ids = [task_id for task_id, row in latest.items() if not row.deleted]
+    tasks: Dict[int, Task] = {}
+    if upsert_ids:
+        query = (
+            db.query(Task)
+            .options(joinedload(Task.project), joinedload(Task.assignee), joinedload(Task.creator))
+            .filter(Task.id.in_(upsert_ids))
+        )
+        if project_ids is not None:
+            query = query.filter(_visibility_filter(Task, current_user, project_ids))
+        tasks = {task.id: task for task in query.all()}
+
+    changed = []
+    deleted = []
+    for task_id, row in latest.items():
+        task = tasks.get(task_id)
+        if task is not None:
+            changed.append(TaskResponse.model_validate(task))
+        else:
+            deleted.append(TaskTombstone(task_id=task_id, project_id=row.project_id, deleted_at=row.created_at))
+
+    return TaskChanges(
+        changed=changed,
+        deleted=deleted,
+        removed_projects=removed_projects,
+        cursor=encode_cursor({"c": next_id}),
+        has_more=has_more,
+    )
+
+
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 def read_task(task_id: int, db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
     current_user = _get_user_or_404(db, username)
@@ -293,23 +624,85 @@ def read_task(task_id: int, db: Session = Depends(get_db), username: str = Depen
         .filter(Task.id == task_id)
         .first()
     )
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
+    _ensure_task_found(task)
 
     if task.is_personal:
         if task.creator_id != current_user.id:
             raise HTTPException(status_code=403, detail="You cannot view this personal task")
         return task
 
-    _ensure_project_member(current_user, task.project)
+    _ensure_project_member(db, current_user, task.project)
     return task
 
 
+@router.get("/tasks/{task_id}/history", response_model=TaskEventPage)
+def read_task_history(
+    task_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+    username: str = Depends(get_user_by_token),
+):
+    current_user = _get_user_or_404(db, username)
+    # History stays readable after the task itself is soft-deleted. The project is
+    # lazy-loaded so a soft-deleted project still hides it.
+    task = db.query(Task).execution_options(include_deleted=True).filter(Task.id == task_id).first()
+    _ensure_task_found(task)
+    if task.is_personal:
+        if task.creator_id != current_user.id:
+            raise HTTPException(status_code=403, detail="You cannot view this personal task")
+    else:
+        _ensure_project_member(db, current_user, task.project)
+    return _task_event_page(db.query(TaskEvent).filter(TaskEvent.task_id == task_id), limit, cursor)
+
+
+@router.get("/projects/{project_id}/history", response_model=TaskEventPage)
+def read_project_history(
+    project_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+    username: str = Depends(get_user_by_token),
+):
+    current_user = _get_user_or_404(db, username)
+    project = _get_project_or_404(db, project_id)
+    _ensure_project_member(db, current_user, project)
+    return _task_event_page(db.query(TaskEvent).filter(TaskEvent.project_id == project_id), limit, cursor)
+
+
+@router.get("/tasks/{task_id}/tree", response_model=TaskTreeNode)
+def read_task_tree(
+    task_id: int,
+    max_depth: int = Query(10, ge=0, le=TASK_TREE_MAX_DEPTH),
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
+    current_user = _get_user_or_404(db, username)
+    task = (
+        db.query(Task)
+        .options(joinedload(Task.project))
+        .filter(Task.id == task_id)
+        .first()
+    )
+    _ensure_task_found(task)
+
+    if task.is_personal:
+        if task.creator_id != current_user.id:
+            raise HTTPException(status_code=403, detail="You cannot view this personal task")
+    else:
+        _ensure_project_member(db, current_user, task.project)
+
+    # One extra level is fetched only to flag nodes whose children were cut off.
+    rows = load_task_tree(db, task_id, max_depth + 1)
+    # Counts cover every descendant, including those below max_depth.
+    return _build_task_tree(rows, load_subtree_rows(db, task_id), max_depth)
+
+
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
 def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
     username: str = Depends(get_user_by_token)
 ):
     current_user = _get_user_or_404(db, username)
@@ -319,8 +712,10 @@ def update_task(
         .filter(Task.id == task_id)
         .first()
     )
-    if db_task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
+    _ensure_task_found(db_task)
+    previous_state = task_state(db_task)
+    previous_assignee_id, previous_status = db_task.assignee_id, db_task.status
+    before = task_snapshot(db_task)
 
     raw_update = task_update.dict(exclude_unset=True)
     requested_fields = set(raw_update.keys())
@@ -331,9 +726,9 @@ def update_task(
         if db_task.creator_id != current_user.id:
             raise HTTPException(status_code=403, detail="You cannot modify this personal task")
     else:
-        _ensure_project_member(current_user, db_task.project)
+        _ensure_project_member(db, current_user, db_task.project)
         if current_user.role != "admin":
-            role = _project_role_for_user(db_task.project, current_user.id)
+            role = _project_role_for_user(db, db_task.project, current_user.id)
             is_creator = db_task.creator_id == current_user.id
             is_manager = role in {ProjectRole.MANAGER, ProjectRole.OWNER}
             if not (is_creator or is_manager):
@@ -353,17 +748,17 @@ def update_task(
     completed_flag = update_data.pop("completed", None)
     effective_due_date = update_data.get("due_date")
     if effective_due_date is None:
-        effective_due_date = _to_vietnam_naive(db_task.due_date)
+        effective_due_date = to_vietnam_naive(db_task.due_date)
 
     if "assignee_id" in update_data:
         if update_data["assignee_id"] is None:
-            db_task.assignee_id = None
+            db_task.assignee = None
         else:
             assignee = db.query(User).filter(User.id == update_data["assignee_id"]).first()
             if assignee is None:
                 raise HTTPException(status_code=404, detail="Assignee not found")
-            _ensure_project_member(assignee, db_task.project)
-            db_task.assignee_id = assignee.id
+            _ensure_project_member(db, assignee, db_task.project)
+            db_task.assignee = assignee
         update_data.pop("assignee_id")
 
     if "parent_task_id" in update_data:
@@ -374,6 +769,8 @@ def update_task(
             parent = db.query(Task).filter(Task.id == parent_id).first()
             if parent is None or parent.project_id != db_task.project_id:
                 raise HTTPException(status_code=400, detail="Invalid parent task")
+            if parent_id in {row.id for row in load_subtree_rows(db, db_task.id)}:
+                raise HTTPException(status_code=400, detail="A task cannot be nested under itself or its subtasks")
             db_task.parent_task_id = parent_id
 
     if completed_flag is not None:
@@ -392,7 +789,7 @@ def update_task(
                 raise HTTPException(status_code=400, detail="Invalid status value")
 
         if new_status == TaskStatus.DONE:
-            completed_at = _now_vietnam()
+            completed_at = now_vietnam()
             if effective_due_date and completed_at > effective_due_date:
                 raise HTTPException(status_code=400, detail="Cannot mark task as done after its due date. Adjust the due date first.")
             db_task.end_date = completed_at
@@ -408,33 +805,56 @@ def update_task(
     for key, value in update_data.items():
         setattr(db_task, key, value)
 
-    db_task.updated_at = _now_vietnam()
+    db_task.updated_at = now_vietnam()
+    record_task_change(db, previous_state, task_state(db_task))
+    record_task_event(db, db_task, "updated", current_user.id, before)
+    db.flush()
+    record_task_changes(db, Task.id == db_task.id)
+    _notify_task_changes(db, db_task, current_user, previous_assignee_id, previous_status)
     db.commit()
-    db.refresh(db_task)
     return db_task
 
 
 @router.delete("/tasks/{task_id}", response_model=TaskResponse)
-def delete_task(task_id: int, db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+def delete_task(task_id: int, db: Session = Depends(get_write_db), username: str = Depends(get_user_by_token)):
     current_user = _get_user_or_404(db, username)
     task = (
         db.query(Task)
-        .options(joinedload(Task.project))
+        .options(joinedload(Task.project), joinedload(Task.assignee), joinedload(Task.creator))
         .filter(Task.id == task_id)
         .first()
     )
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
+    _ensure_task_found(task)
 
     if task.is_personal:
         if task.creator_id != current_user.id:
             raise HTTPException(status_code=403, detail="Only the creator can delete this personal task")
     else:
-        _ensure_project_member(current_user, task.project)
+        _ensure_project_member(db, current_user, task.project)
         if current_user.role != "admin":
-            role = _project_role_for_user(task.project, current_user.id)
+            role = _project_role_for_user(db, task.project, current_user.id)
             if role not in {ProjectRole.MANAGER, ProjectRole.OWNER}:
                 raise HTTPException(status_code=403, detail="Only project managers or admins can delete this task")
-    db.delete(task)
+    subtree = load_subtree_rows(db, task.id)
+    subtree_ids = [row.id for row in subtree]
+    record_subtree_removal(db, subtree)
+    record_task_changes(db, Task.id.in_(subtree_ids), deleted=True)
+    deleted_at = now_vietnam()
+    record_bulk_events(db, (
+        {
+            "task_id": row.id,
+            "project_id": row.project_id,
+            "actor_id": current_user.id,
+            "action": "deleted",
+            "changes": {"deleted_at": [None, deleted_at.isoformat()]},
+        }
+        for row in subtree
+    ))
+    db.execute(
+        update(Task)
+        .where(Task.id.in_(subtree_ids))
+        .values(deleted_at=deleted_at, updated_at=deleted_at)
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
     return task
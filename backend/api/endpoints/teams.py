@@ -1,27 +1,59 @@
-from typing import List
+from typing import Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
+from ...core.cache import VersionedCache
+from ...core.config import settings
+from ...core.cursor import decode_cursor, encode_cursor
+from ...core.http_cache import build_payload, cached_json_response
 from ...core.security import get_user_by_token
-from ...db.database import get_db
+from ...core.tracing import TracedRoute
+from ...db.database import get_db, get_read_db
 from ...db.db_structure import Team, User
-from ..models.team import TeamCreate, TeamResponse, TeamSummary, TeamUpdate
+from ...db.replica import is_replica_session
+from ..models.team import (
+    TeamCreate,
+    TeamMemberPage,
+    TeamMembershipResult,
+    TeamResponse,
+    TeamSummary,
+    TeamUpdate,
+)
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
+
+# Bounds the IN list of each membership UPDATE.
+MEMBERSHIP_CHUNK_SIZE = 500
+
+# Serialized team lists; per process, so other workers may serve a stale list for up to TEAM_CACHE_TTL.
+team_list_cache = VersionedCache(maxsize=8, ttl=settings.TEAM_CACHE_TTL)
+
+
+def invalidate_team_lists():
+    team_list_cache.bump()
+
+
+def _team_list_payload(db: Session, model):
+    teams = db.query(Team).order_by(Team.name.asc()).all()
+    return build_payload([model.model_validate(team) for team in teams])
 
 
 @router.get("/teams/public/", response_model=List[TeamSummary])
-def list_public_teams(db: Session = Depends(get_db)):
-    return db.query(Team).order_by(Team.name.asc()).all()
+def list_public_teams(request: Request, db: Session = Depends(get_read_db)):
+    payload = team_list_cache.get_or_load(
+        "public", lambda: _team_list_payload(db, TeamSummary), store=not is_replica_session(db),
+    )
+    return cached_json_response(request, payload, f"public, max-age={settings.TEAM_CACHE_MAX_AGE}")
 
 
 @router.get("/teams/", response_model=List[TeamResponse])
-def list_teams(db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+def list_teams(request: Request, db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
     if username != "admin":
         raise HTTPException(status_code=403, detail="Only admin can view full team details")
-    return db.query(Team).order_by(Team.name.asc()).all()
+    payload = team_list_cache.get_or_load("admin", lambda: _team_list_payload(db, TeamResponse))
+    return cached_json_response(request, payload, "private, no-cache")
 
 
 @router.post("/teams/", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
@@ -46,6 +78,7 @@ def create_team(team: TeamCreate, db: Session = Depends(get_db), username: str =
     )
     db.add(db_team)
     db.commit()
+    invalidate_team_lists()
     db.refresh(db_team)
     return db_team
 
@@ -75,6 +108,7 @@ def update_team(team_id: int, team: TeamUpdate, db: Session = Depends(get_db), u
 
     db.add(db_team)
     db.commit()
+    invalidate_team_lists()
     db.refresh(db_team)
     return db_team
 
@@ -90,24 +124,113 @@ def delete_team(team_id: int, db: Session = Depends(get_db), username: str = Dep
 
     db.delete(db_team)
     db.commit()
+    invalidate_team_lists()
 
 
-@router.post("/teams/{team_id}/members/", status_code=status.HTTP_200_OK)
-def add_team_members(team_id: int, user_ids: List[int], db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
-    if username != "admin":
-        raise HTTPException(status_code=403, detail="Only admin can assign members")
+def _chunks(ids: List[int]) -> Iterator[List[int]]:
+    for start in range(0, len(ids), MEMBERSHIP_CHUNK_SIZE):
+        yield ids[start:start + MEMBERSHIP_CHUNK_SIZE]
 
+
+def _require_team(db: Session, team_id: int) -> Team:
     db_team = db.query(Team).filter(Team.id == team_id).first()
     if db_team is None:
         raise HTTPException(status_code=404, detail="Team not found")
+    return db_team
 
-    # Verify all users exist
-    users = db.query(User).filter(User.id.in_(user_ids)).all()
-    if len(users) != len(user_ids):
+
+@router.get("/teams/{team_id}/members/", response_model=TeamMemberPage)
+def list_team_members(
+    team_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+    username: str = Depends(get_user_by_token),
+):
+    requester = db.query(User).filter(User.username == username).first()
+    if requester is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    if username != "admin" and requester.team_id != team_id:
+        raise HTTPException(status_code=403, detail="Only admin or team members can view this team")
+    _require_team(db, team_id)
+
+    after_id = 0
+    if cursor:
+        try:
+            after_id = int(decode_cursor(cursor)["after"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    total = db.query(func.count(User.id)).filter(User.team_id == team_id).scalar()
+    members = (
+        db.query(User)
+        .filter(User.team_id == team_id, User.id > after_id)
+        .order_by(User.id.asc())
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(members) > limit
+    members = members[:limit]
+    return TeamMemberPage(
+        items=members,
+        total=total,
+        next_cursor=encode_cursor({"after": members[-1].id}) if has_more else None,
+    )
+
+
+@router.post("/teams/{team_id}/members/", response_model=TeamMembershipResult, status_code=status.HTTP_200_OK)
+def add_team_members(team_id: int, user_ids: List[int], db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+    if username != "admin":
+        raise HTTPException(status_code=403, detail="Only admin can assign members")
+
+    db_team = _require_team(db, team_id)
+    user_ids = sorted(set(user_ids))
+
+    # Verify all users exist without loading them into the session
+    found = sum(
+        db.query(func.count(User.id)).filter(User.id.in_(chunk)).scalar()
+        for chunk in _chunks(user_ids)
+    )
+    if found != len(user_ids):
         raise HTTPException(status_code=400, detail="One or more users not found")
 
-    for user in users:
-        user.team_id = team_id
-    
+    updated = 0
+    for chunk in _chunks(user_ids):
+        result = db.execute(
+            update(User)
+            .where(User.id.in_(chunk))
+            .values(team_id=team_id)
+            .execution_options(synchronize_session=False)
+        )
+        updated += result.rowcount
     db.commit()
-    return {"message": f"Added {len(users)} members to team {db_team.name}"}
+    invalidate_team_lists()
+    return TeamMembershipResult(
+        team_id=team_id,
+        updated=updated,
+        message=f"Added {updated} members to team {db_team.name}",
+    )
+
+
+@router.delete("/teams/{team_id}/members/", response_model=TeamMembershipResult)
+def remove_team_members(team_id: int, user_ids: List[int], db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+    if username != "admin":
+        raise HTTPException(status_code=403, detail="Only admin can remove members")
+
+    db_team = _require_team(db, team_id)
+    removed = 0
+    for chunk in _chunks(sorted(set(user_ids))):
+        result = db.execute(
+            update(User)
+            .where(User.team_id == team_id, User.id.in_(chunk))
+            .values(team_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        removed += result.rowcount
+    db.commit()
+    invalidate_team_lists()
+    return TeamMembershipResult(
+        team_id=team_id,
+        updated=removed,
+        message=f"Removed {removed} members from team {db_team.name}",
+    )
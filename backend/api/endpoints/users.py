@@ -3,23 +3,28 @@ from typing import Annotated, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import or_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload
 
 from ..models.user import (
     PasswordChangeRequest,
     UserCreate,
+    UserPage,
     UserProfile,
     UserResponse,
     UserUpdate,
     UserRoleUpdate,
     UserSummary,
 )
+from ...core.cursor import decode_cursor, encode_cursor
 from ...core.security import get_password_hash, create_access_token, get_user_by_token, verify_password
-from ...db.database import get_db
+from ...core.tracing import TracedRoute
+from ...db.access import get_project_role
+from ...db.database import get_db, get_read_db
 from ...db.db_structure import User, Team
+from ...db.user_search import search_users as search_user_directory
 
-router = APIRouter()
+router = APIRouter(route_class=TracedRoute)
 
 
 @router.post("/register/", response_model=UserProfile, status_code=status.HTTP_201_CREATED)
@@ -142,38 +147,86 @@ def change_password(
     return {"detail": "Password updated"}
 
 
-@router.get("/users/", response_model=List[UserResponse])
-def list_users(db: Session = Depends(get_db), username: str = Depends(get_user_by_token)):
+@router.get("/users/", response_model=UserPage)
+def list_users(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    role: Optional[str] = Query(None),
+    team_id: Optional[int] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    last_login_after: Optional[datetime] = Query(None),
+    last_login_before: Optional[datetime] = Query(None),
+    db: Session = Depends(get_db),
+    username: str = Depends(get_user_by_token),
+):
     current_user = db.query(User).filter(User.username == username).first()
     if current_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     if current_user.username != "admin":
         raise HTTPException(status_code=403, detail="Admin privileges required")
-    return db.query(User).all()
+
+    filters = []
+    if role is not None:
+        filters.append(User.role == role)
+    if team_id is not None:
+        filters.append(User.team_id == team_id)
+    if is_active is not None:
+        filters.append(User.is_active.is_(is_active))
+    if last_login_after is not None:
+        filters.append(User.last_login >= last_login_after)
+    if last_login_before is not None:
+        filters.append(User.last_login < last_login_before)
+
+    after_id = 0
+    if cursor:
+        try:
+            after_id = int(decode_cursor(cursor)["after"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # The filtered total rides along as a scalar subquery, so a page is one round trip.
+    total = select(func.count(User.id)).where(*filters).correlate(None).scalar_subquery()
+    rows = (
+        db.query(User, total)
+        .options(joinedload(User.team))
+        .filter(*filters, User.id > after_id)
+        .order_by(User.id.asc())
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if rows:
+        total_count = rows[0][1]
+    else:
+        total_count = db.query(func.count(User.id)).filter(*filters).scalar()
+
+    items = [user for user, _ in rows]
+    return UserPage(
+        items=items,
+        total=total_count,
+        next_cursor=encode_cursor({"after": items[-1].id}) if has_more else None,
+    )
 
 
 @router.get("/users/search/", response_model=List[UserSummary])
 def search_users(
     query: Optional[str] = Query(None, alias="q"),
     limit: int = Query(10, ge=1, le=25),
-    db: Session = Depends(get_db),
+    team_id: Optional[int] = Query(None),
+    project_id: Optional[int] = Query(None),
+    db: Session = Depends(get_read_db),
     username: str = Depends(get_user_by_token),
 ):
     requester = db.query(User).filter(User.username == username).first()
     if requester is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    stmt = db.query(User).filter(User.is_active.is_(True))
-    if query:
-        like_value = f"%{query.lower()}%"
-        stmt = stmt.filter(
-            or_(
-                func.lower(User.username).like(like_value),
-                func.lower(User.display_name).like(like_value),
-            )
-        )
-
-    return stmt.order_by(User.display_name.asc()).limit(limit).all()
+    if project_id is not None and requester.role != "admin":
+        if get_project_role(db, project_id, requester.id) is None:
+            raise HTTPException(status_code=403, detail="You are not a member of this project")
+
+    return search_user_directory(db, query, limit, team_id=team_id, project_id=project_id)
 
 
 @router.patch("/users/{user_id}/role/", response_model=UserResponse)
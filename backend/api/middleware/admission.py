@@ -0,0 +1,85 @@
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .middleware import request_logger
+from ...core.config import settings
+from ...core.security import client_address, request_subject
+from ...core.ratelimit import get_backend, limit_for_group
+
+
+API_PREFIX = "/api/v1"
+AUTH_PATHS = (f"{API_PREFIX}/login", f"{API_PREFIX}/register")
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+_in_flight = 0
+
+
+def route_group(method: str, path: str) -> Optional[str]:
+    if not path.startswith(API_PREFIX):
+        return None
+    if path.startswith(AUTH_PATHS):
+        return "auth"
+    return "read" if method in READ_METHODS else "write"
+
+
+def limit_key(request: Request, group: str) -> str:
+    """JWT subject for authenticated calls, client IP otherwise (always IP for auth routes)."""
+    if group == "auth":
+        return f"{group}:ip:{client_address(request)}"
+    return f"{group}:{request_subject(request)}"
+
+
+async def rate_limit_middleware(request: Request, call_next):
+    group = route_group(request.method, request.url.path)
+    limit = limit_for_group(group) if group else None
+    if limit is None:
+        return await call_next(request)
+
+    key = limit_key(request, group)
+    allowed, retry_after = get_backend().acquire(key, limit)
+    if not allowed:
+        request_logger.warning("Rate limited %s %s | key=%s", request.method, request.url.path, key)
+        return JSONResponse(
+            status_code=429,
+            content={"detail": "Too many requests"},
+            headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+        )
+    return await call_next(request)
+
+
+class ConcurrencyLimitMiddleware:
+    """Shed load with 503 once this worker has MAX_IN_FLIGHT_REQUESTS requests in progress.
+
+    A plain ASGI middleware rather than ``call_next``: a slot is held until the
+    inner app has sent the last byte of the response, not just its headers,
+    so streamed exports and other long bodies count against the cap. Runs on
+    the event loop, so the counter needs no lock. Liveness probes are never
+    shed.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        global _in_flight
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        limit = settings.MAX_IN_FLIGHT_REQUESTS
+        if limit > 0 and _in_flight >= limit and scope["path"] != "/healthz":
+            request_logger.warning("Shedding %s %s | in_flight=%s", scope["method"], scope["path"], _in_flight)
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server busy, retry shortly"},
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+        _in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _in_flight -= 1
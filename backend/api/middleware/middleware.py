@@ -1,6 +1,5 @@
 import json
 import logging
-from pathlib import Path
 from time import perf_counter
 from typing import Optional, Tuple
 from urllib.parse import parse_qs
@@ -9,34 +8,26 @@ from fastapi import Request
 from jose import JWTError, jwt
 
 from ...core.config import settings
+from ...core.log_files import build_file_handler, json_logs_enabled
 
 
 ACTIVITY_HEADER = "| USER            | ACTION                 | TARGET                            | STATUS | CHANGES                          | NOTES"
 SENSITIVE_FIELDS = {"password", "new_password", "current_password", "confirm_password", "hashed_password"}
 
 
-def _ensure_table_header(file_name: str):
-    path = Path(file_name)
-    if not path.exists() or path.stat().st_size == 0:
-        path.write_text(ACTIVITY_HEADER + '\n', encoding='utf-8')
-
-
-def _configure_logger(name: str, file_name: str) -> logging.Logger:
+def _configure_logger(name: str, file_name: str, header: Optional[str] = None) -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
-        handler = logging.FileHandler(file_name)
+        handler = build_file_handler(file_name, header)
         handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
         logger.addHandler(handler)
-        _ensure_table_header(file_name)
     logger.setLevel(logging.INFO)
     logger.propagate = False
     return logger
 
 
 request_logger = _configure_logger('app.request', 'info.log')
-activity_logger = _configure_logger('app.activity', 'activity.log')
+activity_logger = _configure_logger('app.activity', 'activity.log', ACTIVITY_HEADER)
 logger = request_logger
 
 
@@ -57,7 +48,8 @@ async def logging_middleware(request: Request, call_next):
     start_time = perf_counter()
     username = _resolve_username(request.headers.get('Authorization'))
     request_logger.info(
-        "Incoming request: %s %s | user=%s", request.method, request.url.path, username
+        "Incoming request: %s %s | user=%s", request.method, request.url.path, username,
+        extra={'user': username, 'method': request.method, 'route': request.url.path},
     )
 
     body_bytes, parsed_body = await _capture_body(request)
@@ -70,20 +62,14 @@ async def logging_middleware(request: Request, call_next):
     except Exception:
         status_code = status_code or 500
         request_logger.exception(
-            "Unhandled exception during %s %s", request.method, request.url.path
+            "Unhandled exception during %s %s", request.method, request.url.path,
+            extra={'user': username, 'method': request.method, 'route': _route_template(request)},
         )
-        query_string = str(request.query_params) or '-'
-        client_host = request.client.host if request.client else 'unknown'
         action, target, changes = _describe_action(request.method, request.url.path, parsed_body)
-        notes = f"query={query_string} | ip={client_host}"
-        activity_logger.exception(
-            _format_activity_line(username, action, target, status_code, changes, notes)
-        )
+        _log_activity(activity_logger.exception, request, username, action, target, status_code, changes)
         raise
     finally:
         duration_ms = (perf_counter() - start_time) * 1000
-        query_string = str(request.query_params) or '-'
-        client_host = request.client.host if request.client else 'unknown'
         if status_code is not None:
             request_logger.info(
                 "Outgoing response code: %s %s -> %s in %.2fms",
@@ -91,21 +77,58 @@ async def logging_middleware(request: Request, call_next):
                 request.url.path,
                 status_code,
                 duration_ms,
+                extra={
+                    'user': username,
+                    'method': request.method,
+                    'route': _route_template(request),
+                    'status': status_code,
+                    'duration_ms': round(duration_ms, 2),
+                },
             )
             action, target, changes = _describe_action(request.method, request.url.path, parsed_body)
             if action.startswith('viewed'):
                 return response
-            notes = f"query={query_string} | ip={client_host} | duration={duration_ms:.2f}ms"
-            activity_logger.info(
-                _format_activity_line(username, action, target, status_code, changes, notes)
-            )
+            _log_activity(activity_logger.info, request, username, action, target, status_code, changes, duration_ms)
     return response
 
 
-def _ensure_table_header(file_name: str):
-    path = Path(file_name)
-    if not path.exists() or path.stat().st_size == 0:
-        path.write_text(ACTIVITY_HEADER + '\n', encoding='utf-8')
+def _route_template(request: Request) -> str:
+    """The matched route pattern (``/api/v1/tasks/{task_id}``), so JSON logs group by endpoint."""
+    route = request.scope.get('route')
+    return getattr(route, 'path', None) or request.url.path
+
+
+def _log_activity(
+    log,
+    request: Request,
+    username: str,
+    action: str,
+    target: str,
+    status_code: int,
+    changes: str,
+    duration_ms: Optional[float] = None,
+):
+    query_string = str(request.query_params) or '-'
+    client_host = request.client.host if request.client else 'unknown'
+    if json_logs_enabled():
+        # Structured fields only: no fixed-width padding or truncation per record.
+        log('activity', extra={
+            'user': username,
+            'method': request.method,
+            'route': _route_template(request),
+            'action': action,
+            'target': target,
+            'status': status_code,
+            'changes': changes,
+            'query': query_string,
+            'client_ip': client_host,
+            'duration_ms': round(duration_ms, 2) if duration_ms is not None else None,
+        })
+        return
+    notes = f"query={query_string} | ip={client_host}"
+    if duration_ms is not None:
+        notes += f" | duration={duration_ms:.2f}ms"
+    log(_format_activity_line(username, action, target, status_code, changes, notes))
 
 
 def _format_activity_line(user: str, action: str, target: str, status: int, changes: str, notes: str) -> str:
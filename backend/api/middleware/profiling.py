@@ -0,0 +1,56 @@
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from jose import JWTError, jwt
+from starlette.concurrency import run_in_threadpool
+
+from ...core.config import settings
+from ...core.profiling import (
+    PROFILE_HEADER,
+    PROFILE_QUERY_PARAM,
+    REPORT_HEADER,
+    RequestProfile,
+    begin_request_profile,
+    end_request_profile,
+    requested_mode,
+)
+from ...core.request_context import request_id_var
+from ...db.database import SessionLocal
+from ...db.db_structure import User
+
+
+def _caller_is_admin(authorization: Optional[str]) -> bool:
+    """Check the caller's current role in the DB, not the (possibly stale) token claim."""
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return False
+    try:
+        payload = jwt.decode(authorization.split(" ", 1)[1].strip(), settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return False
+    db = SessionLocal()
+    try:
+        user = db.query(User.role, User.is_active).filter(User.username == payload.get("sub")).first()
+    finally:
+        db.close()
+    return user is not None and user.is_active and user.role == "admin"
+
+
+async def profiling_middleware(request: Request, call_next):
+    """Profile this request's endpoint when an admin sends ``X-Profile`` (or ``?profile=``)."""
+    mode = requested_mode(request.headers.get(PROFILE_HEADER), request.query_params.get(PROFILE_QUERY_PARAM))
+    if mode is None or not settings.PROFILE_REQUESTS_ENABLED:
+        return await call_next(request)
+    # The flag is only checked when present, so ordinary requests pay no extra lookup.
+    if not await run_in_threadpool(_caller_is_admin, request.headers.get("Authorization")):
+        return JSONResponse(status_code=403, content={"detail": "Profiling is restricted to admins"})
+
+    profile = RequestProfile(mode, request_id_var.get() or "-", request.method, request.url.path)
+    token = begin_request_profile(profile)
+    try:
+        response = await call_next(request)
+    finally:
+        end_request_profile(token)
+    if profile.started:
+        response.headers[REPORT_HEADER] = await run_in_threadpool(profile.save)
+    return response
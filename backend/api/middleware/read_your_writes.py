@@ -0,0 +1,46 @@
+import time
+
+from fastapi import Request
+
+from ...core.config import settings
+from ...db import replica
+
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+WROTE_AT_COOKIE = "tm_wrote_at"
+WROTE_AT_HEADER = "X-Wrote-At"
+
+
+def _wrote_recently(request: Request) -> bool:
+    raw = request.headers.get(WROTE_AT_HEADER) or request.cookies.get(WROTE_AT_COOKIE)
+    try:
+        wrote_at = float(raw)
+    except (TypeError, ValueError):
+        return False
+    return time.time() - wrote_at < settings.READ_YOUR_WRITES_SECONDS
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """Keep a client's reads off the (possibly lagging) replica for a while after it wrote.
+
+    The "wrote at" marker travels with the client, as a cookie for browsers
+    and as an ``X-Wrote-At`` response header for callers that echo it back,
+    so it holds whichever worker serves the next request. Writes themselves
+    are pinned too, which also keeps their authorization off per-process caches.
+    """
+    token = replica.pin_to_primary(request.method not in READ_METHODS or _wrote_recently(request))
+    try:
+        response = await call_next(request)
+    finally:
+        replica.unpin(token)
+    if request.method not in READ_METHODS and response.status_code < 400 and settings.READ_YOUR_WRITES_SECONDS > 0:
+        wrote_at = f"{time.time():.3f}"
+        response.headers[WROTE_AT_HEADER] = wrote_at
+        response.set_cookie(
+            WROTE_AT_COOKIE,
+            wrote_at,
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
@@ -0,0 +1,31 @@
+from fastapi import Request
+
+from ...core.request_context import request_id_var
+from ...core.tracing import REQUEST_ID_HEADER, finish_trace, resolve_request_id, start_trace
+
+
+async def request_context_middleware(request: Request, call_next):
+    """Bind a request id for logs and SQL comments, echo it back, and trace the request when sampled."""
+    request_id = resolve_request_id(request.headers.get(REQUEST_ID_HEADER))
+    token = request_id_var.set(request_id)
+    trace = start_trace(request_id, f"{request.method} {request.url.path}")
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        response.headers[REQUEST_ID_HEADER] = request_id
+        return response
+    finally:
+        if trace is not None:
+            route = getattr(request.scope.get("route"), "path", None) or request.url.path
+            finish_trace(
+                trace,
+                name=f"{request.method} {route}",
+                **{
+                    "http.method": request.method,
+                    "http.route": route,
+                    "http.status_code": status_code,
+                    "request.id": request_id,
+                },
+            )
+        request_id_var.reset(token)
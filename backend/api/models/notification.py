@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class NotificationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    kind: str
+    message: str
+    task_id: Optional[int] = None
+    project_id: Optional[int] = None
+    created_at: datetime
+    read_at: Optional[datetime] = None
+
+
+class NotificationPage(BaseModel):
+    items: List[NotificationResponse]
+    unread_count: int
+    next_cursor: Optional[str] = None
+
+
+class UnreadCount(BaseModel):
+    unread_count: int
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ProfileReportSummary(BaseModel):
+    id: str
+    request_id: str
+    method: str
+    route: str
+    mode: str
+    duration_ms: float
+    samples: Optional[int] = None
+    created_at: datetime
+
+
+class StackCount(BaseModel):
+    stack: str
+    count: int
+
+
+class RouteProfile(BaseModel):
+    route: str
+    samples: int
+    top_stacks: List[StackCount]
@@ -39,6 +39,11 @@ class ProjectMemberRoleUpdate(BaseModel):
     role: ProjectRole
 
 
+class ProjectMembershipDiff(BaseModel):
+    upsert: List[ProjectMemberAdd] = Field(default_factory=list)
+    remove: List[int] = Field(default_factory=list)
+
+
 class ProjectSlim(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -57,14 +62,28 @@ class ProjectMemberSummary(BaseModel):
     joined_at: datetime
 
 
+class ProjectSummary(ProjectBase):
+    id: int
+    owner: UserSummary
+    archived: bool
+    member_count: int
+    member_preview: List[UserSummary]
+    viewer_role: Optional[ProjectRole] = None
+    task_count: int
+    done_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
 class ProjectResponse(ProjectBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
     owner: UserSummary
     archived: bool
-    memberships: List[ProjectMemberSummary]
+    memberships: Optional[List[ProjectMemberSummary]] = None
     member_count: int
     task_count: int
+    done_count: int
     created_at: datetime
     updated_at: datetime
@@ -1,8 +1,8 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from .project import ProjectSlim
 from .user import UserSummary
@@ -72,3 +72,64 @@ class TaskResponse(BaseModel):
     parent_task_id: Optional[int]
     created_at: datetime
     updated_at: datetime
+
+
+class TaskTreeNode(BaseModel):
+    id: int
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    assignee_id: Optional[int]
+    due_date: Optional[datetime]
+    parent_task_id: Optional[int]
+    depth: int
+    done_count: int = 0
+    total_count: int = 0
+    truncated: bool = False
+    children: List["TaskTreeNode"] = Field(default_factory=list)
+
+
+class TaskTombstone(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    task_id: int
+    project_id: Optional[int]
+    deleted_at: datetime
+
+
+class TaskChanges(BaseModel):
+    changed: List[TaskResponse]
+    deleted: List[TaskTombstone]
+    # Projects the caller lost access to: drop every task held for them,
+    # before applying ``deleted`` and ``changed``.
+    removed_projects: List[int] = []
+    cursor: str
+    has_more: bool
+
+
+class TaskEventResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    task_id: int
+    project_id: Optional[int]
+    actor_id: Optional[int]
+    action: str
+    changes: Dict[str, List[Any]]
+    created_at: datetime
+
+
+class TaskEventPage(BaseModel):
+    items: List[TaskEventResponse]
+    next_cursor: Optional[str] = None
+
+
+class BoardColumn(BaseModel):
+    status: TaskStatus
+    total: int
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = None
+
+
+class ProjectBoard(BaseModel):
+    columns: List[BoardColumn]
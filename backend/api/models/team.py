@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -33,3 +33,26 @@ class TeamSummary(BaseModel):
     id: int
     name: str
     description: Optional[str] = None
+
+
+class TeamMember(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    username: str
+    display_name: Optional[str] = None
+    email: str
+    role: str
+    is_active: bool
+
+
+class TeamMemberPage(BaseModel):
+    items: List[TeamMember]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class TeamMembershipResult(BaseModel):
+    team_id: int
+    updated: int
+    message: str
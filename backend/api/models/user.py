@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, EmailStr, ConfigDict
 
@@ -44,6 +44,12 @@ class UserResponse(BaseModel):
     last_login: Optional[datetime] = None
 
 
+class UserPage(BaseModel):
+    items: List[UserResponse]
+    total: int
+    next_cursor: Optional[str] = None
+
+
 class UserProfile(UserResponse):
     model_config = ConfigDict(from_attributes=True)
 
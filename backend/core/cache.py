@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Optional
+
+
+MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after being set.
+
+    State is per process, so invalidations only reach the local worker; the
+    TTL bounds how long other workers can serve a stale entry.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Bumped by every invalidation; pass it to :meth:`set` to drop loads that raced one."""
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+
+class VersionedCache:
+    """TTL cache whose entries are all dropped at once by :meth:`bump`.
+
+    Keys are stored together with the version current when the load started,
+    so a load racing an invalidation can never be served afterwards.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._version = 0
+        self._lock = Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], store: bool = True) -> Any:
+        """Cached value for ``key``, else ``loader()``; ``store=False`` serves a load without keeping it."""
+        versioned_key = (self._version, key)
+        value = self._cache.get(versioned_key)
+        if value is MISSING:
+            value = loader()
+            if store:
+                self._cache.set(versioned_key, value)
+        return value
+
+    def bump(self):
+        with self._lock:
+            self._version += 1
+        self._cache.clear()
@@ -1,3 +1,6 @@
+import os
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -5,6 +8,9 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
     DATABASE_URL: str
+    DATABASE_READ_URL: Optional[str] = None
+    READ_YOUR_WRITES_SECONDS: int = 5
+    REPLICA_RETRY_SECONDS: int = 30
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
@@ -14,6 +20,80 @@ class Settings(BaseSettings):
     )
     BACKEND_HOST: str = "0.0.0.0"
     BACKEND_PORT: int = 8000
+    AUTO_CREATE_TABLES: bool = False
+    WEB_WORKERS: int = 0
+    DB_POOL_TOTAL: int = 40
+    DB_MAX_OVERFLOW_TOTAL: int = 0
+    DB_READ_POOL_TOTAL: int = 0
+    DB_POOL_TIMEOUT: int = 10
+    MAX_IN_FLIGHT_REQUESTS: int = 200
+    RATE_LIMIT_ENABLED: bool = True
+    TRUSTED_PROXIES: str = ""
+    RATE_LIMIT_AUTH_PER_MINUTE: int = 10
+    RATE_LIMIT_AUTH_BURST: int = 5
+    RATE_LIMIT_READ_PER_MINUTE: int = 600
+    RATE_LIMIT_READ_BURST: int = 100
+    RATE_LIMIT_WRITE_PER_MINUTE: int = 120
+    RATE_LIMIT_WRITE_BURST: int = 30
+    JOB_WORKERS: int = 2
+    JOB_STALE_SECONDS: int = 3600
+    DELETE_CHUNK_SIZE: int = 500
+    PROJECT_ROLE_CACHE_TTL: int = 30
+    PROJECT_ROLE_CACHE_SIZE: int = 10000
+    TEAM_CACHE_TTL: int = 300
+    TEAM_CACHE_MAX_AGE: int = 60
+    SOFT_DELETE_GRACE_HOURS: int = 24
+    PURGE_WINDOW_START_HOUR: int = 1
+    PURGE_WINDOW_END_HOUR: int = 5
+    PURGE_INTERVAL_SECONDS: int = 900
+    TASK_EVENT_RETENTION_DAYS: int = 365
+    TASK_CHANGES_SETTLE_SECONDS: int = 5
+    REMINDER_SCAN_INTERVAL_SECONDS: int = 60
+    REMINDER_LEAD_MINUTES: int = 60
+    OVERDUE_LOOKBACK_HOURS: int = 24
+    REMINDER_BATCH_SIZE: int = 200
+    REMINDER_MAX_BATCHES: int = 10
+    NOTIFICATION_PUSH_INTERVAL_SECONDS: int = 2
+    NOTIFICATION_SETTLE_SECONDS: int = 5
+    LOG_DIR: str = "."
+    LOG_FORMAT: str = "text"
+    LOG_ROTATION: str = "size"
+    LOG_MAX_BYTES: int = 50 * 1024 * 1024
+    LOG_ROTATE_WHEN: str = "midnight"
+    LOG_BACKUP_COUNT: int = 14
+    LOG_COMPRESS: bool = True
+    TRACING_ENABLED: bool = False
+    TRACE_SAMPLE_RATE: float = 1.0
+    TRACE_FILE: str = "traces.jsonl"
+    TRACE_SERVICE_NAME: str = "task-manager-api"
+    SQL_REQUEST_ID_COMMENTS: bool = True
+    PROFILE_REQUESTS_ENABLED: bool = True
+    PROFILE_SAMPLE_INTERVAL_MS: int = 2
+    PROFILE_TOP_FUNCTIONS: int = 60
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_REPORTS: int = 50
+    PROFILE_CONTINUOUS_ENABLED: bool = False
+    PROFILE_CONTINUOUS_INTERVAL_MS: int = 100
+    PROFILE_MAX_STACKS_PER_ROUTE: int = 500
+
+    @property
+    def web_workers(self) -> int:
+        """Configured worker processes, defaulting to one per CPU."""
+        return self.WEB_WORKERS if self.WEB_WORKERS > 0 else (os.cpu_count() or 1)
+
+    @property
+    def db_background_connections(self) -> int:
+        """Primary connections one process's background threads can hold at once.
+
+        Each job worker holds its handler's session plus a short-lived
+        JobProgress session; the scheduler thread runs every periodic callback
+        on one session at a time.
+        """
+        return max(1, self.JOB_WORKERS) * 2 + 1
+
+    def db_pool_share(self, total: int, reserved: int = 0) -> int:
+        """One worker's slice of ``total`` connections, never less than ``reserved`` plus one for requests."""
+        return max(total // self.web_workers, reserved + 1)
 
 
 settings = Settings()
@@ -0,0 +1,33 @@
+import hashlib
+import json
+from typing import Any, NamedTuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+class CachedPayload(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def build_payload(data: Any) -> CachedPayload:
+    """Serialize ``data`` once and derive a strong ETag from the bytes."""
+    body = json.dumps(jsonable_encoder(data), separators=(",", ":")).encode("utf-8")
+    return CachedPayload(body, '"' + hashlib.sha1(body).hexdigest() + '"')
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_json_response(request: Request, payload: CachedPayload, cache_control: str) -> Response:
+    """200 with the cached body, or 304 when the client already holds this ETag."""
+    headers = {"ETag": payload.etag, "Cache-Control": cache_control}
+    if _etag_matches(request, payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
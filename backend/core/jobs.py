@@ -0,0 +1,221 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from .config import settings
+from ..db.database import SessionLocal
+from ..db.db_structure import Job
+
+
+logger = logging.getLogger("app.request")
+
+JobHandler = Callable[[Session, dict, "JobProgress"], Optional[dict]]
+
+_handlers: Dict[str, JobHandler] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+_periodic: Dict[str, Tuple[float, Callable[[], None]]] = {}
+_scheduler_thread: Optional[Thread] = None
+_scheduler_stop = Event()
+
+
+class JobProgress:
+    """Reports handler progress through its own short-lived session."""
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+
+    def update(self, current: int, total: Optional[int] = None):
+        values = {Job.progress_current: current, Job.updated_at: datetime.utcnow()}
+        if total is not None:
+            values[Job.progress_total] = total
+        _update_job(self.job_id, values)
+
+
+def register_job(kind: str):
+    def decorator(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+    return decorator
+
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: dict,
+    user_id: Optional[int] = None,
+    singleton: bool = False,
+) -> Job:
+    """Persist a queued job and hand it to the worker pool.
+
+    The job row is committed on ``db`` before submission so the worker (and
+    any status poller) can see it. With ``singleton`` the row claims the
+    unique ``singleton_key`` for ``kind``, so the commit raises
+    ``IntegrityError`` while another job of that kind is queued or running,
+    in any process.
+    """
+    if kind not in _handlers:
+        raise ValueError(f"No handler registered for job kind '{kind}'")
+    job = Job(
+        kind=kind,
+        status="queued",
+        payload=payload,
+        created_by=user_id,
+        progress_current=0,
+        singleton_key=kind if singleton else None,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    _get_executor().submit(_run_job, job.id)
+    return job
+
+
+def fail_stale_jobs() -> int:
+    """Mark queued or running jobs that stopped reporting as failed; returns how many.
+
+    Jobs live in their process's memory, so a restart drops them while their
+    rows still say ``queued``/``running`` and pollers wait forever. Other
+    workers' live jobs keep bumping ``updated_at``; only rows untouched for
+    ``JOB_STALE_SECONDS`` are taken as abandoned. Their ``singleton_key`` is
+    released too.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+    db = SessionLocal()
+    try:
+        count = db.execute(
+            update(Job)
+            .where(Job.status.in_(("queued", "running")), Job.updated_at < cutoff)
+            .values(
+                status="failed",
+                error=f"Interrupted: no progress for {settings.JOB_STALE_SECONDS}s, its worker probably restarted",
+                finished_at=datetime.utcnow(),
+                singleton_key=None,
+            )
+        ).rowcount
+        db.commit()
+    finally:
+        db.close()
+    if count:
+        logger.warning("Marked %s abandoned background jobs as failed", count)
+    return count
+
+
+def shutdown_jobs(wait: bool = True):
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+def schedule_periodic(name: str, interval_seconds: float, func: Callable[[], None]):
+    """Run ``func`` every ``interval_seconds`` once :func:`start_scheduler` is called.
+
+    Callbacks run on the scheduler thread, so they must stay short and
+    bounded; anything longer should only decide whether to enqueue a job and
+    leave the work to a job handler.
+    """
+    _periodic[name] = (max(1.0, interval_seconds), func)
+
+
+def start_scheduler():
+    global _scheduler_thread
+    if _scheduler_thread is not None:
+        return
+    try:
+        fail_stale_jobs()
+    except Exception:
+        logger.exception("Sweeping abandoned background jobs failed")
+    if not _periodic:
+        return
+    _scheduler_stop.clear()
+    _scheduler_thread = Thread(target=_scheduler_loop, name="job-scheduler", daemon=True)
+    _scheduler_thread.start()
+
+
+def stop_scheduler(timeout: Optional[float] = None):
+    global _scheduler_thread
+    _scheduler_stop.set()
+    if _scheduler_thread is not None:
+        _scheduler_thread.join(timeout)
+        _scheduler_thread = None
+
+
+def _scheduler_loop():
+    next_run: Dict[str, float] = {}
+    while not _scheduler_stop.is_set():
+        now = time.monotonic()
+        for name, (interval, func) in list(_periodic.items()):
+            if now < next_run.get(name, 0.0):
+                continue
+            next_run[name] = now + interval
+            try:
+                func()
+            except Exception:
+                logger.exception("Periodic task %s failed", name)
+        wait = min(next_run.values()) - time.monotonic()
+        _scheduler_stop.wait(max(wait, 0.1))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.JOB_WORKERS),
+                thread_name_prefix="job-worker",
+            )
+        return _executor
+
+
+def _update_job(job_id: int, values: dict):
+    db = SessionLocal()
+    try:
+        db.query(Job).filter(Job.id == job_id).update(values, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _run_job(job_id: int):
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job is None or job.status != "queued":
+            return
+        kind = job.kind
+        handler = _handlers[kind]
+        payload = dict(job.payload or {})
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        db.commit()
+
+        try:
+            result = handler(db, payload, JobProgress(job_id))
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Background job %s (%s) failed", job_id, kind)
+            _update_job(job_id, {
+                Job.status: "failed",
+                Job.error: str(exc)[:500] or exc.__class__.__name__,
+                Job.finished_at: datetime.utcnow(),
+                Job.singleton_key: None,
+            })
+            return
+
+        _update_job(job_id, {
+            Job.status: "succeeded",
+            Job.result: result,
+            Job.finished_at: datetime.utcnow(),
+            Job.singleton_key: None,
+        })
+    finally:
+        db.close()
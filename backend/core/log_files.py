@@ -0,0 +1,141 @@
+import gzip
+import json
+import logging
+import os
+import shutil
+import time
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler, WatchedFileHandler
+from typing import Optional
+
+from .config import settings
+from .request_context import RequestIdFilter
+
+
+# Attributes the middleware passes through ``extra=``; the JSON formatter emits them when present.
+STRUCTURED_FIELDS = (
+    "request_id",
+    "user",
+    "method",
+    "route",
+    "status",
+    "duration_ms",
+    "action",
+    "target",
+    "changes",
+    "client_ip",
+    "query",
+)
+
+
+def _gzip_namer(default_name: str) -> str:
+    return default_name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class _HeaderMixin:
+    """Writes ``header`` at the top of every new (or freshly rotated) file."""
+
+    header: Optional[str] = None
+
+    def _open(self):
+        stream = super()._open()
+        if self.header and stream.tell() == 0:
+            stream.write(self.header + "\n")
+        return stream
+
+
+class SizeRotatingFileHandler(_HeaderMixin, RotatingFileHandler):
+    pass
+
+
+class TimeRotatingFileHandler(_HeaderMixin, TimedRotatingFileHandler):
+    pass
+
+
+class ReopeningFileHandler(_HeaderMixin, WatchedFileHandler):
+    """Never rotates; reopens the path after an external tool (logrotate) has moved it away."""
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message and any structured extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = record.__dict__.get(field)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, separators=(",", ":"))
+
+
+def json_logs_enabled() -> bool:
+    return settings.LOG_FORMAT.lower() == "json"
+
+
+def process_file_name(file_name: str) -> str:
+    """``info.log`` -> ``info.<pid>.log`` when several workers rotate logs themselves.
+
+    A rotating handler renames (and, compressed, deletes) the file it writes,
+    which is only safe when no other process still has it open. With
+    ``LOG_ROTATION=external`` every worker appends to the shared name and
+    logrotate does the renaming. ``WEB_WORKERS=0`` counts as one worker per
+    CPU, as it does under ``uvicorn --workers`` or gunicorn.
+    """
+    if settings.web_workers <= 1 or settings.LOG_ROTATION.lower() == "external":
+        return file_name
+    stem, extension = os.path.splitext(file_name)
+    return f"{stem}.{os.getpid()}{extension}"
+
+
+def build_file_handler(file_name: str, header: Optional[str] = None) -> logging.Handler:
+    """File handler for ``file_name`` under ``LOG_DIR`` with the configured rotation and format.
+
+    Files are opened on the first record, not at import. Rotated files are
+    gzip-compressed when ``LOG_COMPRESS`` is on. ``header`` is only written in
+    text format.
+    """
+    os.makedirs(settings.LOG_DIR, exist_ok=True)
+    path = os.path.join(settings.LOG_DIR, process_file_name(file_name))
+    rotation = settings.LOG_ROTATION.lower()
+    if rotation == "external":
+        handler = ReopeningFileHandler(path, encoding="utf-8", delay=True)
+    elif rotation == "time":
+        handler = TimeRotatingFileHandler(
+            path,
+            when=settings.LOG_ROTATE_WHEN,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+    else:
+        handler = SizeRotatingFileHandler(
+            path,
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+    if settings.LOG_COMPRESS and rotation != "external":
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+    handler.addFilter(RequestIdFilter())
+    if json_logs_enabled():
+        handler.setFormatter(JsonLinesFormatter())
+    else:
+        handler.header = header
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s")
+        )
+    return handler
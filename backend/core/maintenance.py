@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .jobs import JobProgress, enqueue_job, logger, register_job
+from .timezone import now_vietnam
+from ..db.access import invalidate_project_roles
+from ..db.database import SessionLocal
+from ..db.db_structure import Job
+from ..db.purge import deleted_project_ids, purge_deleted_tasks, purge_project
+from ..db.task_events import purge_task_events
+
+
+PURGE_JOB = "maintenance.purge_deleted"
+
+
+@register_job(PURGE_JOB)
+def _purge_deleted_job(db: Session, payload: dict, progress: JobProgress) -> dict:
+    """Hard-delete projects and tasks soft-deleted more than the grace period ago.
+
+    Also drops task history older than ``TASK_EVENT_RETENTION_DAYS``.
+    """
+    cutoff = now_vietnam() - timedelta(hours=settings.SOFT_DELETE_GRACE_HOURS)
+    project_ids = deleted_project_ids(db, cutoff)
+    progress.update(0, len(project_ids))
+    tasks_purged = 0
+    for index, project_id in enumerate(project_ids, start=1):
+        tasks_purged += purge_project(db, project_id)
+        invalidate_project_roles(project_id)
+        progress.update(index)
+    tasks_purged += purge_deleted_tasks(db, cutoff)
+    events_purged = purge_task_events(db, now_vietnam() - timedelta(days=settings.TASK_EVENT_RETENTION_DAYS))
+    return {
+        "projects_purged": len(project_ids),
+        "tasks_purged": tasks_purged,
+        "task_events_purged": events_purged,
+    }
+
+
+def in_purge_window(now: Optional[datetime] = None) -> bool:
+    """Whether ``now`` (Vietnam time) falls in the off-peak purge window.
+
+    The window may wrap midnight, e.g. 22 -> 4.
+    """
+    hour = (now or now_vietnam()).hour
+    start, end = settings.PURGE_WINDOW_START_HOUR, settings.PURGE_WINDOW_END_HOUR
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+def schedule_purge(now: Optional[datetime] = None) -> Optional[int]:
+    """Enqueue a purge job if inside the window and none is already pending.
+
+    Every worker runs this; the unique ``Job.singleton_key`` makes sure only
+    one of them gets a job in.
+
+    Returns the new job id, or ``None`` when nothing was enqueued.
+    """
+    if not in_purge_window(now):
+        return None
+    db = SessionLocal()
+    try:
+        # Release the claim of a job orphaned by a restart so it cannot block purging forever.
+        recent = datetime.utcnow() - timedelta(days=1)
+        db.execute(
+            update(Job)
+            .where(Job.singleton_key == PURGE_JOB, Job.created_at < recent)
+            .values(singleton_key=None)
+        )
+        db.commit()
+        try:
+            job = enqueue_job(db, PURGE_JOB, {}, singleton=True)
+        except IntegrityError:
+            # Another worker's scheduler got there first.
+            db.rollback()
+            return None
+        logger.info("Scheduled purge of soft-deleted rows as job %s", job.id)
+        return job.id
+    finally:
+        db.close()
@@ -0,0 +1,310 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional, Set, Tuple
+
+from .config import settings
+from .timezone import now_vietnam
+
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "profile"
+REPORT_HEADER = "X-Profile-Report"
+SAMPLE = "sample"
+DETERMINISTIC = "deterministic"
+MODES = (SAMPLE, DETERMINISTIC)
+# Stacks beyond PROFILE_MAX_STACKS_PER_ROUTE are counted here so memory stays bounded.
+OTHER_STACK = "[other]"
+MAX_STACK_DEPTH = 64
+_REPORT_ID = re.compile(r"^[0-9]{10}-[0-9a-f]{8}$")
+
+_profile_var: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)
+
+
+def requested_mode(header: Optional[str], query: Optional[str]) -> Optional[str]:
+    """Profiling mode asked for by the ``X-Profile`` header or ``?profile=`` flag, if any."""
+    value = (header or query or "").strip().lower()
+    if not value:
+        return None
+    if value in MODES:
+        return value
+    # "1", "true", ... opt in without choosing a mode.
+    return SAMPLE
+
+
+def _collapse(frame, limit: int = MAX_STACK_DEPTH) -> str:
+    """Folded stack (root first, ``;``-separated) in the format flame graph tools read."""
+    names = []
+    while frame is not None and len(names) < limit:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackCounter:
+    def __init__(self, max_stacks: int):
+        self.max_stacks = max_stacks
+        self.samples = 0
+        self.counts: Counter = Counter()
+
+    def add(self, stack: str):
+        self.samples += 1
+        if stack in self.counts or len(self.counts) < self.max_stacks:
+            self.counts[stack] += 1
+        else:
+            self.counts[OTHER_STACK] += 1
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.counts.most_common())
+
+
+class RequestProfile:
+    """Profile of one request's endpoint, opted into by an admin.
+
+    ``sample`` polls the endpoint thread's stack every ``PROFILE_SAMPLE_INTERVAL_MS``;
+    ``deterministic`` runs cProfile in that thread. Sync endpoints run in the
+    threadpool, so neither mode sees other requests; for the few ``async``
+    endpoints the event loop thread is shared and the report can include
+    unrelated coroutines.
+    """
+
+    def __init__(self, mode: str, request_id: str, method: str, path: str):
+        self.mode = mode
+        self.request_id = request_id
+        self.method = method
+        self.route = path
+        self.started = False
+        self.duration_ms = 0.0
+        self._stacks = StackCounter(settings.PROFILE_MAX_STACKS_PER_ROUTE)
+        self._profiler: Optional[cProfile.Profile] = None
+        self._sampler: Optional[Thread] = None
+        self._stop = Event()
+        self._start = 0.0
+
+    def start(self, route: str):
+        self.route = route
+        self.started = True
+        self._start = time.perf_counter()
+        if self.mode == DETERMINISTIC:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+            return
+        self._sampler = Thread(
+            target=self._sample, args=(threading.get_ident(),), name="request-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self):
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+
+    def _sample(self, thread_id: int):
+        interval = settings.PROFILE_SAMPLE_INTERVAL_MS / 1000
+        while not self._stop.wait(interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                self._stacks.add(_collapse(frame))
+
+    def report_text(self) -> str:
+        if self._profiler is None:
+            return self._stacks.folded()
+        out = io.StringIO()
+        pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(settings.PROFILE_TOP_FUNCTIONS)
+        return out.getvalue()
+
+    def save(self) -> str:
+        """Write the report under ``PROFILE_DIR`` and return its id."""
+        report_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        report = {
+            "id": report_id,
+            "request_id": self.request_id,
+            "method": self.method,
+            "route": self.route,
+            "mode": self.mode,
+            "duration_ms": round(self.duration_ms, 2),
+            "samples": self._stacks.samples if self._profiler is None else None,
+            "created_at": now_vietnam().isoformat(),
+            "report": self.report_text(),
+        }
+        os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+        with open(_report_path(report_id), "w", encoding="utf-8") as handle:
+            json.dump(report, handle)
+        _prune_reports()
+        return report_id
+
+
+def _report_path(report_id: str) -> str:
+    return os.path.join(settings.PROFILE_DIR, f"{report_id}.json")
+
+
+def _report_files() -> List[str]:
+    if not os.path.isdir(settings.PROFILE_DIR):
+        return []
+    entries = [entry for entry in os.scandir(settings.PROFILE_DIR) if entry.name.endswith(".json")]
+    return [entry.name for entry in sorted(entries, key=lambda entry: (entry.stat().st_mtime_ns, entry.name))]
+
+
+def _prune_reports():
+    files = _report_files()
+    for name in files[:max(0, len(files) - settings.PROFILE_MAX_REPORTS)]:
+        try:
+            os.remove(os.path.join(settings.PROFILE_DIR, name))
+        except FileNotFoundError:
+            pass
+
+
+def list_reports() -> List[dict]:
+    """Stored reports, newest first, without the report body."""
+    reports = []
+    for name in reversed(_report_files()):
+        report = load_report(name[:-len(".json")])
+        if report is not None:
+            report.pop("report", None)
+            reports.append(report)
+    return reports
+
+
+def load_report(report_id: str) -> Optional[dict]:
+    if not _REPORT_ID.match(report_id):
+        return None
+    try:
+        with open(_report_path(report_id), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def begin_request_profile(profile: RequestProfile):
+    return _profile_var.set(profile)
+
+
+def end_request_profile(token):
+    _profile_var.reset(token)
+
+
+class ContinuousProfiler:
+    """Low-rate sampler that aggregates endpoint stacks per route for this process.
+
+    ``running`` holds one entry per endpoint call, not per thread: ``async``
+    endpoints all run on the event loop thread, so concurrent calls would
+    otherwise overwrite each other's route.
+    """
+
+    def __init__(self):
+        self.running: Dict[object, Tuple[int, str]] = {}
+        self.routes: Dict[str, StackCounter] = {}
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._loop, name="continuous-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None
+
+    def enter(self, route: str) -> object:
+        """Tag the calling thread as running ``route``; pass the token to :meth:`exit`."""
+        token = object()
+        with self._lock:
+            self.running[token] = (threading.get_ident(), route)
+        return token
+
+    def exit(self, token: object):
+        with self._lock:
+            self.running.pop(token, None)
+
+    def _loop(self):
+        interval = settings.PROFILE_CONTINUOUS_INTERVAL_MS / 1000
+        while not self._stop.wait(interval):
+            with self._lock:
+                threads: Dict[int, Set[str]] = {}
+                for thread_id, route in self.running.values():
+                    threads.setdefault(thread_id, set()).add(route)
+            if not threads:
+                continue
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, routes in threads.items():
+                    # Overlapping async calls of different routes share the loop
+                    # thread; its stack cannot be attributed to either of them.
+                    if len(routes) != 1:
+                        continue
+                    route = next(iter(routes))
+                    frame = frames.get(thread_id)
+                    if frame is None:
+                        continue
+                    counter = self.routes.get(route)
+                    if counter is None:
+                        counter = self.routes[route] = StackCounter(settings.PROFILE_MAX_STACKS_PER_ROUTE)
+                    counter.add(_collapse(frame))
+
+    def snapshot(self, top: int) -> List[dict]:
+        with self._lock:
+            return [
+                {
+                    "route": route,
+                    "samples": counter.samples,
+                    "top_stacks": [
+                        {"stack": stack, "count": count} for stack, count in counter.counts.most_common(top)
+                    ],
+                }
+                for route, counter in sorted(self.routes.items(), key=lambda item: -item[1].samples)
+            ]
+
+    def folded(self, route: str) -> Optional[str]:
+        with self._lock:
+            counter = self.routes.get(route)
+            return counter.folded() if counter is not None else None
+
+
+continuous_profiler = ContinuousProfiler()
+
+
+@contextmanager
+def profile_endpoint(route: str):
+    """Profile the endpoint body when the request opted in, and tag its thread for the continuous sampler."""
+    profile = _profile_var.get()
+    continuous = continuous_profiler.active
+    if profile is None and not continuous:
+        yield
+        return
+    token = continuous_profiler.enter(route) if continuous else None
+    if profile is not None and not profile.started:
+        profile.start(route)
+    else:
+        profile = None
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.stop()
+        if token is not None:
+            continuous_profiler.exit(token)
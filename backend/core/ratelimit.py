@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import NamedTuple, Optional, Tuple
+
+from .config import settings
+
+
+class RateLimit(NamedTuple):
+    per_minute: int
+    burst: int
+
+    @property
+    def per_second(self) -> float:
+        return self.per_minute / 60.0
+
+
+class RateLimitBackend(ABC):
+    """Storage for limiter state.
+
+    Implementations must make :meth:`acquire` atomic per key; a shared store
+    (e.g. Redis) can replace the in-memory default through :func:`set_backend`.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, limit: RateLimit, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take ``cost`` tokens for ``key``; returns ``(allowed, retry_after_seconds)``."""
+
+    def reset(self):
+        """Forget all buckets."""
+
+
+class InMemoryTokenBucket(RateLimitBackend):
+    """Per-process token buckets, evicting the least recently used keys past ``max_keys``."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def acquire(self, key: str, limit: RateLimit, cost: float = 1.0) -> Tuple[bool, float]:
+        now = monotonic()
+        capacity = float(max(limit.burst, 1))
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * limit.per_second)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        if allowed:
+            return True, 0.0
+        return False, (cost - tokens) / limit.per_second
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+_backend: RateLimitBackend = InMemoryTokenBucket()
+
+
+def get_backend() -> RateLimitBackend:
+    return _backend
+
+
+def set_backend(backend: RateLimitBackend):
+    global _backend
+    _backend = backend
+
+
+def limit_for_group(group: str) -> Optional[RateLimit]:
+    """Configured limit for a route group, or ``None`` when the group is unlimited."""
+    per_minute = getattr(settings, f"RATE_LIMIT_{group.upper()}_PER_MINUTE", 0)
+    if not settings.RATE_LIMIT_ENABLED or per_minute <= 0:
+        return None
+    return RateLimit(per_minute, getattr(settings, f"RATE_LIMIT_{group.upper()}_BURST", per_minute))
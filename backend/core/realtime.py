@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from collections import defaultdict
+from concurrent.futures import Future
+from datetime import timedelta
+from functools import partial
+from threading import Lock
+from typing import Dict, List, Optional, Set
+
+from fastapi import WebSocket
+from sqlalchemy.orm import Session
+
+from ..db.database import SessionLocal
+from ..db.db_structure import Notification, User
+from .config import settings
+from .timezone import now_vietnam
+
+
+logger = logging.getLogger("app.request")
+
+
+class NotificationHub:
+    """WebSocket connections of this process, keyed by user id.
+
+    Sockets live on the server's event loop; :meth:`push` may be called from
+    any thread (the scheduler, a job worker) and hands the send to that loop.
+    """
+
+    def __init__(self):
+        self._connections: Dict[int, Set[WebSocket]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = Lock()
+
+    def connect(self, user_id: int, websocket: WebSocket):
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._connections[user_id].add(websocket)
+
+    def disconnect(self, user_id: int, websocket: WebSocket):
+        with self._lock:
+            sockets = self._connections.get(user_id)
+            if sockets is not None:
+                sockets.discard(websocket)
+                if not sockets:
+                    del self._connections[user_id]
+
+    def connected_user_ids(self) -> List[int]:
+        with self._lock:
+            return list(self._connections)
+
+    def push(self, user_id: int, payload: dict) -> int:
+        """Queue ``payload`` to every socket of ``user_id``; returns how many were targeted.
+
+        Sends finish later on the loop. A failed send is logged and drops the
+        socket; the client catches up by reconnecting with ``last_id``.
+        """
+        with self._lock:
+            sockets = list(self._connections.get(user_id, ()))
+            loop = self._loop
+        if loop is None or loop.is_closed():
+            return 0
+        for websocket in sockets:
+            future = asyncio.run_coroutine_threadsafe(websocket.send_json(payload), loop)
+            future.add_done_callback(partial(self._sent, user_id, websocket, payload.get("id")))
+        return len(sockets)
+
+    def _sent(self, user_id: int, websocket: WebSocket, notification_id: Optional[int], future: Future):
+        if future.cancelled():
+            error = "cancelled"
+        elif future.exception() is not None:
+            error = repr(future.exception())
+        else:
+            return
+        logger.warning("Push of notification %s to user %s failed: %s", notification_id, user_id, error)
+        self.disconnect(user_id, websocket)
+
+
+hub = NotificationHub()
+
+# Every notification up to this id has committed and been handled by this process;
+# None before the first pass.
+_settled_up_to: Optional[int] = None
+# Ids above _settled_up_to already pushed; that trailing range is re-scanned each
+# pass because a transaction holding a lower id can still commit into it.
+_pushed_ids: Set[int] = set()
+_delivery_lock = Lock()
+
+
+def notification_payload(notification: Notification, unread_count: Optional[int] = None) -> dict:
+    return {
+        "type": "notification",
+        "id": notification.id,
+        "kind": notification.kind,
+        "task_id": notification.task_id,
+        "project_id": notification.project_id,
+        "message": notification.message,
+        "created_at": notification.created_at.isoformat() if notification.created_at else None,
+        "unread_count": unread_count,
+    }
+
+
+def _settled_notification_id(db: Session) -> int:
+    """Highest notification id old enough that no transaction can still commit a lower one."""
+    cutoff = now_vietnam() - timedelta(seconds=settings.NOTIFICATION_SETTLE_SECONDS)
+    return db.query(Notification.id).filter(Notification.created_at <= cutoff).order_by(
+        Notification.id.desc()
+    ).limit(1).scalar() or 0
+
+
+def deliver_notifications(batch_size: int = 500) -> int:
+    """Push notifications created since the last pass to users connected to this process.
+
+    Every worker runs this against the shared table, so a notification
+    recorded by any worker reaches the user wherever their socket landed.
+    Ids are assigned at INSERT but become visible at COMMIT, so the pass
+    re-scans everything newer than ``NOTIFICATION_SETTLE_SECONDS`` and skips
+    the ids it already pushed. A send that fails is not retried here but
+    replayed when the client reconnects with its last seen id (see
+    :func:`missed_notifications`). Returns how many notifications were pushed.
+    """
+    global _settled_up_to
+    with _delivery_lock:
+        user_ids = hub.connected_user_ids()
+        db = SessionLocal()
+        try:
+            settled = _settled_notification_id(db)
+            if _settled_up_to is None or not user_ids:
+                # Nobody to deliver to yet: skip the backlog, which stays in the table.
+                _settled_up_to = max(settled, _settled_up_to or 0)
+                _pushed_ids.clear()
+                return 0
+            pushed = 0
+            scanned_up_to = _settled_up_to
+            while True:
+                rows = (
+                    db.query(Notification)
+                    .filter(Notification.id > scanned_up_to, Notification.user_id.in_(user_ids))
+                    .order_by(Notification.id.asc())
+                    .limit(batch_size)
+                    .all()
+                )
+                fresh = [notification for notification in rows if notification.id not in _pushed_ids]
+                unread = dict(
+                    db.query(User.id, User.unread_notifications)
+                    .filter(User.id.in_({notification.user_id for notification in fresh}))
+                    .all()
+                ) if fresh else {}
+                for notification in fresh:
+                    _pushed_ids.add(notification.id)
+                    payload = notification_payload(notification, unread.get(notification.user_id))
+                    if hub.push(notification.user_id, payload):
+                        pushed += 1
+                if len(rows) < batch_size:
+                    break
+                scanned_up_to = rows[-1].id
+            _settled_up_to = max(settled, _settled_up_to)
+            _pushed_ids.difference_update([pushed_id for pushed_id in _pushed_ids if pushed_id <= _settled_up_to])
+            return pushed
+        finally:
+            db.close()
+
+
+def missed_notifications(user_id: int, last_id: int, limit: int) -> List[dict]:
+    """Payloads for the newest ``limit`` notifications of ``user_id`` after ``last_id``, oldest first."""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Notification)
+            .filter(Notification.user_id == user_id, Notification.id > last_id)
+            .order_by(Notification.id.desc())
+            .limit(limit)
+            .all()
+        )
+        if not rows:
+            return []
+        unread = db.query(User.unread_notifications).filter(User.id == user_id).scalar()
+        return [notification_payload(notification, unread) for notification in reversed(rows)]
+    finally:
+        db.close()
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .jobs import logger
+from .timezone import now_vietnam
+from ..db.database import SessionLocal
+from ..db.db_structure import Project, Task
+from ..db.notifications import record_notifications
+
+
+DUE_SOON = "due_soon"
+OVERDUE = "overdue"
+
+# Where a scan that hit REMINDER_MAX_BATCHES stopped, so the next run continues instead of restarting.
+_resume_after: Dict[str, Tuple[datetime, int]] = {}
+
+
+def _due_batch(
+    db: Session,
+    lower: datetime,
+    upper: datetime,
+    after: Optional[Tuple[datetime, int]],
+    limit: int,
+) -> list:
+    """Open tasks with ``lower < due_date <= upper``, in ``(due_date, id)`` keyset order.
+
+    The range predicate on ``due_date`` is served by ``ix_task_due_date_status``,
+    so each batch reads only index entries inside the window.
+    """
+    query = (
+        db.query(Task.id, Task.title, Task.due_date, Task.assignee_id, Task.creator_id, Task.project_id)
+        # The soft-delete filter lands in the ON clause, so tasks of deleted projects come back with no project.
+        .outerjoin(Project, Project.id == Task.project_id)
+        .filter(
+            Task.due_date > lower,
+            Task.due_date <= upper,
+            Task.status != "done",
+            or_(Task.project_id.is_(None), Project.id.is_not(None)),
+        )
+    )
+    if after is not None:
+        due_date, task_id = after
+        query = query.filter(or_(Task.due_date > due_date, and_(Task.due_date == due_date, Task.id > task_id)))
+    return query.order_by(Task.due_date.asc(), Task.id.asc()).limit(limit).all()
+
+
+def _notification_rows(kind: str, tasks: list) -> List[dict]:
+    rows = []
+    for task in tasks:
+        user_id = task.assignee_id or task.creator_id
+        due = task.due_date.strftime("%Y-%m-%d %H:%M")
+        message = f"'{task.title}' is due at {due}" if kind == DUE_SOON else f"'{task.title}' was due at {due}"
+        rows.append({
+            "user_id": user_id,
+            "kind": kind,
+            "task_id": task.id,
+            "project_id": task.project_id,
+            "message": message,
+            # Keyed on the due date too, so moving the deadline earns a fresh reminder.
+            "dedupe_key": f"{kind}:{task.id}:{task.due_date:%Y%m%d%H%M}:{user_id}",
+            "created_at": now_vietnam(),
+        })
+    return rows
+
+
+def _scan_window(db: Session, kind: str, lower: datetime, upper: datetime) -> int:
+    created = 0
+    after = _resume_after.pop(kind, None)
+    if after is not None and after[0] <= lower:
+        after = None
+    for _ in range(max(1, settings.REMINDER_MAX_BATCHES)):
+        tasks = _due_batch(db, lower, upper, after, settings.REMINDER_BATCH_SIZE)
+        if not tasks:
+            break
+        created += record_notifications(db, _notification_rows(kind, tasks))
+        db.commit()
+        after = (tasks[-1].due_date, tasks[-1].id)
+        if len(tasks) < settings.REMINDER_BATCH_SIZE:
+            break
+    else:
+        _resume_after[kind] = after
+        logger.warning("Reminder scan for %s stopped at the batch limit; resuming there next run", kind)
+    return created
+
+
+def scan_due_tasks(now: Optional[datetime] = None) -> int:
+    """Record ``due_soon`` and ``overdue`` notifications for open tasks.
+
+    Meant to run every minute on every worker. Only tasks due within
+    ``REMINDER_LEAD_MINUTES`` from now, or overdue by at most
+    ``OVERDUE_LOOKBACK_HOURS``, are read, and each notification is keyed so
+    repeated or concurrent scans record it once. Returns how many were created.
+    """
+    now = now or now_vietnam()
+    db = SessionLocal()
+    try:
+        created = _scan_window(db, DUE_SOON, now, now + timedelta(minutes=settings.REMINDER_LEAD_MINUTES))
+        created += _scan_window(db, OVERDUE, now - timedelta(hours=settings.OVERDUE_LOOKBACK_HOURS), now)
+        if created:
+            logger.info("Recorded %s due-date notifications", created)
+        return created
+    finally:
+        db.close()
@@ -1,24 +1,33 @@
 from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Any, Tuple, Union
 
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, Request, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from ..core.config import settings
+from ..core.tracing import span
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login/")
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@lru_cache(maxsize=None)
+def _pwd_context():
+    # passlib's import and bcrypt backend probe are only paid by the first login/registration.
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password, hashed_password) -> bool:
-    return pwd_context.verify(plain_password + settings.SALT, hashed_password)
+    return _pwd_context().verify(plain_password + settings.SALT, hashed_password)
 
 
 def get_password_hash(password) -> Any:
-    return pwd_context.hash(password + settings.SALT)
+    return _pwd_context().hash(password + settings.SALT)
 
 
 def create_access_token(data: dict) -> str:
@@ -31,7 +40,8 @@ def create_access_token(data: dict) -> str:
 
 def decode_access_token(token: str = Depends(oauth2_scheme)) -> dict:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        with span("auth"):
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload
     except JWTError:
         raise HTTPException(
@@ -43,3 +53,60 @@ def decode_access_token(token: str = Depends(oauth2_scheme)) -> dict:
 
 def get_user_by_token(payload: dict = Depends(decode_access_token)) -> str:
     return payload.get("sub")
+
+
+@lru_cache(maxsize=1)
+def _trusted_networks(raw: str) -> Tuple[Union[IPv4Network, IPv6Network], ...]:
+    return tuple(ip_network(entry.strip(), strict=False) for entry in raw.split(",") if entry.strip())
+
+
+def _is_trusted(address: str) -> bool:
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _trusted_networks(settings.TRUSTED_PROXIES))
+
+
+def client_address(request: Request) -> str:
+    """The caller's IP, looking through ``X-Forwarded-For`` only when the peer is a trusted proxy.
+
+    Hops are read right to left and trusted proxies skipped, so a client
+    cannot pose as another address by prepending hops to the header.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted(peer):
+        return peer
+    hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+def request_subject(request: Request) -> str:
+    """``user:<sub>`` for a valid bearer token, ``ip:<client>`` otherwise.
+
+    Computed once per request and cached on ``request.state``, which every
+    middleware and dependency of the request shares.
+    """
+    cached = getattr(request.state, "subject", None)
+    if cached is not None:
+        return cached
+    subject = None
+    authorization = request.headers.get("Authorization") or ""
+    if authorization.lower().startswith("bearer "):
+        try:
+            payload = jwt.decode(
+                authorization.split(" ", 1)[1].strip(),
+                settings.SECRET_KEY,
+                algorithms=[settings.ALGORITHM],
+            )
+        except JWTError:
+            payload = {}
+        if payload.get("sub"):
+            subject = f"user:{payload['sub']}"
+    if subject is None:
+        subject = f"ip:{client_address(request)}"
+    request.state.subject = subject
+    return subject
@@ -0,0 +1,51 @@
+"""Production entry point: ``python -m backend.core.server`` (or ``python main.py``).
+
+Starts ``WEB_WORKERS`` uvicorn worker processes (one per CPU by default) on
+``BACKEND_HOST``:``BACKEND_PORT``. uvicorn picks uvloop and httptools when
+they are installed and falls back to asyncio/h11 otherwise.
+"""
+import argparse
+import logging
+import os
+
+from .config import settings
+
+
+APP = "main:app"
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the Task Manager API with multiple workers.")
+    parser.add_argument("--host", default=settings.BACKEND_HOST)
+    parser.add_argument("--port", type=int, default=settings.BACKEND_PORT)
+    parser.add_argument("--workers", type=int, default=settings.web_workers, help="Defaults to the CPU count")
+    args = parser.parse_args(argv)
+    workers = max(1, args.workers)
+
+    # Worker processes re-read settings on import; this keeps their pool share in line with --workers.
+    os.environ["WEB_WORKERS"] = str(workers)
+    needed = (settings.db_background_connections + 1) * workers
+    if not settings.DATABASE_URL.startswith("sqlite") and settings.DB_POOL_TOTAL < needed:
+        logger.warning(
+            "DB_POOL_TOTAL=%s cannot cover %s workers: each needs %s connections for jobs and the "
+            "scheduler plus one for requests, so the pools may open up to %s",
+            settings.DB_POOL_TOTAL, workers, settings.db_background_connections, needed,
+        )
+    uvicorn.run(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        proxy_headers=True,
+        timeout_keep_alive=5,
+    )
+
+
+if __name__ == "__main__":
+    main()
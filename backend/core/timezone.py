@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+
+VIETNAM_TZ = timezone(timedelta(hours=7))
+
+
+def now_vietnam() -> datetime:
+    """Return current Vietnam time as a timezone-naive datetime."""
+    return datetime.now(VIETNAM_TZ).replace(tzinfo=None)
+
+
+def to_vietnam_naive(dt: Optional[datetime]) -> Optional[datetime]:
+    """Convert aware datetimes to Vietnam time and drop tzinfo for storage."""
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(VIETNAM_TZ).replace(tzinfo=None)
@@ -0,0 +1,247 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import settings
+from .log_files import build_file_handler
+from .profiling import profile_endpoint
+from .request_context import request_id_var
+
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Incoming ids are echoed into logs and SQL comments, so only accept a safe alphabet.
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+_TRACE_ID = re.compile(r"^[0-9a-f]{32}$")
+# Upper bound on spans kept per request, so an N+1 loop cannot balloon one trace.
+MAX_SPANS_PER_TRACE = 200
+
+_trace_var: ContextVar[Optional["Trace"]] = ContextVar("trace", default=None)
+
+
+def resolve_request_id(incoming: Optional[str]) -> str:
+    if incoming and _VALID_REQUEST_ID.match(incoming):
+        return incoming
+    return uuid.uuid4().hex
+
+
+def _span_id() -> str:
+    return os.urandom(8).hex()
+
+
+class Span:
+    __slots__ = ("name", "span_id", "parent_id", "start_ns", "end_ns", "attributes")
+
+    def __init__(self, name: str, parent_id: Optional[str], start_ns: int, attributes: Optional[dict] = None):
+        self.name = name
+        self.span_id = _span_id()
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.attributes = attributes or {}
+
+    def to_otlp(self, trace_id: str) -> dict:
+        span = {
+            "traceId": trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 2 if self.parent_id is None else 1,  # SERVER for the root, INTERNAL otherwise
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class Trace:
+    """Spans of one request. The root span covers the whole request."""
+
+    def __init__(self, request_id: str, name: str):
+        # Generated request ids double as the trace id so logs and traces join on one value.
+        self.trace_id = request_id if _TRACE_ID.match(request_id) else uuid.uuid4().hex
+        self.root = Span(name, None, time.time_ns())
+        self.spans: List[Span] = []
+        self.dropped = 0
+        # Set by TracedRoute when the endpoint function returns; serialization starts there.
+        self.endpoint_done_ns: Optional[int] = None
+
+    def add(self, span: Span):
+        if len(self.spans) < MAX_SPANS_PER_TRACE:
+            self.spans.append(span)
+        else:
+            self.dropped += 1
+
+    def to_otlp(self) -> dict:
+        if self.dropped:
+            self.root.attributes["trace.dropped_spans"] = self.dropped
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", settings.TRACE_SERVICE_NAME)]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [span.to_otlp(self.trace_id) for span in [self.root, *self.spans]],
+                }],
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def current_trace() -> Optional[Trace]:
+    return _trace_var.get()
+
+
+def start_trace(request_id: str, name: str) -> Optional[Trace]:
+    """Begin a trace for this request if tracing is on and the request is sampled."""
+    if not settings.TRACING_ENABLED or random.random() >= settings.TRACE_SAMPLE_RATE:
+        return None
+    trace = Trace(request_id, name)
+    _trace_var.set(trace)
+    return trace
+
+
+def record_span(name: str, start_ns: int, end_ns: int, **attributes):
+    trace = _trace_var.get()
+    if trace is None:
+        return
+    span = Span(name, trace.root.span_id, start_ns, attributes)
+    span.end_ns = end_ns
+    trace.add(span)
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Time the block as a child of the request's root span; a no-op when the request is not traced."""
+    if _trace_var.get() is None:
+        yield
+        return
+    start_ns = time.time_ns()
+    try:
+        yield
+    finally:
+        record_span(name, start_ns, time.time_ns(), **attributes)
+
+
+_trace_logger = logging.getLogger("app.trace")
+
+
+def _trace_log() -> logging.Logger:
+    if not _trace_logger.handlers:
+        handler = build_file_handler(settings.TRACE_FILE)
+        # Each line is already a complete OTLP/JSON document.
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        _trace_logger.addHandler(handler)
+        _trace_logger.setLevel(logging.INFO)
+        _trace_logger.propagate = False
+    return _trace_logger
+
+
+def finish_trace(trace: Trace, name: Optional[str] = None, **attributes):
+    """Close the root span and append the trace to ``TRACE_FILE`` as one OTLP/JSON line."""
+    _trace_var.set(None)
+    trace.root.end_ns = time.time_ns()
+    if name:
+        trace.root.name = name
+    trace.root.attributes.update(attributes)
+    _trace_log().info(json.dumps(trace.to_otlp(), separators=(",", ":")))
+
+
+class TracedRoute(APIRoute):
+    """Route class that splits handler time into ``endpoint`` and ``serialize`` spans.
+
+    The endpoint body also runs under ``profile_endpoint`` so admins can profile it.
+    """
+
+    def get_route_handler(self) -> Callable:
+        call = self.dependant.call
+        if not getattr(call, "_traced", False):
+            route_name = f"{'|'.join(sorted(self.methods or ()))} {self.path}"
+            self.dependant.call = _traced_endpoint(call, route_name)
+        handler = super().get_route_handler()
+
+        async def traced_handler(request):
+            response = await handler(request)
+            trace = _trace_var.get()
+            if trace is not None and trace.endpoint_done_ns is not None:
+                record_span("serialize", trace.endpoint_done_ns, time.time_ns())
+            return response
+
+        return traced_handler
+
+
+def _traced_endpoint(call: Callable, route_name: str) -> Callable:
+    if asyncio.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def wrapper(*args, **kwargs):
+            start_ns = time.time_ns()
+            try:
+                with profile_endpoint(route_name):
+                    return await call(*args, **kwargs)
+            finally:
+                _endpoint_done(call, start_ns)
+    else:
+        @functools.wraps(call)
+        def wrapper(*args, **kwargs):
+            start_ns = time.time_ns()
+            try:
+                with profile_endpoint(route_name):
+                    return call(*args, **kwargs)
+            finally:
+                _endpoint_done(call, start_ns)
+    wrapper._traced = True
+    return wrapper
+
+
+def _endpoint_done(call: Callable, start_ns: int):
+    trace = _trace_var.get()
+    if trace is None:
+        return
+    trace.endpoint_done_ns = time.time_ns()
+    record_span("endpoint", start_ns, trace.endpoint_done_ns, **{"code.function": call.__name__})
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _trace_var.get() is not None:
+        context._trace_start_ns = time.time_ns()
+    request_id = request_id_var.get()
+    if request_id and settings.SQL_REQUEST_ID_COMMENTS:
+        statement = f"{statement} /* request_id={request_id} */"
+    return statement, parameters
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_ns = getattr(context, "_trace_start_ns", None)
+    if start_ns is not None:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+        record_span("db", start_ns, time.time_ns(), **{"db.operation": operation, "db.system": conn.dialect.name})
+
+
+def instrument_engine(engine: Engine):
+    """Tag SQL with the request id and time each statement as a ``db`` span."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute, retval=True)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from ..core.cache import MISSING, TTLCache
+from ..core.config import settings
+from .db_structure import ProjectMember
+from .replica import is_replica_session, pinned_to_primary
+
+
+# (project_id, user_id) -> project_member.role. Non-members are not cached:
+# invalidation is per process, so a cached None would keep a just-added member
+# locked out on every other worker until the TTL ran out. For the same reason
+# a removed or demoted member can keep a cached role on other workers, so
+# requests pinned to the primary (every write) ignore the cache.
+project_role_cache = TTLCache(
+    maxsize=settings.PROJECT_ROLE_CACHE_SIZE,
+    ttl=settings.PROJECT_ROLE_CACHE_TTL,
+)
+
+
+def get_project_role(db: Session, project_id: int, user_id: int) -> Optional[str]:
+    key = (project_id, user_id)
+    use_cache = not pinned_to_primary()
+    if use_cache:
+        role = project_role_cache.get(key)
+        if role is not MISSING:
+            return role
+    generation = project_role_cache.generation
+    role = (
+        db.query(ProjectMember.role)
+        .filter(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
+        .scalar()
+    )
+    # A lagging replica could cache a revoked role for the full TTL.
+    if use_cache and role is not None and not is_replica_session(db):
+        project_role_cache.set(key, role, generation)
+    return role
+
+
+def invalidate_project_roles(project_id: int, user_id: Optional[int] = None):
+    if user_id is not None:
+        project_role_cache.invalidate((project_id, user_id))
+    else:
+        project_role_cache.invalidate_where(lambda key: key[0] == project_id)
@@ -1,19 +1,59 @@
+from typing import Optional
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from ..core.config import settings
+from ..core.tracing import instrument_engine
+from . import replica
 
 
 DATABASE_URL = settings.DATABASE_URL
 connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+
+
+def pool_options(url: str = DATABASE_URL, total: Optional[int] = None, reserved: int = 0) -> dict:
+    """Per-process pool sizing so all web workers together stay within ``total`` connections.
+
+    ``total`` defaults to DB_POOL_TOTAL. ``reserved`` is what this process's
+    job workers and scheduler can hold on the same pool; the share never drops
+    below that plus one connection for requests.
+    """
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.db_pool_share(total or settings.DB_POOL_TOTAL, reserved),
+        "max_overflow": max(0, settings.DB_MAX_OVERFLOW_TOTAL // settings.web_workers),
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+
+# Background jobs and periodic tasks only ever use the primary.
+primary_pool_options = pool_options(reserved=settings.db_background_connections)
 engine = create_engine(
     DATABASE_URL,
     connect_args=connect_args,
     pool_pre_ping=True,
+    **primary_pool_options,
 )
 
+instrument_engine(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+DATABASE_READ_URL = settings.DATABASE_READ_URL
+read_engine = None
+ReadSessionLocal = None
+if DATABASE_READ_URL:
+    read_engine = create_engine(
+        DATABASE_READ_URL,
+        connect_args={"check_same_thread": False} if DATABASE_READ_URL.startswith("sqlite") else {},
+        pool_pre_ping=True,
+        **pool_options(DATABASE_READ_URL, settings.DB_READ_POOL_TOTAL or settings.DB_POOL_TOTAL),
+    )
+    instrument_engine(read_engine)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
 Base = declarative_base()
 
 # Import models so that Base.metadata is aware of all tables before usage
@@ -26,3 +66,45 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_write_db():
+    """Session for write endpoints that serialize the objects they just committed.
+
+    Keeping attributes loaded across the commit lets the response be built
+    from the session instead of re-selecting the row and its relationships.
+    """
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _open_read_session() -> Session:
+    if ReadSessionLocal is None or not replica.replica_available() or replica.pinned_to_primary():
+        return SessionLocal()
+    db = ReadSessionLocal()
+    db.info[replica.REPLICA_SESSION] = True
+    try:
+        # Check out (and pre-ping) the connection now so an unreachable replica
+        # falls back to the primary instead of failing mid-request.
+        db.connection()
+    except DBAPIError as exc:
+        db.close()
+        replica.mark_replica_down(exc)
+        return SessionLocal()
+    return db
+
+
+def get_read_db():
+    """Session for read-only endpoints, served by DATABASE_READ_URL when configured.
+
+    Falls back to the primary while the replica is marked down and for
+    clients that wrote within READ_YOUR_WRITES_SECONDS.
+    """
+    db = _open_read_session()
+    try:
+        yield db
+    finally:
+        db.close()
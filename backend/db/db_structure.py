@@ -1,12 +1,17 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer, String, event
 from sqlalchemy.ext.associationproxy import association_proxy
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship, with_loader_criteria
 
+from backend.core.timezone import now_vietnam
 from backend.db.database import Base
 
 
+class SoftDeleteMixin:
+    deleted_at = Column(DateTime, nullable=True, index=True)
+
+
 class Team(Base):
     __tablename__ = "team"
 
@@ -43,12 +48,17 @@ class User(Base):
     email = Column(String(100), unique=True, index=True, nullable=False)
     hashed_password = Column(String(128), nullable=False)
     display_name = Column(String(100), nullable=True)
+    # Lowercased copies kept in sync by _normalize_user_search_columns; prefix LIKEs on them use the index.
+    username_lower = Column(String(50), nullable=True, index=True)
+    display_name_lower = Column(String(100), nullable=True, index=True)
     team_id = Column(Integer, ForeignKey("team.id"), nullable=True)
     role = Column(String(20), default="user")
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_login = Column(DateTime, nullable=True)
+    # Denormalized count of notifications with read_at NULL; maintained by backend.db.notifications.
+    unread_notifications = Column(Integer, default=0, nullable=False)
 
     owned_projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan")
     project_memberships = relationship("ProjectMember", back_populates="user", cascade="all, delete-orphan")
@@ -58,7 +68,7 @@ class User(Base):
     team = relationship("Team", back_populates="members")
 
 
-class Project(Base):
+class Project(SoftDeleteMixin, Base):
     __tablename__ = "project"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -74,6 +84,12 @@ class Project(Base):
     project_members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
     members = association_proxy("project_members", "user")
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
+    progress = relationship(
+        "ProgressRollup",
+        primaryjoin="and_(ProgressRollup.scope == 'project', foreign(ProgressRollup.scope_id) == Project.id)",
+        uselist=False,
+        viewonly=True,
+    )
 
     @property
     def memberships(self):
@@ -85,11 +101,21 @@ class Project(Base):
 
     @property
     def task_count(self) -> int:
-        return len(self.tasks)
+        return self.progress.total_count if self.progress else 0
+
+    @property
+    def done_count(self) -> int:
+        return self.progress.done_count if self.progress else 0
 
 
-class Task(Base):
+class Task(SoftDeleteMixin, Base):
     __tablename__ = "task"
+    __table_args__ = (
+        # Range scans by the due-date reminder scanner.
+        Index("ix_task_due_date_status", "due_date", "status"),
+        # Board columns: one ordered range scan per (project, status).
+        Index("ix_task_project_status_due", "project_id", "status", "due_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(100), index=True, nullable=False)
@@ -106,11 +132,132 @@ class Task(Base):
     project_id = Column(Integer, ForeignKey("project.id"), nullable=True)
     is_personal = Column(Boolean, default=False, nullable=False)
     parent_task_id = Column(Integer, ForeignKey("task.id"), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Task timestamps use the same GMT+7 clock as the task endpoints so the changes feed can order by them.
+    created_at = Column(DateTime, default=now_vietnam)
+    updated_at = Column(DateTime, default=now_vietnam, onupdate=now_vietnam, index=True)
 
     creator = relationship("User", back_populates="tasks_created", foreign_keys=[creator_id])
     assignee = relationship("User", back_populates="tasks_assigned", foreign_keys=[assignee_id])
     project = relationship("Project", back_populates="tasks")
     parent_task = relationship("Task", remote_side=[id], back_populates="subtasks")
     subtasks = relationship("Task", back_populates="parent_task", cascade="all, delete-orphan")
+    progress = relationship(
+        "ProgressRollup",
+        primaryjoin="and_(ProgressRollup.scope == 'task', foreign(ProgressRollup.scope_id) == Task.id)",
+        uselist=False,
+        viewonly=True,
+    )
+
+
+class Notification(Base):
+    __tablename__ = "notification"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False, index=True)
+    kind = Column(String(30), nullable=False)
+    task_id = Column(Integer, ForeignKey("task.id", ondelete="CASCADE"), nullable=True)
+    project_id = Column(Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=True)
+    message = Column(String(255), nullable=False)
+    # Set for notifications that must be recorded at most once, e.g. "due_soon:<task>:<due>:<user>".
+    dedupe_key = Column(String(150), unique=True, nullable=True)
+    created_at = Column(DateTime, default=now_vietnam, nullable=False)
+    read_at = Column(DateTime, nullable=True)
+
+
+class TaskEvent(Base):
+    """Structured audit trail of task mutations; outlives the task until the retention purge."""
+
+    __tablename__ = "task_event"
+    __table_args__ = (
+        Index("ix_task_event_task_created", "task_id", "created_at"),
+        Index("ix_task_event_project_created", "project_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, nullable=True)
+    actor_id = Column(Integer, nullable=True)
+    action = Column(String(20), nullable=False)
+    # {field: [old, new]} for every audited field the mutation changed.
+    changes = Column(JSON, nullable=False)
+    # Indexed on its own for the retention purge.
+    created_at = Column(DateTime, default=now_vietnam, nullable=False, index=True)
+
+
+class TaskChange(Base):
+    """Outbox row for the task changes feed, written in the mutating transaction.
+
+    ``user_id`` is NULL for changes everyone who can see the task should get.
+    Rows with a ``user_id`` are only for that user: the tasks of a project they
+    just joined, or (with ``task_id`` NULL) a project they lost access to.
+    """
+    __tablename__ = "task_change"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, nullable=True)
+    project_id = Column(Integer, nullable=True)
+    creator_id = Column(Integer, nullable=True)
+    is_personal = Column(Boolean, default=False, nullable=False)
+    user_id = Column(Integer, nullable=True)
+    deleted = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime, default=now_vietnam, nullable=False, index=True)
+
+
+class ProgressRollup(Base):
+    __tablename__ = "progress_rollup"
+
+    scope = Column(Enum("project", "task", name="progress_scope"), primary_key=True)
+    scope_id = Column(Integer, primary_key=True)
+    total_count = Column(Integer, default=0, nullable=False)
+    done_count = Column(Integer, default=0, nullable=False)
+
+
+class Job(Base):
+    __tablename__ = "job"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False)
+    status = Column(
+        Enum("queued", "running", "succeeded", "failed", name="job_status"),
+        nullable=False,
+        default="queued"
+    )
+    payload = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(String(500), nullable=True)
+    progress_current = Column(Integer, default=0, nullable=False)
+    progress_total = Column(Integer, nullable=True)
+    created_by = Column(Integer, ForeignKey("user.id", ondelete="SET NULL"), nullable=True)
+    # Held by a queued/running job that must not overlap with itself; cleared when it finishes.
+    singleton_key = Column(String(50), nullable=True, unique=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+@event.listens_for(User, "before_insert")
+@event.listens_for(User, "before_update")
+def _normalize_user_search_columns(mapper, connection, user):
+    user.username_lower = user.username.lower() if user.username else None
+    user.display_name_lower = user.display_name.lower() if user.display_name else None
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state):
+    """Hide soft-deleted projects and tasks from every ORM SELECT.
+
+    Purge and sync code opts out with ``execution_options(include_deleted=True)``.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
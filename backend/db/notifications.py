@@ -0,0 +1,99 @@
+from collections import Counter
+from typing import Iterable, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.timezone import now_vietnam
+from .db_structure import Notification, User
+
+
+def _bump_unread(db: Session, per_user: Counter):
+    for user_id, delta in per_user.items():
+        if delta:
+            db.execute(
+                update(User)
+                .where(User.id == user_id)
+                # Keep updated_at: a counter change is not a profile edit.
+                .values(unread_notifications=User.unread_notifications + delta, updated_at=User.updated_at)
+            )
+
+
+def record_notifications(db: Session, rows: List[dict]) -> int:
+    """Insert notification rows, skipping any whose ``dedupe_key`` already exists.
+
+    Safe to call from several workers at once: the unique ``dedupe_key``
+    decides which insert wins and the others are dropped. Each recipient's
+    unread counter is bumped by what was actually inserted, in the same
+    transaction. Returns how many rows this call inserted. The caller commits.
+    """
+    keys = [row["dedupe_key"] for row in rows if row.get("dedupe_key")]
+    existing = set()
+    if keys:
+        existing = {
+            key for (key,) in db.query(Notification.dedupe_key).filter(Notification.dedupe_key.in_(keys))
+        }
+    fresh = [row for row in rows if not row.get("dedupe_key") or row["dedupe_key"] not in existing]
+    if not fresh:
+        return 0
+    try:
+        with db.begin_nested():
+            db.execute(insert(Notification), fresh)
+        inserted = fresh
+    except IntegrityError:
+        # Another worker inserted some of these between the check and the insert; retry row by row.
+        inserted = []
+        for row in fresh:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(Notification), [row])
+                inserted.append(row)
+            except IntegrityError:
+                continue
+    _bump_unread(db, Counter(row["user_id"] for row in inserted))
+    return len(inserted)
+
+
+def notify(
+    db: Session,
+    user_ids: Iterable[Optional[int]],
+    kind: str,
+    message: str,
+    task_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    actor_id: Optional[int] = None,
+) -> int:
+    """Fan one event out to ``user_ids`` inside the caller's transaction.
+
+    The acting user is never notified of their own change.
+    """
+    recipients = {user_id for user_id in user_ids if user_id is not None and user_id != actor_id}
+    created_at = now_vietnam()
+    rows = [
+        {
+            "user_id": user_id,
+            "kind": kind,
+            "task_id": task_id,
+            "project_id": project_id,
+            "message": message[:255],
+            "created_at": created_at,
+        }
+        for user_id in sorted(recipients)
+    ]
+    return record_notifications(db, rows) if rows else 0
+
+
+def mark_read(db: Session, user_id: int, notification_ids: Optional[List[int]] = None) -> int:
+    """Mark the user's unread notifications (all, or just ``notification_ids``) read.
+
+    Returns how many changed state. The caller commits.
+    """
+    statement = update(Notification).where(Notification.user_id == user_id, Notification.read_at.is_(None))
+    if notification_ids is not None:
+        statement = statement.where(Notification.id.in_(notification_ids))
+    changed = db.execute(
+        statement.values(read_at=now_vietnam()).execution_options(synchronize_session=False)
+    ).rowcount
+    _bump_unread(db, Counter({user_id: -changed}))
+    return changed
@@ -0,0 +1,147 @@
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import delete, exists, func, update
+from sqlalchemy.orm import Session, aliased
+
+from ..core.config import settings
+from .db_structure import Project, ProjectMember, Task
+from .rollups import drop_project_rollup, drop_task_rollups
+
+
+ProgressCallback = Callable[[int, int], None]
+
+# Purging has to see the rows the soft-delete criterion hides from everyone else.
+INCLUDE_DELETED = {"include_deleted": True}
+
+
+def _leaf_task_ids(db: Session, criterion, limit: int) -> List[int]:
+    """Ids of matching tasks that no other task points to as its parent."""
+    child = aliased(Task)
+    rows = (
+        db.query(Task.id)
+        .execution_options(**INCLUDE_DELETED)
+        .filter(
+            criterion,
+            ~exists().where(child.parent_task_id == Task.id),
+        )
+        .order_by(Task.id)
+        .limit(limit)
+        .all()
+    )
+    return [task_id for (task_id,) in rows]
+
+
+def _detach_children(db: Session, project_id: int, limit: int) -> int:
+    """Break parent links that keep project tasks from ever becoming leaves.
+
+    Only reachable with inconsistent data (cycles, or subtasks living in
+    another project), but without it the chunk loop would never finish.
+    """
+    parent_ids = [
+        task_id for (task_id,) in (
+            db.query(Task.id)
+            .execution_options(**INCLUDE_DELETED)
+            .filter(Task.project_id == project_id)
+            .order_by(Task.id)
+            .limit(limit)
+            .all()
+        )
+    ]
+    if not parent_ids:
+        return 0
+    result = db.execute(
+        update(Task)
+        .where(Task.parent_task_id.in_(parent_ids))
+        .values(parent_task_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def _delete_task_chunk(db: Session, task_ids: List[int]):
+    db.execute(
+        delete(Task)
+        .where(Task.id.in_(task_ids))
+        .execution_options(synchronize_session=False)
+    )
+    drop_task_rollups(db, task_ids)
+    db.commit()
+
+
+def purge_project(
+    db: Session,
+    project_id: int,
+    chunk_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> int:
+    """Hard-delete a project with bounded, separately committed DELETEs.
+
+    Tasks go first, leaves before their parents, so each chunk only locks
+    ``chunk_size`` rows and never relies on ORM cascades loading the tree.
+    Returns the number of tasks removed.
+    """
+    chunk_size = max(1, chunk_size or settings.DELETE_CHUNK_SIZE)
+    total = (
+        db.query(func.count(Task.id))
+        .execution_options(**INCLUDE_DELETED)
+        .filter(Task.project_id == project_id)
+        .scalar()
+    ) or 0
+    deleted = 0
+    if on_progress:
+        on_progress(deleted, total)
+
+    while True:
+        task_ids = _leaf_task_ids(db, Task.project_id == project_id, chunk_size)
+        if not task_ids:
+            if _detach_children(db, project_id, chunk_size):
+                db.commit()
+                continue
+            break
+        _delete_task_chunk(db, task_ids)
+        deleted += len(task_ids)
+        if on_progress:
+            on_progress(deleted, total)
+
+    db.execute(
+        delete(ProjectMember)
+        .where(ProjectMember.project_id == project_id)
+        .execution_options(synchronize_session=False)
+    )
+    drop_project_rollup(db, project_id)
+    db.execute(
+        delete(Project)
+        .where(Project.id == project_id)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def purge_deleted_tasks(db: Session, deleted_before: datetime, chunk_size: Optional[int] = None) -> int:
+    """Hard-delete tasks soft-deleted before ``deleted_before``, leaves first.
+
+    Tombstones and rollups were handled at soft-delete time. Returns the
+    number of tasks removed.
+    """
+    chunk_size = max(1, chunk_size or settings.DELETE_CHUNK_SIZE)
+    criterion = Task.deleted_at.is_not(None) & (Task.deleted_at <= deleted_before)
+    deleted = 0
+    while True:
+        task_ids = _leaf_task_ids(db, criterion, chunk_size)
+        if not task_ids:
+            return deleted
+        _delete_task_chunk(db, task_ids)
+        deleted += len(task_ids)
+
+
+def deleted_project_ids(db: Session, deleted_before: datetime) -> List[int]:
+    rows = (
+        db.query(Project.id)
+        .execution_options(**INCLUDE_DELETED)
+        .filter(Project.deleted_at.is_not(None), Project.deleted_at <= deleted_before)
+        .order_by(Project.id)
+        .all()
+    )
+    return [project_id for (project_id,) in rows]
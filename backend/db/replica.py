@@ -0,0 +1,65 @@
+"""Bookkeeping for routing reads to the replica.
+
+Replica failures are tracked per process: a worker only knows about the
+ones it observed. Read-your-writes does not depend on the worker: the
+client carries a "wrote at" marker, and the middleware turns it into
+:func:`pinned_to_primary` for the duration of the request.
+"""
+import logging
+from contextvars import ContextVar
+from threading import Lock
+from time import monotonic
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+
+
+logger = logging.getLogger("app.request")
+
+# Session.info flag for sessions bound to the replica.
+REPLICA_SESSION = "replica"
+
+_pinned: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+_down_until = 0.0
+_down_lock = Lock()
+
+
+def pin_to_primary(pinned: bool):
+    """Route this request's reads to the primary when ``pinned``; returns a token for :func:`unpin`."""
+    return _pinned.set(pinned)
+
+
+def unpin(token):
+    _pinned.reset(token)
+
+
+def pinned_to_primary() -> bool:
+    return _pinned.get()
+
+
+def is_replica_session(db: Session) -> bool:
+    """Whether ``db`` may return lagging data, which must not be written to process-wide caches."""
+    return db.info.get(REPLICA_SESSION, False)
+
+
+def replica_available() -> bool:
+    return monotonic() >= _down_until
+
+
+def mark_replica_down(exc: Exception):
+    global _down_until
+    with _down_lock:
+        already_down = not replica_available()
+        _down_until = monotonic() + settings.REPLICA_RETRY_SECONDS
+    if not already_down:
+        logger.warning(
+            "Read replica unavailable (%s); using the primary for %ss",
+            exc.__class__.__name__,
+            settings.REPLICA_RETRY_SECONDS,
+        )
+
+
+def reset():
+    global _down_until
+    _down_until = 0.0
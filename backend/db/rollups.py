@@ -0,0 +1,179 @@
+"""Incrementally maintained done/total counts for projects and parent tasks.
+
+Project rollups count every task in the project; task rollups count the
+direct subtasks of a parent. Writers call :func:`record_task_change` in the
+same transaction as the task mutation. Drift can be repaired with::
+
+    python -m backend.db.rollups [--project-id ID]
+"""
+import argparse
+from collections import defaultdict
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from .db_structure import ProgressRollup, Task
+
+
+DONE_STATUS = "done"
+
+
+class TaskState(NamedTuple):
+    project_id: Optional[int]
+    parent_task_id: Optional[int]
+    done: bool
+
+
+def task_state(task: Task) -> TaskState:
+    return TaskState(task.project_id, task.parent_task_id, task.status == DONE_STATUS)
+
+
+def _bump(db: Session, scope: str, scope_id: int, total_delta: int, done_delta: int):
+    values = {
+        "scope": scope,
+        "scope_id": scope_id,
+        "total_count": max(total_delta, 0),
+        "done_count": max(done_delta, 0),
+    }
+    increments = {
+        "total_count": ProgressRollup.total_count + total_delta,
+        "done_count": ProgressRollup.done_count + done_delta,
+    }
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql_insert(ProgressRollup).values(**values).on_duplicate_key_update(**increments)
+        db.execute(stmt)
+        return
+    if dialect == "sqlite":
+        stmt = sqlite_insert(ProgressRollup).values(**values).on_conflict_do_update(
+            index_elements=[ProgressRollup.scope, ProgressRollup.scope_id],
+            set_=increments,
+        )
+        db.execute(stmt)
+        return
+
+    updated = (
+        db.query(ProgressRollup)
+        .filter(ProgressRollup.scope == scope, ProgressRollup.scope_id == scope_id)
+        .update(increments, synchronize_session=False)
+    )
+    if not updated:
+        db.execute(insert(ProgressRollup).values(**values))
+
+
+def _apply(db: Session, deltas: Dict[Tuple[str, int], Tuple[int, int]]):
+    for (scope, scope_id), (total_delta, done_delta) in deltas.items():
+        if total_delta or done_delta:
+            _bump(db, scope, scope_id, total_delta, done_delta)
+
+
+def _accumulate(deltas, state: Optional[TaskState], sign: int):
+    if state is None:
+        return
+    done = sign if state.done else 0
+    for key in (("project", state.project_id), ("task", state.parent_task_id)):
+        if key[1] is None:
+            continue
+        total_delta, done_delta = deltas[key]
+        deltas[key] = (total_delta + sign, done_delta + done)
+
+
+def record_task_change(db: Session, before: Optional[TaskState], after: Optional[TaskState]):
+    """Apply the rollup deltas for a task moving from ``before`` to ``after``.
+
+    Pass ``before=None`` for creations and ``after=None`` for deletions.
+    """
+    if before == after:
+        return
+    deltas = defaultdict(lambda: (0, 0))
+    _accumulate(deltas, before, -1)
+    _accumulate(deltas, after, 1)
+    _apply(db, deltas)
+
+
+def record_subtree_removal(db: Session, rows: Iterable):
+    """Subtract a removed task subtree from the rollups.
+
+    ``rows`` are ``(id, project_id, parent_task_id, status)`` tuples with the
+    subtree root first. Only the root's parent loses a direct subtask; the
+    removed tasks' own rollup rows are dropped.
+    """
+    rows = list(rows)
+    if not rows:
+        return
+    deltas = defaultdict(lambda: (0, 0))
+    root = rows[0]
+    _accumulate(deltas, TaskState(None, root.parent_task_id, root.status == DONE_STATUS), -1)
+    for row in rows:
+        _accumulate(deltas, TaskState(row.project_id, None, row.status == DONE_STATUS), -1)
+    _apply(db, deltas)
+    drop_task_rollups(db, [row.id for row in rows])
+
+
+def drop_task_rollups(db: Session, task_ids: Iterable[int]):
+    task_ids = list(task_ids)
+    if task_ids:
+        db.execute(
+            delete(ProgressRollup)
+            .where(ProgressRollup.scope == "task", ProgressRollup.scope_id.in_(task_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+
+def drop_project_rollup(db: Session, project_id: int):
+    db.execute(
+        delete(ProgressRollup)
+        .where(ProgressRollup.scope == "project", ProgressRollup.scope_id == project_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _aggregate(scope: str, group_column, project_id: Optional[int]):
+    done = func.sum(case((Task.status == DONE_STATUS, 1), else_=0))
+    stmt = (
+        select(literal(scope), group_column, func.count(Task.id), func.coalesce(done, 0))
+        .where(group_column.is_not(None), Task.deleted_at.is_(None))
+        .group_by(group_column)
+    )
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+    return stmt
+
+
+def rebuild_rollups(db: Session, project_id: Optional[int] = None):
+    """Recompute rollups from the task table, for one project or all of them."""
+    stale = delete(ProgressRollup).execution_options(synchronize_session=False)
+    if project_id is None:
+        db.execute(stale)
+    else:
+        project_task_ids = select(Task.id).where(Task.project_id == project_id)
+        db.execute(stale.where(ProgressRollup.scope == "project", ProgressRollup.scope_id == project_id))
+        db.execute(stale.where(ProgressRollup.scope == "task", ProgressRollup.scope_id.in_(project_task_ids)))
+
+    columns = ["scope", "scope_id", "total_count", "done_count"]
+    db.execute(insert(ProgressRollup).from_select(columns, _aggregate("project", Task.project_id, project_id)))
+    db.execute(insert(ProgressRollup).from_select(columns, _aggregate("task", Task.parent_task_id, project_id)))
+    db.commit()
+
+
+def main(argv=None):
+    from .database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild project/task progress rollups.")
+    parser.add_argument("--project-id", type=int, default=None, help="Only rebuild this project")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        rebuild_rollups(db, args.project_id)
+    finally:
+        db.close()
+    scope = f"project {args.project_id}" if args.project_id is not None else "all projects"
+    print(f"Rebuilt progress rollups for {scope}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from typing import Iterable
+
+from sqlalchemy import Boolean, DateTime, Integer, insert, literal, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.timezone import now_vietnam
+from .db_structure import Task, TaskChange
+
+
+CHANGE_COLUMNS = ["task_id", "project_id", "creator_id", "is_personal", "user_id", "deleted", "created_at"]
+
+
+def record_task_changes(db: Session, *criteria, deleted: bool = False, user_id=None):
+    """Append a feed row for every task matching ``criteria``, in the caller's transaction.
+
+    Deletions must be recorded before the soft-delete UPDATE so the rows are
+    still visible and their project/creator can be copied.
+    """
+    db.execute(
+        insert(TaskChange).from_select(
+            CHANGE_COLUMNS,
+            select(
+                Task.id,
+                Task.project_id,
+                Task.creator_id,
+                Task.is_personal,
+                literal(user_id, Integer),
+                literal(deleted, Boolean),
+                literal(now_vietnam(), DateTime),
+            ).where(*criteria),
+        )
+    )
+
+
+def record_project_access(db: Session, project_id: int, granted: Iterable[int] = (), revoked: Iterable[int] = ()):
+    """Feed rows for users who just joined or left ``project_id``.
+
+    Joining users get the project's current tasks as their own rows; a user
+    who lost access gets one project-level row telling the client to drop
+    everything it holds for the project.
+    """
+    for user_id in granted:
+        record_task_changes(db, Task.project_id == project_id, Task.deleted_at.is_(None), user_id=user_id)
+    revoked = list(revoked)
+    if revoked:
+        created_at = now_vietnam()
+        db.execute(insert(TaskChange), [
+            {"task_id": None, "project_id": project_id, "user_id": user_id, "deleted": True, "created_at": created_at}
+            for user_id in revoked
+        ])
+
+
+def settled_change_id(db: Session) -> int:
+    """Highest change id old enough that no transaction can still commit a lower one.
+
+    Ids are assigned at INSERT but become visible at COMMIT, so a reader that
+    went straight to ``MAX(id)`` could skip a row a slower transaction commits
+    later. Rows older than ``TASK_CHANGES_SETTLE_SECONDS`` are assumed settled.
+    """
+    cutoff = now_vietnam() - timedelta(seconds=settings.TASK_CHANGES_SETTLE_SECONDS)
+    return db.execute(
+        select(TaskChange.id).where(TaskChange.created_at <= cutoff).order_by(TaskChange.id.desc()).limit(1)
+    ).scalar() or 0
+
@@ -0,0 +1,124 @@
+from datetime import date, datetime
+from enum import Enum
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.timezone import now_vietnam
+from .db_structure import Task, TaskEvent
+
+
+TRACKED_FIELDS = (
+    "title",
+    "description",
+    "status",
+    "priority",
+    "start_date",
+    "end_date",
+    "due_date",
+    "tags",
+    "assignee_id",
+    "parent_task_id",
+    "project_id",
+)
+
+
+def _json_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def task_snapshot(task: Task) -> Dict[str, object]:
+    """JSON-ready values of the audited fields, taken before a mutation."""
+    snapshot = {field: _json_value(getattr(task, field)) for field in TRACKED_FIELDS}
+    # A reassigned relationship only reaches assignee_id at flush time.
+    if "assignee" in task.__dict__:
+        snapshot["assignee_id"] = task.assignee.id if task.assignee is not None else None
+    return snapshot
+
+
+def record_task_event(
+    db: Session,
+    task: Task,
+    action: str,
+    actor_id: Optional[int],
+    before: Optional[Dict[str, object]] = None,
+) -> Optional[TaskEvent]:
+    """Add a history row for ``task`` to the caller's transaction.
+
+    ``changes`` maps each field to ``[old, new]``; with no ``before`` snapshot
+    (creation) every non-empty field is recorded with ``old`` as ``None``.
+    Updates that change nothing are not recorded.
+    """
+    after = task_snapshot(task)
+    if before is None:
+        changes = {field: [None, value] for field, value in after.items() if value is not None}
+    else:
+        changes = {field: [before[field], value] for field, value in after.items() if before[field] != value}
+    if not changes and action == "updated":
+        return None
+    event = TaskEvent(
+        task_id=task.id,
+        project_id=task.project_id,
+        actor_id=actor_id,
+        action=action,
+        changes=changes,
+        created_at=now_vietnam(),
+    )
+    db.add(event)
+    return event
+
+
+def record_bulk_events(db: Session, rows: Iterable[dict]):
+    """Insert prepared history rows (``task_id``, ``project_id``, ``actor_id``, ``action``, ``changes``) in one statement."""
+    created_at = now_vietnam()
+    rows = [{**row, "created_at": created_at} for row in rows]
+    if rows:
+        db.execute(insert(TaskEvent), rows)
+
+
+def record_unassignments(db: Session, project_id: int, user_ids: List[int], actor_id: Optional[int]):
+    """History rows for tasks about to lose their assignee because the users left ``project_id``.
+
+    Must run before the UPDATE that clears ``assignee_id``.
+    """
+    if not user_ids:
+        return
+    tasks = db.execute(
+        select(Task.id, Task.assignee_id).where(Task.project_id == project_id, Task.assignee_id.in_(user_ids))
+    ).all()
+    record_bulk_events(db, (
+        {
+            "task_id": task_id,
+            "project_id": project_id,
+            "actor_id": actor_id,
+            "action": "updated",
+            "changes": {"assignee_id": [assignee_id, None]},
+        }
+        for task_id, assignee_id in tasks
+    ))
+
+
+def purge_task_events(db: Session, created_before: datetime, chunk_size: Optional[int] = None) -> int:
+    """Delete history rows created before ``created_before`` in chunks, committing each.
+
+    Returns the number of rows removed.
+    """
+    chunk_size = max(1, chunk_size or settings.DELETE_CHUNK_SIZE)
+    removed = 0
+    while True:
+        expired = [
+            event_id for (event_id,) in db.execute(
+                select(TaskEvent.id).where(TaskEvent.created_at < created_before).limit(chunk_size)
+            )
+        ]
+        if not expired:
+            return removed
+        db.execute(delete(TaskEvent).where(TaskEvent.id.in_(expired)))
+        db.commit()
+        removed += len(expired)
@@ -0,0 +1,69 @@
+from typing import List
+
+from sqlalchemy import literal, select
+from sqlalchemy.orm import Session, aliased
+
+from .db_structure import Task
+
+
+# Bounds recursion on corrupt parent cycles; stays under MySQL's default cte_max_recursion_depth.
+SUBTREE_MAX_DEPTH = 500
+
+
+def task_tree_cte(root_id: int, max_depth: int):
+    """Recursive CTE yielding ``(id, depth)`` for a task and its subtasks."""
+    tree = (
+        select(Task.id.label("id"), literal(0).label("depth"))
+        .where(Task.id == root_id)
+        .cte(name="task_tree", recursive=True)
+    )
+    child = aliased(Task)
+    return tree.union_all(
+        select(child.id, tree.c.depth + 1)
+        .where(child.parent_task_id == tree.c.id, tree.c.depth < max_depth)
+    )
+
+
+def _first_visits(rows) -> List:
+    """Drop repeat visits of a task, which a parent cycle in existing data would produce."""
+    seen = set()
+    unique = []
+    for row in rows:
+        if row.id not in seen:
+            seen.add(row.id)
+            unique.append(row)
+    return unique
+
+
+def load_task_tree(db: Session, root_id: int, max_depth: int) -> List:
+    """Fetch the subtask hierarchy under ``root_id`` in a single query.
+
+    Rows are ordered by depth so parents always precede their children.
+    """
+    tree = task_tree_cte(root_id, max_depth)
+    stmt = (
+        select(
+            Task.id,
+            Task.title,
+            Task.status,
+            Task.priority,
+            Task.assignee_id,
+            Task.due_date,
+            Task.parent_task_id,
+            tree.c.depth,
+        )
+        .join(tree, Task.id == tree.c.id)
+        .order_by(tree.c.depth, Task.id)
+    )
+    return _first_visits(db.execute(stmt).all())
+
+
+def load_subtree_rows(db: Session, root_id: int) -> List:
+    """``(id, project_id, parent_task_id, status)`` for a task and all its subtasks, root first."""
+    tree = task_tree_cte(root_id, SUBTREE_MAX_DEPTH)
+    stmt = (
+        select(Task.id, Task.project_id, Task.parent_task_id, Task.status)
+        .join(tree, Task.id == tree.c.id)
+        .order_by(tree.c.depth, Task.id)
+    )
+    return _first_visits(db.execute(stmt).all())
@@ -0,0 +1,66 @@
+from typing import List, Optional
+
+from sqlalchemy import case, exists, or_
+from sqlalchemy.orm import Session
+
+from .db_structure import ProjectMember, User
+
+
+# Shorter terms only get prefix matches; a substring LIKE cannot use an index
+# and scans every active user.
+SUBSTRING_MIN_LENGTH = 3
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _matching(pattern: str):
+    return or_(
+        User.username_lower.like(pattern, escape="\\"),
+        User.display_name_lower.like(pattern, escape="\\"),
+    )
+
+
+def search_users(
+    db: Session,
+    query: Optional[str],
+    limit: int,
+    team_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+) -> List[User]:
+    """Active users ranked exact match > prefix match, else substring matches.
+
+    Prefix matches come from the indexed lowercase columns. The substring
+    scan is a fallback: it only runs for longer terms that matched no prefix
+    at all. Topping up a partial prefix page would cost a scan on nearly
+    every keystroke of a member picker.
+    """
+    base = db.query(User).filter(User.is_active.is_(True))
+    if team_id is not None:
+        base = base.filter(User.team_id == team_id)
+    if project_id is not None:
+        base = base.filter(
+            exists().where(ProjectMember.project_id == project_id, ProjectMember.user_id == User.id)
+        )
+
+    term = (query or "").strip().lower()
+    if not term:
+        return base.order_by(User.display_name.asc()).limit(limit).all()
+
+    escaped = _escape_like(term)
+    exact = or_(User.username_lower == term, User.display_name_lower == term)
+    matches = (
+        base.filter(_matching(escaped + "%"))
+        .order_by(case((exact, 0), else_=1), User.display_name_lower.asc(), User.username_lower.asc())
+        .limit(limit)
+        .all()
+    )
+    if not matches and len(term) >= SUBSTRING_MIN_LENGTH:
+        matches = (
+            base.filter(_matching("%" + escaped + "%"))
+            .order_by(User.display_name_lower.asc(), User.username_lower.asc())
+            .limit(limit)
+            .all()
+        )
+    return matches
@@ -0,0 +1,68 @@
+"""Measure cold-start cost of the API: module import, startup hooks and first request.
+
+Each run happens in a fresh interpreter so nothing is cached between samples::
+
+    python benchmarks/startup_bench.py --runs 10 --path /
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(main.app)
+client_ready = time.perf_counter()
+with client:
+    started = time.perf_counter()
+    status = client.get(sys.argv[1]).status_code
+    answered = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": (started - client_ready) * 1000,
+    "first_request_ms": (answered - started) * 1000,
+    "status": status,
+}))
+"""
+
+METRICS = ("import_ms", "startup_ms", "first_request_ms")
+
+
+def run_once(path: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, path],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample")
+    parser.add_argument("--path", default="/", help="Route requested once after startup")
+    args = parser.parse_args(argv)
+
+    samples = [run_once(args.path) for _ in range(max(1, args.runs))]
+    statuses = sorted({sample["status"] for sample in samples})
+    print(f"{len(samples)} runs, GET {args.path} -> {statuses}")
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples]
+        print(
+            f"{metric:<17} median {statistics.median(values):8.1f}  "
+            f"min {min(values):8.1f}  max {max(values):8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
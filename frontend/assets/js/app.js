@@ -246,7 +246,7 @@ function isMemberOfProject(project, userId) {
     if (!project || !userId) {
         return false;
     }
-    if (project.owner?.id === userId || project.owner_id === userId) {
+    if (project.owner?.id === userId || project.owner_id === userId || project.viewer_role) {
         return true;
     }
     const memberships = project.memberships || [];
@@ -291,12 +291,22 @@ async function authedFetch(path, options = {}) {
         ...(options.headers || {}),
         "Authorization": `Bearer ${token}`
     };
+    // Echo the last write's marker so the API keeps our reads off a lagging replica.
+    const wroteAt = sessionStorage.getItem("tm_wrote_at");
+    if (wroteAt) {
+        headers["X-Wrote-At"] = wroteAt;
+    }
 
     const response = await fetch(buildApiUrl(path), {
         ...options,
         headers
     });
 
+    const newWroteAt = response.headers.get("X-Wrote-At");
+    if (newWroteAt) {
+        sessionStorage.setItem("tm_wrote_at", newWroteAt);
+    }
+
     if (response.status === 401) {
         logout();
         throw new Error("Session expired");
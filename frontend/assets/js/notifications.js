@@ -155,3 +155,86 @@ const DIALOG_CLOSE_DELAY = 180;
         });
     };
 })();
+
+const NOTIFICATION_POLL_INTERVAL = 60000;
+const NOTIFICATION_RECONNECT_DELAY = 5000;
+const LAST_NOTIFICATION_KEY = "tm_last_notification_id";
+
+(function initializeNotificationInbox() {
+    const token = localStorage.getItem("tm_access_token");
+    if (!token) {
+        return;
+    }
+    let pollTimer = null;
+    let lastSeenId = Number(sessionStorage.getItem(LAST_NOTIFICATION_KEY)) || null;
+
+    function renderUnreadCount(count) {
+        const badge = document.getElementById("notificationBadge");
+        if (!badge || typeof count !== "number") {
+            return;
+        }
+        badge.textContent = count > 99 ? "99+" : String(count);
+        badge.hidden = count === 0;
+    }
+
+    async function pollUnreadCount() {
+        try {
+            const response = await fetch("/api/v1/notifications/unread-count", {
+                headers: { "Authorization": `Bearer ${token}` }
+            });
+            if (response.ok) {
+                renderUnreadCount((await response.json()).unread_count);
+            }
+        } catch (error) {
+            console.error("Unable to load unread notifications", error);
+        }
+    }
+
+    function connectSocket() {
+        if (!("WebSocket" in window)) {
+            return;
+        }
+        const scheme = window.location.protocol === "https:" ? "wss" : "ws";
+        // Resuming from the last seen id replays whatever arrived during a page change or a dropped connection.
+        const resume = lastSeenId ? `&last_id=${lastSeenId}` : "";
+        const socket = new WebSocket(`${scheme}://${window.location.host}/api/v1/ws/notifications?token=${encodeURIComponent(token)}${resume}`);
+        socket.addEventListener("open", () => {
+            clearInterval(pollTimer);
+            pollTimer = null;
+        });
+        socket.addEventListener("message", event => {
+            const payload = JSON.parse(event.data || "{}");
+            if (payload.type !== "notification") {
+                return;
+            }
+            if (lastSeenId && payload.id <= lastSeenId) {
+                return;
+            }
+            lastSeenId = payload.id;
+            sessionStorage.setItem(LAST_NOTIFICATION_KEY, String(lastSeenId));
+            renderUnreadCount(payload.unread_count);
+            window.showToast?.(payload.message, { type: "info" });
+        });
+        socket.addEventListener("close", event => {
+            // Fall back to cheap counter polling while trying to get the socket back.
+            if (!pollTimer) {
+                pollTimer = setInterval(pollUnreadCount, NOTIFICATION_POLL_INTERVAL);
+            }
+            // 1008: the token was rejected, so retrying cannot help.
+            if (event.code !== 1008) {
+                setTimeout(connectSocket, NOTIFICATION_RECONNECT_DELAY);
+            }
+        });
+    }
+
+    function start() {
+        pollUnreadCount();
+        connectSocket();
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", start);
+    } else {
+        start();
+    }
+})();
@@ -3,6 +3,7 @@ const PROJECT_TASK_SECTIONS = [
     { key: "in_progress", label: "In progress", subtitle: "Currently moving" },
     { key: "done", label: "Done", subtitle: "Shipped and validated" }
 ];
+const PROJECT_BOARD_PAGE_SIZE = 25;
 
 const PROJECT_PRIORITY_META = {
     low: {
@@ -108,6 +109,7 @@ function initProjectDetailPage() {
         projectId,
         project: null,
         tasks: { to_do: [], in_progress: [], done: [] },
+        columns: {},
         flatTasks: [],
         currentUser: null,
         projectRole: "member",
@@ -212,7 +214,7 @@ function setProjectLoadingError(message) {
 }
 
 async function fetchProjectOverview() {
-    const response = await authedFetch(`/projects/${projectDetailState.projectId}`);
+    const response = await authedFetch(`/projects/${projectDetailState.projectId}?include=members`);
     const payload = await response.json().catch(() => ({}));
     if (!response.ok) {
         throw new Error(payload?.detail || "Unable to load project");
@@ -233,24 +235,56 @@ async function fetchProjectTasks() {
     if (assigneeFilter?.value) {
         params.set("assignee_id", assigneeFilter.value);
     }
-    const query = params.toString();
-    const response = await authedFetch(`/projects/${projectDetailState.projectId}/tasks${query ? `?${query}` : ""}`);
+    params.set("limit", String(PROJECT_BOARD_PAGE_SIZE));
+    const response = await authedFetch(`/projects/${projectDetailState.projectId}/board?${params.toString()}`);
     const payload = await response.json().catch(() => ({}));
     if (!response.ok) {
         throw new Error(payload?.detail || "Unable to load project tasks");
     }
-    projectDetailState.tasks = normalizeGroupedTasks(payload);
+    projectDetailState.tasks = { to_do: [], in_progress: [], done: [] };
+    projectDetailState.columns = {};
+    (payload.columns || []).forEach(column => {
+        projectDetailState.tasks[column.status] = column.items || [];
+        projectDetailState.columns[column.status] = { total: column.total ?? 0, cursor: column.next_cursor || null };
+    });
     projectDetailState.flatTasks = flattenTaskGroups(projectDetailState.tasks);
     renderTaskBoard();
     maybeOpenPendingTaskEdit();
 }
 
-function normalizeGroupedTasks(data) {
-    return {
-        to_do: Array.isArray(data?.to_do) ? data.to_do : data?.to_do || data?.toDo || [],
-        in_progress: Array.isArray(data?.in_progress) ? data.in_progress : data?.inProgress || [],
-        done: Array.isArray(data?.done) ? data.done : data?.completed || []
-    };
+async function loadMoreProjectTasks(status, button) {
+    const column = projectDetailState.columns[status];
+    if (!column?.cursor) {
+        return;
+    }
+    const params = new URLSearchParams({ cursor: column.cursor, limit: String(PROJECT_BOARD_PAGE_SIZE) });
+    const { assigneeFilter } = projectDetailState.refs;
+    if (assigneeFilter?.value) {
+        params.set("assignee_id", assigneeFilter.value);
+    }
+    if (button) {
+        button.disabled = true;
+    }
+    try {
+        const response = await authedFetch(`/projects/${projectDetailState.projectId}/board/${status}?${params.toString()}`);
+        const payload = await response.json().catch(() => ({}));
+        if (!response.ok) {
+            throw new Error(payload?.detail || "Unable to load more tasks");
+        }
+        projectDetailState.tasks[status] = [...(projectDetailState.tasks[status] || []), ...(payload.items || [])];
+        projectDetailState.columns[status] = { total: payload.total ?? column.total, cursor: payload.next_cursor || null };
+        projectDetailState.flatTasks = flattenTaskGroups(projectDetailState.tasks);
+        renderTaskBoard();
+    } catch (error) {
+        notify?.("Unable to load tasks", { type: "error", description: error.message });
+        if (button) {
+            button.disabled = false;
+        }
+    }
+}
+
+function projectColumnTotal(key) {
+    return projectDetailState.columns[key]?.total ?? (projectDetailState.tasks[key] || []).length;
 }
 
 function flattenTaskGroups(grouped) {
@@ -366,13 +400,13 @@ function populateAssigneeInputs(project) {
 }
 
 function renderTaskBoard() {
-    const totalTasks = projectDetailState.flatTasks.length;
+    const totalTasks = PROJECT_TASK_SECTIONS.reduce((sum, section) => sum + projectColumnTotal(section.key), 0);
     const { board, boardMessage, overviewStats } = projectDetailState.refs;
     if (!board) {
         return;
     }
 
-    if (!totalTasks) {
+    if (!projectDetailState.flatTasks.length) {
         board.innerHTML = "";
         toggleElement(boardMessage, false, "No tasks yet. Add one to start the flow.");
     } else {
@@ -384,8 +418,8 @@ function renderTaskBoard() {
     }
 
     overviewStats.total.textContent = String(totalTasks);
-    overviewStats.progress.textContent = String(projectDetailState.tasks.in_progress.length);
-    overviewStats.done.textContent = String(projectDetailState.tasks.done.length);
+    overviewStats.progress.textContent = String(projectColumnTotal("in_progress"));
+    overviewStats.done.textContent = String(projectColumnTotal("done"));
     updateProjectOverviewChart();
 }
 
@@ -393,6 +427,9 @@ function renderProjectTaskSection(section, tasks) {
     const content = tasks.length
         ? tasks.map(renderTaskCard).join("")
         : `<p class="personal-section__empty">No ${section.label.toLowerCase()} tasks yet.</p>`;
+    const loadMore = projectDetailState.columns[section.key]?.cursor
+        ? `<button class="ghost-button personal-section__more" type="button" data-load-more="${section.key}">Load more</button>`
+        : "";
 
     return `
         <article class="personal-section">
@@ -401,9 +438,10 @@ function renderProjectTaskSection(section, tasks) {
                     <p>${section.subtitle}</p>
                     <h3>${section.label}</h3>
                 </div>
-                <span class="personal-section__count">${tasks.length}</span>
+                <span class="personal-section__count">${projectColumnTotal(section.key)}</span>
             </header>
             <div class="personal-section__list task-dropzone" data-task-dropzone="${section.key}">${content}</div>
+            ${loadMore}
         </article>
     `;
 }
@@ -431,11 +469,10 @@ function updateProjectOverviewChart() {
         return;
     }
 
-    const buckets = projectDetailState?.tasks || { to_do: [], in_progress: [], done: [] };
     const dataset = [
-        buckets.to_do?.length ?? 0,
-        buckets.in_progress?.length ?? 0,
-        buckets.done?.length ?? 0
+        projectColumnTotal("to_do"),
+        projectColumnTotal("in_progress"),
+        projectColumnTotal("done")
     ];
     const total = dataset.reduce((sum, value) => sum + value, 0);
 
@@ -650,6 +687,11 @@ function setupTaskBoardInteractions() {
 }
 
 function handleTaskBoardClick(event) {
+    const loadMoreButton = event.target.closest("[data-load-more]");
+    if (loadMoreButton) {
+        loadMoreProjectTasks(loadMoreButton.dataset.loadMore, loadMoreButton);
+        return;
+    }
     const deleteButton = event.target.closest("[data-delete-task]");
     if (deleteButton) {
         const taskId = Number(deleteButton.dataset.deleteTask);
@@ -1524,6 +1566,24 @@ function findProjectTask(taskId) {
     return projectDetailState.flatTasks.find(task => task.id === taskId);
 }
 
+// The board only holds the first page of each column, so a task can exist without being loaded.
+async function loadProjectTask(taskId) {
+    const loaded = findProjectTask(taskId);
+    if (loaded) {
+        return loaded;
+    }
+    const response = await authedFetch(`/tasks/${taskId}`);
+    const payload = await response.json().catch(() => ({}));
+    if (!response.ok) {
+        throw new Error(payload?.detail || "Unable to load task");
+    }
+    const projectId = payload.project?.id ?? payload.project_id;
+    if (Number(projectId) !== Number(projectDetailState.projectId)) {
+        throw new Error("This task belongs to another project");
+    }
+    return payload;
+}
+
 function canEditTask(task) {
     const state = projectDetailState;
     if (!state.currentUser) {
@@ -1676,19 +1736,23 @@ function formatDateTimeForInput(value) {
     return tzAdjusted.toISOString().slice(0, 16);
 }
 
-function maybeOpenPendingTaskEdit() {
+async function maybeOpenPendingTaskEdit() {
     const pendingId = projectDetailState?.pendingEditTaskId;
     if (!pendingId) {
         return;
     }
+    // Cleared before any await so a board reload cannot open the modal twice.
+    projectDetailState.pendingEditTaskId = null;
+    clearPendingEditQueryParam();
 
-    const targetTask = projectDetailState.flatTasks.find(task => task.id === pendingId);
-    if (!targetTask) {
+    let targetTask;
+    try {
+        targetTask = await loadProjectTask(pendingId);
+    } catch (error) {
+        notify?.("Unable to open task", { type: "error", description: error.message });
         return;
     }
 
-    projectDetailState.pendingEditTaskId = null;
-    clearPendingEditQueryParam();
     setProjectTab("tasks");
     openProjectTaskModal(targetTask);
     requestAnimationFrame(() => {
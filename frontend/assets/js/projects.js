@@ -87,6 +87,9 @@ function renderProjectGrid() {
         const memberCount = project.member_count ?? project.memberships?.length ?? 0;
         const ownerName = project.owner?.display_name || project.owner?.username || "Unknown";
         const taskCount = project.task_count ?? 0;
+        const previewNames = (project.member_preview || [])
+            .map(member => member.display_name || member.username)
+            .join(", ");
         const badge = project.archived ? '<span class="badge" style="background: var(--border); color: var(--text-muted);">Archived</span>' : '';
         const pillStyle = project.color ? `style="background:${project.color}"` : "";
         return `
@@ -97,7 +100,7 @@ function renderProjectGrid() {
                 </div>
                 <p class="helper-text">Owner · ${ownerName}</p>
                 <div class="project-card__meta">
-                    <span>${memberCount} members</span>
+                    <span title="${previewNames}">${memberCount} members</span>
                     <span>${taskCount} tasks</span>
                 </div>
                 <div class="project-pill" ${pillStyle}></div>
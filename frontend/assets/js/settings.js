@@ -54,8 +54,11 @@ function initSettingsPage(token) {
     let teamRefreshTimer;
     let cachedTeams = [];
     let profileBaseline = null;
+    const USER_PAGE_SIZE = 100;
     let allUsers = [];
     let adminUsers = [];
+    let modalUsersCursor = null;
+    let adminUsersCursor = null;
     let selectedMemberIds = new Set();
 
     const teamsPromise = loadPublicTeams();
@@ -98,16 +101,31 @@ function initSettingsPage(token) {
         if (memberList) memberList.innerHTML = "";
     }
 
-    async function loadUsersForModal() {
+    function fetchUsersPage(cursor = null) {
+        const params = new URLSearchParams({ limit: String(USER_PAGE_SIZE) });
+        if (cursor) params.set("cursor", cursor);
+        return fetch(`${API_BASE_URL}/users/?${params.toString()}`, {
+            headers: { "Authorization": `Bearer ${token}` }
+        });
+    }
+
+    function loadMoreButton() {
+        return '<button type="button" class="ghost-button" data-load-more-users>Load more users</button>';
+    }
+
+    async function loadUsersForModal(append = false) {
         if (!memberList) return;
-        memberList.innerHTML = '<p class="helper-text">Loading users...</p>';
+        if (!append) {
+            memberList.innerHTML = '<p class="helper-text">Loading users...</p>';
+        }
         try {
-            const response = await fetch(`${API_BASE_URL}/users/`, {
-                headers: { "Authorization": `Bearer ${token}` }
-            });
+            const response = await fetchUsersPage(append ? modalUsersCursor : null);
             if (!response.ok) throw new Error("Unable to load users");
-            allUsers = await response.json();
-            renderMemberList();
+            const page = await response.json();
+            const items = Array.isArray(page.items) ? page.items : [];
+            allUsers = append ? allUsers.concat(items) : items;
+            modalUsersCursor = page.next_cursor || null;
+            renderMemberList(memberSearch?.value || "");
         } catch (error) {
             memberList.innerHTML = `<p class="helper-text error">${error.message}</p>`;
         }
@@ -124,7 +142,8 @@ function initSettingsPage(token) {
         );
 
         if (filtered.length === 0) {
-            memberList.innerHTML = '<p class="helper-text">No users found.</p>';
+            memberList.innerHTML = '<p class="helper-text">No users found.</p>' + (modalUsersCursor ? loadMoreButton() : "");
+            memberList.querySelector("[data-load-more-users]")?.addEventListener("click", () => loadUsersForModal(true));
             return;
         }
 
@@ -145,12 +164,13 @@ function initSettingsPage(token) {
                     </div>
                 </div>
             `;
-        }).join("");
+        }).join("") + (modalUsersCursor ? loadMoreButton() : "");
 
         // Re-attach listeners
         memberList.querySelectorAll(".member-item").forEach(item => {
             item.addEventListener("click", () => toggleMemberSelection(item));
         });
+        memberList.querySelector("[data-load-more-users]")?.addEventListener("click", () => loadUsersForModal(true));
     }
 
     async function toggleMemberSelection(item) {
@@ -421,13 +441,9 @@ function initSettingsPage(token) {
         }
     }
 
-    async function loadUsersForAdmin() {
+    async function loadUsersForAdmin(append = false) {
         try {
-            const response = await fetch(`${API_BASE_URL}/users/`, {
-                headers: {
-                    "Authorization": `Bearer ${token}`
-                }
-            });
+            const response = await fetchUsersPage(append ? adminUsersCursor : null);
 
             if (response.status === 401) {
                 logout();
@@ -438,8 +454,10 @@ function initSettingsPage(token) {
                 throw new Error("Unable to load users");
             }
 
-            const users = await response.json();
-            adminUsers = Array.isArray(users) ? users : [];
+            const page = await response.json();
+            const items = Array.isArray(page.items) ? page.items : [];
+            adminUsers = append ? adminUsers.concat(items) : items;
+            adminUsersCursor = page.next_cursor || null;
             applyRoleSearch();
         } catch (error) {
             userRoleList.innerHTML = `<p class="helper-text error">${error.message}</p>`;
@@ -450,7 +468,7 @@ function initSettingsPage(token) {
         if (!Array.isArray(users) || users.length === 0) {
             const hasSearch = Boolean(roleSearchInput?.value.trim());
             const emptyText = hasSearch ? "No members match your search." : "No users found.";
-            userRoleList.innerHTML = `<p class="helper-text">${emptyText}</p>`;
+            userRoleList.innerHTML = `<p class="helper-text">${emptyText}</p>` + (adminUsersCursor ? loadMoreButton() : "");
             return;
         }
 
@@ -483,7 +501,7 @@ function initSettingsPage(token) {
                     </div>
                 </div>
             `;
-        }).join("");
+        }).join("") + (adminUsersCursor ? loadMoreButton() : "");
     }
 
     roleSearchInput?.addEventListener("input", (event) => {
@@ -511,6 +529,11 @@ function initSettingsPage(token) {
 
     userRoleList?.addEventListener("click", event => {
         const target = event.target;
+        if (target.hasAttribute("data-load-more-users")) {
+            target.disabled = true;
+            loadUsersForAdmin(true);
+            return;
+        }
         if (!target.classList.contains("role-save-btn") || target.disabled) {
             return;
         }
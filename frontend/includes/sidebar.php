@@ -34,6 +34,7 @@
             <small class="sidebar__identity-role" id="sidebarRole">
                 <?php echo htmlspecialchars($role, ENT_QUOTES, 'UTF-8'); ?>
             </small>
+            <span class="sidebar__badge" id="notificationBadge" title="Unread notifications" hidden></span>
         </div>
     </div>
 
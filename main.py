@@ -3,8 +3,18 @@ from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.api.endpoints import projects, tasks, users, teams
+from backend.api.endpoints import health, jobs, notifications, profiles, projects, tasks, users, teams
+from backend.api.middleware.admission import ConcurrencyLimitMiddleware, rate_limit_middleware
 from backend.api.middleware.middleware import logging_middleware, logger
+from backend.api.middleware.profiling import profiling_middleware
+from backend.api.middleware.read_your_writes import read_your_writes_middleware
+from backend.api.middleware.request_context import request_context_middleware
+from backend.core.config import settings
+from backend.core.jobs import schedule_periodic, shutdown_jobs, start_scheduler, stop_scheduler
+from backend.core.maintenance import schedule_purge
+from backend.core.profiling import continuous_profiler
+from backend.core.realtime import deliver_notifications
+from backend.core.reminders import scan_due_tasks
 from backend.db.database import Base, engine
 
 app = FastAPI()
@@ -22,6 +32,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Wrote-At"],
 )
 
 # app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -33,12 +44,43 @@ app.include_router(tasks.router, prefix=API_PREFIX, tags=["Tasks"])
 app.include_router(projects.router, prefix=API_PREFIX, tags=["Projects"])
 app.include_router(users.router, prefix=API_PREFIX, tags=["Users"])
 app.include_router(teams.router, prefix=API_PREFIX, tags=["Teams"])
+app.include_router(jobs.router, prefix=API_PREFIX, tags=["Jobs"])
+app.include_router(notifications.router, prefix=API_PREFIX, tags=["Notifications"])
+app.include_router(profiles.router, prefix=API_PREFIX, tags=["Profiles"])
+app.include_router(health.router, tags=["Health"])
+# Innermost: only the handler's own work is profiled.
+app.middleware("http")(profiling_middleware)
+app.middleware("http")(read_your_writes_middleware)
 app.middleware("http")(logging_middleware)
+app.middleware("http")(rate_limit_middleware)
+# Registered after the others so it rejects before any other work is done.
+app.add_middleware(ConcurrencyLimitMiddleware)
+# Outermost: every response, including admission rejections, carries X-Request-ID.
+app.middleware("http")(request_context_middleware)
 
 
 @app.on_event("startup")
 def startup_db():
-    Base.metadata.create_all(bind=engine)
+    # Alembic owns the schema; create_all costs a round trip per table on every worker boot.
+    if settings.AUTO_CREATE_TABLES:
+        Base.metadata.create_all(bind=engine)
+
+
+@app.on_event("startup")
+def start_job_scheduler():
+    schedule_periodic("purge-deleted", settings.PURGE_INTERVAL_SECONDS, schedule_purge)
+    schedule_periodic("due-date-reminders", settings.REMINDER_SCAN_INTERVAL_SECONDS, scan_due_tasks)
+    schedule_periodic("push-notifications", settings.NOTIFICATION_PUSH_INTERVAL_SECONDS, deliver_notifications)
+    start_scheduler()
+    if settings.PROFILE_CONTINUOUS_ENABLED:
+        continuous_profiler.start()
+
+
+@app.on_event("shutdown")
+def shutdown_job_workers():
+    stop_scheduler(timeout=5)
+    continuous_profiler.stop(timeout=1)
+    shutdown_jobs(wait=False)
 
 
 @app.exception_handler(Exception)
@@ -56,5 +98,6 @@ def read_root():
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    from backend.core.server import main as run_server
+
+    run_server()
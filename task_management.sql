@@ -20,6 +20,8 @@ CREATE TABLE IF NOT EXISTS user (
     username VARCHAR(50) NOT NULL,
     email VARCHAR(100) NOT NULL,
     display_name VARCHAR(100) NULL,
+    username_lower VARCHAR(50) NULL,
+    display_name_lower VARCHAR(100) NULL,
     team_id INT UNSIGNED NULL,
     hashed_password VARCHAR(128) NOT NULL,
     role VARCHAR(20) NOT NULL DEFAULT 'user',
@@ -27,10 +29,13 @@ CREATE TABLE IF NOT EXISTS user (
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     last_login DATETIME NULL,
+    unread_notifications INT NOT NULL DEFAULT 0,
     PRIMARY KEY (id),
     UNIQUE KEY uq_user_username (username),
     UNIQUE KEY uq_user_email (email),
     KEY idx_user_team (team_id),
+    KEY ix_user_username_lower (username_lower),
+    KEY ix_user_display_name_lower (display_name_lower),
     CONSTRAINT fk_user_team FOREIGN KEY (team_id)
         REFERENCES team (id) ON DELETE SET NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -69,8 +74,10 @@ CREATE TABLE IF NOT EXISTS project (
     archived TINYINT(1) NOT NULL DEFAULT 0,
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    deleted_at DATETIME NULL,
     PRIMARY KEY (id),
     KEY idx_project_owner (owner_id),
+    KEY ix_project_deleted_at (deleted_at),
     CONSTRAINT fk_project_owner FOREIGN KEY (owner_id)
         REFERENCES user (id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -93,12 +100,17 @@ CREATE TABLE IF NOT EXISTS task (
     parent_task_id INT UNSIGNED NULL,
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    deleted_at DATETIME NULL,
     PRIMARY KEY (id),
     KEY idx_task_title (title),
     KEY idx_task_project (project_id),
     KEY idx_task_creator (creator_id),
     KEY idx_task_assignee (assignee_id),
     KEY idx_task_parent (parent_task_id),
+    KEY ix_task_updated_at (updated_at),
+    KEY ix_task_deleted_at (deleted_at),
+    KEY ix_task_due_date_status (due_date, status),
+    KEY ix_task_project_status_due (project_id, status, due_date, id),
     CONSTRAINT fk_task_project FOREIGN KEY (project_id)
         REFERENCES project (id) ON DELETE CASCADE,
     CONSTRAINT fk_task_creator FOREIGN KEY (creator_id)
@@ -122,6 +134,83 @@ CREATE TABLE IF NOT EXISTS project_member (
         REFERENCES user (id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
+CREATE TABLE IF NOT EXISTS job (
+    id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    kind VARCHAR(50) NOT NULL,
+    status ENUM('queued','running','succeeded','failed') NOT NULL DEFAULT 'queued',
+    payload JSON NULL,
+    result JSON NULL,
+    error VARCHAR(500) NULL,
+    progress_current INT NOT NULL DEFAULT 0,
+    progress_total INT NULL,
+    created_by INT UNSIGNED NULL,
+    singleton_key VARCHAR(50) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at DATETIME NULL,
+    finished_at DATETIME NULL,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    UNIQUE KEY uq_job_singleton_key (singleton_key),
+    CONSTRAINT fk_job_creator FOREIGN KEY (created_by)
+        REFERENCES user (id) ON DELETE SET NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS notification (
+    id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    user_id INT UNSIGNED NOT NULL,
+    kind VARCHAR(30) NOT NULL,
+    task_id INT UNSIGNED NULL,
+    project_id INT UNSIGNED NULL,
+    message VARCHAR(255) NOT NULL,
+    dedupe_key VARCHAR(150) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    read_at DATETIME NULL,
+    PRIMARY KEY (id),
+    UNIQUE KEY uq_notification_dedupe_key (dedupe_key),
+    KEY ix_notification_user_id (user_id),
+    CONSTRAINT fk_notification_user FOREIGN KEY (user_id)
+        REFERENCES user (id) ON DELETE CASCADE,
+    CONSTRAINT fk_notification_task FOREIGN KEY (task_id)
+        REFERENCES task (id) ON DELETE CASCADE,
+    CONSTRAINT fk_notification_project FOREIGN KEY (project_id)
+        REFERENCES project (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS progress_rollup (
+    scope ENUM('project','task') NOT NULL,
+    scope_id INT UNSIGNED NOT NULL,
+    total_count INT NOT NULL DEFAULT 0,
+    done_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, scope_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS task_event (
+    id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    task_id INT UNSIGNED NOT NULL,
+    project_id INT UNSIGNED NULL,
+    actor_id INT UNSIGNED NULL,
+    action VARCHAR(20) NOT NULL,
+    changes JSON NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_task_event_task_created (task_id, created_at),
+    KEY ix_task_event_project_created (project_id, created_at),
+    KEY ix_task_event_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS task_change (
+    id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    task_id INT UNSIGNED NULL,
+    project_id INT UNSIGNED NULL,
+    creator_id INT UNSIGNED NULL,
+    is_personal TINYINT(1) NOT NULL DEFAULT 0,
+    user_id INT UNSIGNED NULL,
+    deleted TINYINT(1) NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id),
+    KEY ix_task_change_created_at (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
 -- Add default users
 INSERT INTO user (username, email, display_name, team_id, hashed_password, role)
 VALUES
@@ -448,4 +537,19 @@ JOIN user member_user ON member_user.username = 'member'
 WHERE p.name = 'Support Playbook Refresh'
     AND NOT EXISTS (
             SELECT 1 FROM task t WHERE t.title = 'Escalation Simulation' AND t.project_id = p.id
-    );
\ No newline at end of file
+    );
+-- Seed progress rollups from the sample tasks (equivalent to `python -m backend.db.rollups`)
+DELETE FROM progress_rollup;
+INSERT INTO progress_rollup (scope, scope_id, total_count, done_count)
+SELECT 'project', project_id, COUNT(*), SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END)
+FROM task
+WHERE project_id IS NOT NULL
+GROUP BY project_id;
+INSERT INTO progress_rollup (scope, scope_id, total_count, done_count)
+SELECT 'task', parent_task_id, COUNT(*), SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END)
+FROM task
+WHERE parent_task_id IS NOT NULL
+GROUP BY parent_task_id;
+
+-- Normalized search columns for the sample users (the app maintains them on every user write)
+UPDATE user SET username_lower = LOWER(username), display_name_lower = LOWER(display_name);
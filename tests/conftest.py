@@ -12,3 +12,51 @@ from backend.db.database import Base, engine  # noqa: E402
 from backend.db import db_structure  # noqa: E402,F401
 
 Base.metadata.create_all(bind=engine)
+
+import time  # noqa: E402
+
+import pytest  # noqa: E402
+
+from backend.core.security import create_access_token  # noqa: E402
+from backend.db.database import SessionLocal  # noqa: E402
+from backend.db.db_structure import User  # noqa: E402
+
+
+@pytest.fixture
+def make_user():
+    """Create an active user directly in the DB and return its id and auth headers."""
+    def _make_user(prefix: str = "user", role: str = "user") -> dict:
+        unique = time.time_ns()
+        db = SessionLocal()
+        try:
+            user = User(
+                username=f"{prefix}_{unique}",
+                email=f"{prefix}_{unique}@example.com",
+                hashed_password="hashed",
+                role=role,
+            )
+            db.add(user)
+            db.commit()
+            token = create_access_token({"sub": user.username, "user_id": user.id, "role": user.role})
+            return {
+                "id": user.id,
+                "username": user.username,
+                "headers": {"Authorization": f"Bearer {token}"},
+            }
+        finally:
+            db.close()
+    return _make_user
+
+
+@pytest.fixture
+def admin_headers():
+    """Auth headers for the ``admin`` account, which admin-only endpoints check by username."""
+    db = SessionLocal()
+    try:
+        if db.query(User).filter(User.username == "admin").first() is None:
+            db.add(User(username="admin", email="admin@example.com", hashed_password="hashed", role="admin"))
+            db.commit()
+    finally:
+        db.close()
+    token = create_access_token({"sub": "admin", "role": "admin"})
+    return {"Authorization": f"Bearer {token}"}
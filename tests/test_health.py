@@ -0,0 +1,32 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_healthz_reports_liveness():
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_readyz_pings_database():
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["database"] == "ok"
+    assert "pool" in body
+
+
+def test_pool_share_leaves_room_for_background_threads(monkeypatch):
+    from backend.core.config import settings
+    from backend.db.database import pool_options
+
+    monkeypatch.setattr(settings, "WEB_WORKERS", 4)
+    monkeypatch.setattr(settings, "JOB_WORKERS", 2)
+    assert pool_options("mysql+pymysql://db/app", total=40)["pool_size"] == 10
+    # 40 // 16 = 2 would leave the five background connections nothing for requests.
+    monkeypatch.setattr(settings, "WEB_WORKERS", 16)
+    assert pool_options("mysql+pymysql://db/app", total=40, reserved=settings.db_background_connections)["pool_size"] == 6
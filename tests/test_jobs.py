@@ -0,0 +1,137 @@
+import time
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from backend.core.config import settings
+from backend.core.jobs import fail_stale_jobs
+from backend.core.maintenance import PURGE_JOB, schedule_purge
+from backend.db.database import SessionLocal
+from backend.db.db_structure import Job, Project, Task
+from main import app
+
+client = TestClient(app)
+
+OFF_PEAK = datetime(2026, 1, 1, settings.PURGE_WINDOW_START_HOUR, 30)
+PEAK = datetime(2026, 1, 1, 14, 0)
+
+
+def _wait_for_job(job_id: int, headers: dict, timeout: float = 5.0) -> dict:
+    deadline = time.time() + timeout
+    while True:
+        response = client.get(f"/api/v1/jobs/{job_id}", headers=headers)
+        assert response.status_code == 200
+        job = response.json()
+        if job["status"] in {"succeeded", "failed"} or time.time() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+def _row_exists(model, row_id: int) -> bool:
+    db = SessionLocal()
+    try:
+        return db.query(model.id).execution_options(include_deleted=True).filter(model.id == row_id).first() is not None
+    finally:
+        db.close()
+
+
+def test_delete_project_soft_deletes_then_purge_job_removes_it(make_user, monkeypatch):
+    manager = make_user("jobs_manager", role="manager")
+    admin = make_user("jobs_admin", role="admin")
+    created = client.post("/api/v1/projects/", json={"name": "Disposable"}, headers=manager["headers"])
+    assert created.status_code == 201
+    project_id = created.json()["id"]
+    task = client.post(
+        "/api/v1/tasks/",
+        json={"title": "Doomed task", "project_id": project_id},
+        headers=manager["headers"],
+    )
+    assert task.status_code == 201
+    task_id = task.json()["id"]
+
+    response = client.delete(f"/api/v1/projects/{project_id}", headers=manager["headers"])
+    assert response.status_code == 204
+    assert client.get(f"/api/v1/projects/{project_id}", headers=manager["headers"]).status_code == 404
+    assert client.get(f"/api/v1/tasks/{task_id}", headers=manager["headers"]).status_code == 404
+    assert _row_exists(Project, project_id)
+
+    assert schedule_purge(PEAK) is None
+    monkeypatch.setattr(settings, "SOFT_DELETE_GRACE_HOURS", 0)
+    job_id = schedule_purge(OFF_PEAK)
+    assert job_id is not None
+
+    job = _wait_for_job(job_id, admin["headers"])
+    assert job["status"] == "succeeded"
+    assert job["result"]["projects_purged"] >= 1
+    assert not _row_exists(Project, project_id)
+    assert not _row_exists(Task, task_id)
+
+
+def test_system_jobs_are_visible_to_admins_only(make_user):
+    admin = make_user("jobs_admin", role="admin")
+    manager = make_user("jobs_outsider", role="manager")
+    job_id = schedule_purge(OFF_PEAK)
+    assert job_id is not None
+    assert _wait_for_job(job_id, admin["headers"])["status"] == "succeeded"
+    assert client.get(f"/api/v1/jobs/{job_id}", headers=manager["headers"]).status_code == 404
+
+
+def test_schedule_purge_skips_while_another_worker_holds_the_claim():
+    db = SessionLocal()
+    try:
+        # What a different worker's scheduler leaves behind after winning the race.
+        claim = Job(kind=PURGE_JOB, status="queued", payload={}, singleton_key=PURGE_JOB)
+        db.add(claim)
+        db.commit()
+        try:
+            assert schedule_purge(OFF_PEAK) is None
+        finally:
+            db.delete(claim)
+            db.commit()
+    finally:
+        db.close()
+
+
+def test_jobs_abandoned_by_a_restart_are_marked_failed():
+    stale = datetime.utcnow() - timedelta(seconds=settings.JOB_STALE_SECONDS + 60)
+    db = SessionLocal()
+    try:
+        abandoned = Job(kind=PURGE_JOB, status="running", payload={}, singleton_key=PURGE_JOB, updated_at=stale)
+        live = Job(kind=PURGE_JOB, status="running", payload={})
+        db.add_all([abandoned, live])
+        db.commit()
+        try:
+            assert fail_stale_jobs() >= 1
+            db.expire_all()
+            assert (abandoned.status, abandoned.singleton_key) == ("failed", None)
+            assert abandoned.error.startswith("Interrupted")
+            assert live.status == "running"
+        finally:
+            db.delete(abandoned)
+            db.delete(live)
+            db.commit()
+    finally:
+        db.close()
+
+
+def test_purge_task_events_drops_only_expired_history():
+    from datetime import timedelta
+
+    from backend.db.db_structure import TaskEvent
+    from backend.db.task_events import purge_task_events
+
+    db = SessionLocal()
+    try:
+        # Other tests' history is recent, so only these two rows fall before the cutoff.
+        cutoff = datetime(2001, 1, 1)
+        for days_old in (30, 20):
+            db.add(TaskEvent(task_id=0, action="updated", changes={}, created_at=cutoff - timedelta(days=days_old)))
+        db.commit()
+        expired_ids = [event_id for (event_id,) in db.query(TaskEvent.id).filter(TaskEvent.created_at < cutoff)]
+        retained = db.query(TaskEvent.id).filter(TaskEvent.created_at >= cutoff).count()
+
+        assert purge_task_events(db, cutoff, chunk_size=1) == len(expired_ids)
+        assert db.query(TaskEvent.id).filter(TaskEvent.id.in_(expired_ids)).count() == 0
+        assert db.query(TaskEvent.id).count() == retained
+    finally:
+        db.close()
@@ -0,0 +1,89 @@
+import gzip
+import json
+import logging
+import os
+
+from backend.core import log_files
+from backend.core.config import settings
+
+
+def _logger_with(handler: logging.Handler, name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def test_json_logs_rotate_into_gzip_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "LOG_FORMAT", "json")
+    monkeypatch.setattr(settings, "LOG_ROTATION", "size")
+    monkeypatch.setattr(settings, "LOG_MAX_BYTES", 300)
+    monkeypatch.setattr(settings, "LOG_BACKUP_COUNT", 2)
+    handler = log_files.build_file_handler("app.log")
+    logger = _logger_with(handler, "tests.json_rotation")
+
+    for index in range(10):
+        logger.info("activity", extra={"user": "alice", "route": "/api/v1/tasks/{task_id}", "status": 200, "duration_ms": index})
+    handler.close()
+
+    current = [json.loads(line) for line in (tmp_path / "app.log").read_text().splitlines()]
+    assert current and current[-1]["duration_ms"] == 9
+    assert current[-1]["route"] == "/api/v1/tasks/{task_id}"
+    rotated = sorted(path.name for path in tmp_path.iterdir() if path.name != "app.log")
+    assert rotated == ["app.log.1.gz", "app.log.2.gz"]
+    with gzip.open(tmp_path / "app.log.1.gz", "rt") as archived:
+        assert json.loads(archived.readline())["user"] == "alice"
+
+
+def test_text_logs_start_each_file_with_the_header(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "LOG_FORMAT", "text")
+    monkeypatch.setattr(settings, "LOG_MAX_BYTES", 200)
+    monkeypatch.setattr(settings, "LOG_COMPRESS", False)
+    handler = log_files.build_file_handler("activity.log", header="| HEADER")
+    logger = _logger_with(handler, "tests.text_rotation")
+
+    for index in range(5):
+        logger.info("line %s %s", index, "x" * 60)
+    handler.close()
+
+    for path in (tmp_path / "activity.log", tmp_path / "activity.log.1"):
+        assert path.read_text().splitlines()[0] == "| HEADER"
+
+
+def test_workers_rotate_their_own_files_unless_rotation_is_external(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "WEB_WORKERS", 4)
+    monkeypatch.setattr(settings, "LOG_ROTATION", "size")
+    handler = log_files.build_file_handler("info.log")
+    assert handler.baseFilename == str(tmp_path / f"info.{os.getpid()}.log")
+    handler.close()
+
+    monkeypatch.setattr(settings, "LOG_ROTATION", "external")
+    handler = log_files.build_file_handler("info.log")
+    logger = _logger_with(handler, "tests.external_rotation")
+    logger.info("before")
+    # What logrotate does: move the file away; the next record lands in a fresh one.
+    (tmp_path / "info.log").rename(tmp_path / "info.log.1")
+    logger.info("after")
+    handler.close()
+
+    assert "before" in (tmp_path / "info.log.1").read_text()
+    assert "after" in (tmp_path / "info.log").read_text()
+
+
+def test_default_worker_count_uses_per_process_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "WEB_WORKERS", 0)
+    monkeypatch.setattr(settings, "LOG_ROTATION", "size")
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    handler = log_files.build_file_handler("info.log")
+    assert handler.baseFilename == str(tmp_path / f"info.{os.getpid()}.log")
+    handler.close()
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 1)
+    handler = log_files.build_file_handler("info.log")
+    assert handler.baseFilename == str(tmp_path / "info.log")
+    handler.close()
@@ -2,8 +2,9 @@ import time
 
 from backend.api.models.task import TaskCreate
 from backend.api.models.user import UserCreate
-from backend.db.db_structure import Project, Task, User
+from backend.db.db_structure import Project, ProjectMember, Task, User
 from backend.db.database import SessionLocal
+from backend.db.purge import purge_project
 from main import app  # ensures metadata is created
 
 db = SessionLocal()
@@ -89,5 +90,31 @@ def test_create_user_in_db():
     assert db_user.hashed_password == "testhashed"
 
 
+def test_purge_project_deletes_subtasks_in_chunks():
+    owner = _create_user("purge_owner")
+    project = Project(name="Purge me", owner_id=owner.id)
+    project.project_members.append(ProjectMember(user_id=owner.id, role="owner"))
+    db.add(project)
+    db.commit()
+
+    parent_id = None
+    for depth in range(3):
+        task = Task(title=f"Level {depth}", creator_id=owner.id, project_id=project.id, parent_task_id=parent_id)
+        db.add(task)
+        db.commit()
+        parent_id = task.id
+    project_id = project.id
+    db.expunge_all()
+
+    progress = []
+    deleted = purge_project(db, project_id, chunk_size=1, on_progress=lambda done, total: progress.append((done, total)))
+
+    assert deleted == 3
+    assert progress == [(0, 3), (1, 3), (2, 3), (3, 3)]
+    assert db.query(Task).filter(Task.project_id == project_id).count() == 0
+    assert db.query(ProjectMember).filter(ProjectMember.project_id == project_id).count() == 0
+    assert db.query(Project).filter(Project.id == project_id).first() is None
+
+
 def teardown_module(_module):
     db.close()
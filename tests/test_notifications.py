@@ -0,0 +1,194 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from backend.core import realtime
+from backend.core.reminders import scan_due_tasks
+from backend.db.database import SessionLocal
+from backend.db.db_structure import Notification, Task
+from main import app
+
+client = TestClient(app)
+
+NOW = datetime(2031, 3, 1, 12, 0)
+
+
+def _add_task(user_id: int, title: str, due_date: datetime, status: str = "to_do") -> int:
+    db = SessionLocal()
+    try:
+        task = Task(title=title, creator_id=user_id, due_date=due_date, status=status, is_personal=True)
+        db.add(task)
+        db.commit()
+        return task.id
+    finally:
+        db.close()
+
+
+def _notifications_for(user_id: int) -> list:
+    db = SessionLocal()
+    try:
+        rows = db.query(Notification).filter(Notification.user_id == user_id).order_by(Notification.id).all()
+        return [(row.kind, row.task_id) for row in rows]
+    finally:
+        db.close()
+
+
+def test_due_date_scan_records_each_reminder_once(make_user):
+    user = make_user("reminder_user")
+    soon = _add_task(user["id"], "Due soon", NOW + timedelta(minutes=30))
+    late = _add_task(user["id"], "Overdue", NOW - timedelta(hours=2))
+    _add_task(user["id"], "Finished", NOW - timedelta(hours=1), status="done")
+    _add_task(user["id"], "Far away", NOW + timedelta(days=3))
+
+    scan_due_tasks(NOW)
+    scan_due_tasks(NOW + timedelta(minutes=1))
+
+    assert sorted(_notifications_for(user["id"])) == sorted([("due_soon", soon), ("overdue", late)])
+
+
+def test_notifications_are_pushed_over_websocket(make_user):
+    user = make_user("socket_user")
+    token = user["headers"]["Authorization"].split(" ", 1)[1]
+    realtime.deliver_notifications()
+
+    with client.websocket_connect(f"/api/v1/ws/notifications?token={token}") as websocket:
+        task_id = _add_task(user["id"], "Pushed", NOW + timedelta(minutes=10))
+        scan_due_tasks(NOW)
+        assert realtime.deliver_notifications() == 1
+        message = websocket.receive_json()
+
+    assert message["kind"] == "due_soon"
+    assert message["task_id"] == task_id
+
+
+def _add_notification(user_id: int, notification_id: int, message: str):
+    db = SessionLocal()
+    try:
+        db.add(Notification(id=notification_id, user_id=user_id, kind="assigned", message=message))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_notification_committed_behind_a_newer_id_is_still_pushed(make_user):
+    user = make_user("late_commit_user")
+    token = user["headers"]["Authorization"].split(" ", 1)[1]
+    realtime.deliver_notifications()
+    db = SessionLocal()
+    try:
+        top = db.query(Notification.id).order_by(Notification.id.desc()).limit(1).scalar() or 0
+    finally:
+        db.close()
+
+    with client.websocket_connect(f"/api/v1/ws/notifications?token={token}") as websocket:
+        _add_notification(user["id"], top + 10, "Committed first")
+        assert realtime.deliver_notifications() == 1
+        # A transaction that took a lower id earlier commits only now.
+        _add_notification(user["id"], top + 5, "Committed late")
+        assert realtime.deliver_notifications() == 1
+        assert realtime.deliver_notifications() == 0
+        messages = [websocket.receive_json()["message"] for _ in range(2)]
+
+    assert messages == ["Committed first", "Committed late"]
+
+
+def test_notification_socket_rejects_invalid_token():
+    with pytest.raises(WebSocketDisconnect) as closed:
+        with client.websocket_connect("/api/v1/ws/notifications?token=invalid"):
+            pass
+    assert closed.value.code == 1008
+
+
+def _unread_count(headers: dict) -> int:
+    response = client.get("/api/v1/notifications/unread-count", headers=headers)
+    assert response.status_code == 200
+    return response.json()["unread_count"]
+
+
+def test_inbox_fans_out_assignment_status_and_membership_events(make_user):
+    manager = make_user("inbox_manager", role="manager")
+    member = make_user("inbox_member")
+    project_id = client.post("/api/v1/projects/", json={"name": "Inbox project"}, headers=manager["headers"]).json()["id"]
+    client.post(f"/api/v1/projects/{project_id}/members", json={"user_id": member["id"]}, headers=manager["headers"])
+    task_id = client.post(
+        "/api/v1/tasks/",
+        json={"title": "Inbox task", "project_id": project_id, "assignee_id": member["id"]},
+        headers=manager["headers"],
+    ).json()["id"]
+    client.put(f"/api/v1/tasks/{task_id}", json={"status": "in_progress"}, headers=member["headers"])
+
+    assert _unread_count(member["headers"]) == 2
+    assert _unread_count(manager["headers"]) == 1
+
+    first = client.get("/api/v1/notifications/", params={"limit": 1}, headers=member["headers"]).json()
+    assert [item["kind"] for item in first["items"]] == ["task_assigned"]
+    assert first["unread_count"] == 2
+    rest = client.get(
+        "/api/v1/notifications/", params={"limit": 1, "cursor": first["next_cursor"]}, headers=member["headers"]
+    ).json()
+    assert [item["kind"] for item in rest["items"]] == ["project_added"]
+    assert rest["next_cursor"] is None
+
+    read = client.post(f"/api/v1/notifications/{first['items'][0]['id']}/read", headers=member["headers"])
+    assert read.status_code == 200 and read.json()["read_at"] is not None
+    client.post(f"/api/v1/notifications/{first['items'][0]['id']}/read", headers=member["headers"])
+    assert _unread_count(member["headers"]) == 1
+
+    assert client.post("/api/v1/notifications/read-all", headers=member["headers"]).json() == {"unread_count": 0}
+    unread = client.get("/api/v1/notifications/", params={"unread_only": True}, headers=member["headers"]).json()
+    assert unread["items"] == []
+    assert client.post(f"/api/v1/notifications/{first['items'][0]['id']}/read", headers=manager["headers"]).status_code == 404
+
+
+def test_reconnecting_socket_replays_notifications_after_last_id(make_user):
+    user = make_user("socket_resume")
+    token = user["headers"]["Authorization"].split(" ", 1)[1]
+    seen = _add_task(user["id"], "Seen before", NOW + timedelta(minutes=5))
+    scan_due_tasks(NOW)
+    missed = _add_task(user["id"], "Missed while away", NOW + timedelta(minutes=20))
+    scan_due_tasks(NOW + timedelta(minutes=1))
+    db = SessionLocal()
+    try:
+        seen_id = db.query(Notification.id).filter(Notification.task_id == seen).scalar()
+    finally:
+        db.close()
+
+    with client.websocket_connect(f"/api/v1/ws/notifications?token={token}&last_id={seen_id}") as websocket:
+        message = websocket.receive_json()
+
+    assert message["task_id"] == missed
+    assert message["id"] > seen_id
+
+
+def test_failed_push_is_logged_and_drops_the_socket(monkeypatch):
+    class BrokenSocket:
+        async def send_json(self, payload):
+            raise RuntimeError("socket closed")
+
+    warnings = []
+    monkeypatch.setattr(realtime.logger, "warning", lambda message, *args: warnings.append(message % args))
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    hub = realtime.NotificationHub()
+    try:
+        asyncio.run_coroutine_threadsafe(_connect(hub, 7, BrokenSocket()), loop).result()
+        assert hub.push(7, {"id": 42}) == 1
+        deadline = time.time() + 2
+        while hub.connected_user_ids() and time.time() < deadline:
+            time.sleep(0.01)
+        assert hub.connected_user_ids() == []
+        assert warnings and "notification 42 to user 7 failed" in warnings[0]
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def _connect(hub, user_id, socket):
+    hub.connect(user_id, socket)
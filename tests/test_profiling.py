@@ -0,0 +1,76 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.core.config import settings
+from backend.core.profiling import continuous_profiler, profile_endpoint
+from main import app
+
+client = TestClient(app)
+
+
+def test_profile_flag_requires_admin(make_user):
+    user = make_user("profiled")
+    response = client.get("/api/v1/tasks/", headers={**user["headers"], "X-Profile": "sample"})
+    assert response.status_code == 403
+
+    unflagged = client.get("/api/v1/tasks/", headers=user["headers"])
+    assert unflagged.status_code == 200
+    assert "X-Profile-Report" not in unflagged.headers
+
+
+def test_admin_downloads_request_profile(tmp_path, monkeypatch, admin_headers):
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+
+    response = client.get("/api/v1/tasks/?profile=deterministic", headers=admin_headers)
+    assert response.status_code == 200
+    report_id = response.headers["X-Profile-Report"]
+
+    listed = client.get("/api/v1/profiles/", headers=admin_headers).json()
+    assert listed[0]["id"] == report_id
+    assert listed[0]["route"] == "GET /api/v1/tasks/"
+    assert listed[0]["mode"] == "deterministic"
+
+    download = client.get(f"/api/v1/profiles/{report_id}", headers=admin_headers)
+    assert download.status_code == 200
+    assert "tasks.py" in download.text
+    assert report_id in download.headers["Content-Disposition"]
+
+
+def test_request_reports_are_pruned(tmp_path, monkeypatch, admin_headers):
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "PROFILE_MAX_REPORTS", 2)
+    for _ in range(3):
+        assert client.get("/healthz", headers={**admin_headers, "X-Profile": "1"}).status_code == 200
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_continuous_profiler_aggregates_stacks_per_route(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_CONTINUOUS_INTERVAL_MS", 1)
+    continuous_profiler.start()
+    try:
+        with profile_endpoint("GET /slow"):
+            time.sleep(0.05)
+    finally:
+        continuous_profiler.stop(timeout=1)
+    route = next(entry for entry in continuous_profiler.snapshot(5) if entry["route"] == "GET /slow")
+    assert route["samples"] > 0
+    assert "test_continuous_profiler_aggregates_stacks_per_route" in route["top_stacks"][0]["stack"]
+    assert continuous_profiler.running == {}
+
+
+def test_overlapping_calls_on_one_thread_are_tracked_separately(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_CONTINUOUS_INTERVAL_MS", 1)
+    continuous_profiler.start()
+    try:
+        # What two concurrent async endpoints look like: both on the event loop thread.
+        with profile_endpoint("GET /first"):
+            with profile_endpoint("GET /second"):
+                assert sorted(route for _, route in continuous_profiler.running.values()) == ["GET /first", "GET /second"]
+                time.sleep(0.05)
+            assert [route for _, route in continuous_profiler.running.values()] == ["GET /first"]
+    finally:
+        continuous_profiler.stop(timeout=1)
+    routes = {entry["route"] for entry in continuous_profiler.snapshot(5)}
+    assert "GET /second" not in routes
+    assert continuous_profiler.running == {}
@@ -0,0 +1,99 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.middleware import admission
+from backend.core import ratelimit
+from backend.core.config import settings
+from backend.core.ratelimit import InMemoryTokenBucket, RateLimit
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def fresh_limiter():
+    previous = ratelimit.get_backend()
+    ratelimit.set_backend(InMemoryTokenBucket())
+    yield
+    ratelimit.set_backend(previous)
+
+
+def test_token_bucket_refills_over_time(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(ratelimit, "monotonic", lambda: clock[0])
+    bucket = InMemoryTokenBucket()
+    limit = RateLimit(per_minute=60, burst=2)
+
+    assert bucket.acquire("k", limit) == (True, 0.0)
+    assert bucket.acquire("k", limit) == (True, 0.0)
+    allowed, retry_after = bucket.acquire("k", limit)
+    assert not allowed and retry_after == pytest.approx(1.0)
+
+    clock[0] += 1.0
+    assert bucket.acquire("k", limit)[0] is True
+    assert bucket.acquire("other", limit)[0] is True
+
+
+def test_read_limit_is_per_user(make_user, fresh_limiter, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_READ_PER_MINUTE", 1)
+    monkeypatch.setattr(settings, "RATE_LIMIT_READ_BURST", 2)
+    noisy = make_user("limit_noisy")
+    quiet = make_user("limit_quiet")
+
+    statuses = [client.get("/api/v1/tasks/", headers=noisy["headers"]).status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+    limited = client.get("/api/v1/tasks/", headers=noisy["headers"])
+    assert int(limited.headers["Retry-After"]) >= 1
+    assert client.get("/api/v1/tasks/", headers=quiet["headers"]).status_code == 200
+    assert client.get("/healthz").status_code == 200
+
+
+def test_login_is_limited_by_client_ip(fresh_limiter, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_AUTH_BURST", 1)
+    form = {"username": "nobody", "password": "wrong"}
+    assert client.post("/api/v1/login/", data=form).status_code != 429
+    assert client.post("/api/v1/login/", data=form).status_code == 429
+
+
+def test_in_flight_cap_sheds_with_503(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_IN_FLIGHT_REQUESTS", 1)
+    monkeypatch.setattr(admission, "_in_flight", 1)
+    assert client.get("/").status_code == 503
+    assert client.get("/healthz").status_code == 200
+
+
+def _request(peer: str, forwarded: str = None):
+    from starlette.requests import Request
+
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_forwarded_address_is_only_believed_from_trusted_proxies(monkeypatch):
+    from backend.core.security import client_address
+
+    monkeypatch.setattr(settings, "TRUSTED_PROXIES", "10.0.0.0/8")
+    assert client_address(_request("203.0.113.7", "1.1.1.1")) == "203.0.113.7"
+    # The spoofed first hop is ignored: the nearest untrusted hop is the client.
+    assert client_address(_request("10.0.0.5", "1.1.1.1, 198.51.100.4, 10.0.0.9")) == "198.51.100.4"
+    assert client_address(_request("10.0.0.5")) == "10.0.0.5"
+
+
+def test_in_flight_slot_is_held_until_the_body_is_sent(monkeypatch):
+    from starlette.responses import StreamingResponse
+
+    monkeypatch.setattr(admission, "_in_flight", 0)
+    seen = []
+
+    async def body():
+        for chunk in (b"a", b"b"):
+            seen.append(admission._in_flight)
+            yield chunk
+
+    async def streaming_app(scope, receive, send):
+        await StreamingResponse(body())(scope, receive, send)
+
+    response = TestClient(admission.ConcurrencyLimitMiddleware(streaming_app)).get("/export")
+    assert response.content == b"ab"
+    assert seen == [1, 1]
+    assert admission._in_flight == 0
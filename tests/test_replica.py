@@ -0,0 +1,82 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.cache import MISSING
+from backend.db import database, replica
+from backend.db.access import get_project_role, project_role_cache
+from backend.db.database import Base
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def empty_replica(tmp_path, monkeypatch):
+    """A 'replica' with the schema but no rows, so reads served by it are easy to spot."""
+    replica_engine = create_engine(f"sqlite:///{(tmp_path / 'replica.db').as_posix()}")
+    Base.metadata.create_all(bind=replica_engine)
+    monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(bind=replica_engine))
+    replica.reset()
+    client.cookies.clear()
+    yield
+    replica.reset()
+    replica_engine.dispose()
+
+
+def test_reads_go_to_replica_except_right_after_own_writes(make_user, empty_replica):
+    manager = make_user("replica_manager", role="manager")
+    reader = make_user("replica_reader", role="manager")
+
+    # The replica has no users, so a replica-routed search cannot see the requester.
+    assert client.get("/api/v1/users/search/", headers=reader["headers"]).status_code == 404
+
+    created = client.post("/api/v1/projects/", json={"name": "Sticky"}, headers=manager["headers"])
+    assert created.status_code == 201
+    listed = client.get("/api/v1/projects/", headers=manager["headers"])
+    assert listed.status_code == 200
+    assert [project["id"] for project in listed.json()] == [created.json()["id"]]
+
+
+def test_unreachable_replica_falls_back_to_primary(make_user, tmp_path, monkeypatch):
+    broken = create_engine(f"sqlite:///{(tmp_path / 'missing' / 'replica.db').as_posix()}")
+    monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(bind=broken))
+    replica.reset()
+    # A write marker left by an earlier test would keep this read off the replica.
+    client.cookies.clear()
+    user = make_user("replica_fallback")
+    try:
+        response = client.get("/api/v1/users/search/", headers=user["headers"])
+        assert response.status_code == 200
+        assert not replica.replica_available()
+    finally:
+        replica.reset()
+
+
+def test_write_marker_pins_reads_on_any_worker(make_user, empty_replica):
+    manager = make_user("replica_marker", role="manager")
+    created = client.post("/api/v1/projects/", json={"name": "Marked"}, headers=manager["headers"])
+    wrote_at = created.headers["X-Wrote-At"]
+
+    # A fresh client stands in for another worker: no cookie, only the echoed header.
+    other = TestClient(app)
+    # The empty replica does not know the user yet.
+    assert other.get("/api/v1/projects/", headers=manager["headers"]).status_code == 404
+    pinned = other.get("/api/v1/projects/", headers={**manager["headers"], "X-Wrote-At": wrote_at})
+    assert [project["id"] for project in pinned.json()] == [created.json()["id"]]
+
+
+def test_replica_sessions_do_not_fill_the_role_cache(make_user):
+    owner = make_user("replica_cache", role="manager")
+    project_id = client.post("/api/v1/projects/", json={"name": "Cached"}, headers=owner["headers"]).json()["id"]
+    key = (project_id, owner["id"])
+    project_role_cache.invalidate(key)
+
+    db = database.SessionLocal()
+    db.info[replica.REPLICA_SESSION] = True
+    try:
+        assert get_project_role(db, project_id, owner["id"]) == "owner"
+    finally:
+        db.close()
+    assert project_role_cache.get(key) is MISSING
@@ -0,0 +1,474 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from backend.core.cache import MISSING
+from backend.core.config import settings
+from backend.db.access import get_project_role, project_role_cache
+from backend.db.database import SessionLocal, engine
+from backend.db.db_structure import ProgressRollup, Task
+from backend.db.rollups import rebuild_rollups
+from main import app
+
+client = TestClient(app)
+
+
+def _create_project(headers: dict, name: str = "Tasks project") -> int:
+    response = client.post("/api/v1/projects/", json={"name": name}, headers=headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_task(headers: dict, project_id: int, title: str, parent_task_id=None, status: str = "to_do") -> int:
+    payload = {"title": title, "project_id": project_id, "status": status}
+    if parent_task_id is not None:
+        payload["parent_task_id"] = parent_task_id
+    response = client.post("/api/v1/tasks/", json=payload, headers=headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_task_tree_rolls_up_descendant_counts(make_user):
+    manager = make_user("tree_manager", role="manager")
+    headers = manager["headers"]
+    project_id = _create_project(headers)
+    root = _create_task(headers, project_id, "Root")
+    child = _create_task(headers, project_id, "Child", parent_task_id=root, status="done")
+    _create_task(headers, project_id, "Sibling", parent_task_id=root)
+    _create_task(headers, project_id, "Grandchild", parent_task_id=child, status="done")
+
+    response = client.get(f"/api/v1/tasks/{root}/tree", headers=headers)
+    assert response.status_code == 200
+    tree = response.json()
+    assert tree["id"] == root
+    assert (tree["total_count"], tree["done_count"]) == (3, 2)
+    assert [node["title"] for node in tree["children"]] == ["Child", "Sibling"]
+    assert tree["children"][0]["children"][0]["depth"] == 2
+
+    shallow = client.get(f"/api/v1/tasks/{root}/tree?max_depth=1", headers=headers).json()
+    child_node = shallow["children"][0]
+    assert child_node["children"] == []
+    assert child_node["truncated"] is True
+    assert (child_node["total_count"], child_node["done_count"]) == (1, 1)
+    assert (shallow["total_count"], shallow["done_count"]) == (3, 2)
+
+
+def test_task_tree_requires_membership(make_user):
+    manager = make_user("tree_owner", role="manager")
+    outsider = make_user("tree_outsider")
+    project_id = _create_project(manager["headers"])
+    root = _create_task(manager["headers"], project_id, "Hidden")
+    response = client.get(f"/api/v1/tasks/{root}/tree", headers=outsider["headers"])
+    assert response.status_code == 403
+
+
+def test_delete_task_soft_deletes_its_subtree(make_user):
+    manager = make_user("soft_manager", role="manager")
+    headers = manager["headers"]
+    project_id = _create_project(headers, "Soft delete")
+    root = _create_task(headers, project_id, "Root")
+    child = _create_task(headers, project_id, "Child", parent_task_id=root, status="done")
+    _create_task(headers, project_id, "Survivor")
+
+    assert client.delete(f"/api/v1/tasks/{root}", headers=headers).status_code == 200
+    assert client.get(f"/api/v1/tasks/{child}", headers=headers).status_code == 404
+    listed = client.get("/api/v1/tasks/", params={"project_id": project_id}, headers=headers).json()
+    assert [task["title"] for task in listed] == ["Survivor"]
+    assert _progress(headers, project_id) == (1, 0)
+
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Task.id, Task.deleted_at)
+            .execution_options(include_deleted=True)
+            .filter(Task.id.in_([root, child]))
+            .all()
+        )
+    finally:
+        db.close()
+    assert len(rows) == 2 and all(deleted_at is not None for _, deleted_at in rows)
+
+
+def test_task_cannot_be_nested_under_itself_or_its_subtasks(make_user):
+    manager = make_user("cycle_manager", role="manager")
+    headers = manager["headers"]
+    project_id = _create_project(headers, "Cycles")
+    root = _create_task(headers, project_id, "Root")
+    child = _create_task(headers, project_id, "Child", parent_task_id=root)
+    grandchild = _create_task(headers, project_id, "Grandchild", parent_task_id=child)
+
+    for parent_id in (root, child, grandchild):
+        response = client.put(f"/api/v1/tasks/{root}", json={"parent_task_id": parent_id}, headers=headers)
+        assert response.status_code == 400
+
+    # A cycle already in the data must not multiply the delete's rollup deltas.
+    db = SessionLocal()
+    try:
+        db.query(Task).filter(Task.id == root).update({"parent_task_id": grandchild})
+        db.commit()
+    finally:
+        db.close()
+    assert client.delete(f"/api/v1/tasks/{root}", headers=headers).status_code == 200
+    assert _progress(headers, project_id) == (0, 0)
+
+
+def _progress(headers: dict, project_id: int):
+    body = client.get(f"/api/v1/projects/{project_id}", headers=headers).json()
+    return body["task_count"], body["done_count"]
+
+
+def test_project_progress_rollup_tracks_task_writes(make_user):
+    manager = make_user("rollup_manager", role="manager")
+    headers = manager["headers"]
+    project_id = _create_project(headers, "Rollups")
+    root = _create_task(headers, project_id, "Root")
+    child = _create_task(headers, project_id, "Child", parent_task_id=root)
+    _create_task(headers, project_id, "Grandchild", parent_task_id=child, status="done")
+    assert _progress(headers, project_id) == (3, 1)
+
+    response = client.put(f"/api/v1/tasks/{child}", json={"status": "done"}, headers=headers)
+    assert response.status_code == 200
+    assert _progress(headers, project_id) == (3, 2)
+
+    assert client.delete(f"/api/v1/tasks/{child}", headers=headers).status_code == 200
+    assert _progress(headers, project_id) == (1, 0)
+
+
+def test_rebuild_rollups_repairs_drift(make_user):
+    manager = make_user("rebuild_manager", role="manager")
+    headers = manager["headers"]
+    project_id = _create_project(headers, "Drifted")
+    _create_task(headers, project_id, "One", status="done")
+    _create_task(headers, project_id, "Two")
+
+    db = SessionLocal()
+    try:
+        db.query(ProgressRollup).filter(
+            ProgressRollup.scope == "project", ProgressRollup.scope_id == project_id
+        ).update({ProgressRollup.total_count: 99})
+        db.commit()
+        assert _progress(headers, project_id) == (99, 1)
+        rebuild_rollups(db, project_id)
+    finally:
+        db.close()
+    assert _progress(headers, project_id) == (2, 1)
+
+
+def test_membership_changes_invalidate_cached_project_roles(make_user):
+    manager = make_user("access_manager", role="manager")
+    member = make_user("access_member")
+    project_id = _create_project(manager["headers"], "Access")
+    payload = {"title": "Member task", "project_id": project_id}
+
+    assert client.post("/api/v1/tasks/", json=payload, headers=member["headers"]).status_code == 403
+
+    added = client.post(
+        f"/api/v1/projects/{project_id}/members",
+        json={"user_id": member["id"]},
+        headers=manager["headers"],
+    )
+    assert added.status_code == 200
+    assert client.post("/api/v1/tasks/", json=payload, headers=member["headers"]).status_code == 201
+
+    removed = client.delete(f"/api/v1/projects/{project_id}/members/{member['id']}", headers=manager["headers"])
+    assert removed.status_code == 200
+    assert client.post("/api/v1/tasks/", json=payload, headers=member["headers"]).status_code == 403
+
+
+def test_writes_ignore_roles_cached_before_a_removal(make_user):
+    manager = make_user("stale_manager", role="manager")
+    member = make_user("stale_member")
+    project_id = _create_project(manager["headers"], "Stale roles")
+    added = client.post(
+        f"/api/v1/projects/{project_id}/members",
+        json={"user_id": member["id"]},
+        headers=manager["headers"],
+    )
+    assert added.status_code == 200
+    assert client.delete(f"/api/v1/projects/{project_id}/members/{member['id']}", headers=manager["headers"]).status_code == 200
+
+    # Another worker, which neither saw the removal nor the client's write marker.
+    client.cookies.clear()
+    project_role_cache.set((project_id, member["id"]), "member")
+    payload = {"title": "Too late", "project_id": project_id}
+    assert client.post("/api/v1/tasks/", json=payload, headers=member["headers"]).status_code == 403
+
+
+def test_role_load_racing_an_invalidation_is_not_cached():
+    generation = project_role_cache.generation
+    project_role_cache.invalidate(("racing", 1))
+    project_role_cache.set(("racing", 1), "owner", generation)
+    assert project_role_cache.get(("racing", 1)) is MISSING
+
+
+def test_non_member_lookups_are_not_cached(make_user):
+    manager = make_user("negative_manager", role="manager")
+    outsider = make_user("negative_outsider")
+    project_id = _create_project(manager["headers"], "Negative cache")
+    db = SessionLocal()
+    try:
+        assert get_project_role(db, project_id, outsider["id"]) is None
+        assert project_role_cache.get((project_id, outsider["id"])) is MISSING
+        assert get_project_role(db, project_id, manager["id"]) == "owner"
+        assert project_role_cache.get((project_id, manager["id"])) == "owner"
+    finally:
+        db.close()
+
+
+def test_task_writes_do_not_reload_after_commit(make_user):
+    manager = make_user("roundtrip_manager", role="manager")
+    headers = manager["headers"]
+    project_id = _create_project(headers, "Round trips")
+    task_id = _create_task(headers, project_id, "Drag me")
+
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        response = client.put(f"/api/v1/tasks/{task_id}", json={"status": "in_progress"}, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "in_progress"
+    assert body["project"]["id"] == project_id
+    assert body["creator"]["id"] == manager["id"]
+    last_write = max(index for index, verb in enumerate(statements) if verb in {"UPDATE", "INSERT"})
+    assert "SELECT" not in statements[last_write:]
+
+
+def test_changes_feed_returns_updates_and_tombstones(make_user, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_CHANGES_SETTLE_SECONDS", 0)
+    manager = make_user("sync_manager", role="manager")
+    headers = manager["headers"]
+    project_id = _create_project(headers, "Sync")
+    kept = _create_task(headers, project_id, "Kept")
+    dropped = _create_task(headers, project_id, "Dropped")
+
+    first = client.get("/api/v1/tasks/changes", headers=headers)
+    assert first.status_code == 200
+    snapshot = first.json()
+    assert {kept, dropped} <= {task["id"] for task in snapshot["changed"]}
+    cursor = snapshot["cursor"]
+
+    idle = client.get("/api/v1/tasks/changes", params={"since": cursor}, headers=headers).json()
+    assert idle["changed"] == [] and idle["deleted"] == []
+
+    client.put(f"/api/v1/tasks/{kept}", json={"priority": "high"}, headers=headers)
+    client.delete(f"/api/v1/tasks/{dropped}", headers=headers)
+
+    delta = client.get("/api/v1/tasks/changes", params={"since": cursor}, headers=headers).json()
+    assert [task["id"] for task in delta["changed"]] == [kept]
+    assert [entry["task_id"] for entry in delta["deleted"]] == [dropped]
+    assert delta["has_more"] is False
+
+    outsider = make_user("sync_outsider")
+    foreign = client.get("/api/v1/tasks/changes", params={"since": cursor}, headers=outsider["headers"]).json()
+    assert foreign["changed"] == [] and foreign["deleted"] == []
+
+
+def test_changes_feed_rejects_malformed_cursor(make_user):
+    user = make_user("sync_cursor")
+    response = client.get("/api/v1/tasks/changes", params={"since": "not-a-cursor"}, headers=user["headers"])
+    assert response.status_code == 400
+
+
+def test_changes_feed_follows_project_access(make_user, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_CHANGES_SETTLE_SECONDS", 0)
+    owner = make_user("sync_owner", role="manager")
+    joiner = make_user("sync_joiner")
+    project_id = _create_project(owner["headers"], "Shared later")
+    existing = _create_task(owner["headers"], project_id, "Written before the join")
+
+    cursor = client.get("/api/v1/tasks/changes", headers=joiner["headers"]).json()["cursor"]
+    response = client.post(
+        f"/api/v1/projects/{project_id}/members", json={"user_id": joiner["id"]}, headers=owner["headers"],
+    )
+    assert response.status_code == 200
+
+    joined = client.get("/api/v1/tasks/changes", params={"since": cursor}, headers=joiner["headers"]).json()
+    assert [task["id"] for task in joined["changed"]] == [existing]
+    cursor = joined["cursor"]
+
+    client.delete(f"/api/v1/projects/{project_id}/members/{joiner['id']}", headers=owner["headers"])
+    left = client.get("/api/v1/tasks/changes", params={"since": cursor}, headers=joiner["headers"]).json()
+    assert left["removed_projects"] == [project_id]
+    assert left["changed"] == []
+
+
+def test_removing_a_member_publishes_their_unassigned_tasks(make_user, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_CHANGES_SETTLE_SECONDS", 0)
+    owner = make_user("unassign_owner", role="manager")
+    member = make_user("unassign_member")
+    project_id = _create_project(owner["headers"], "Unassign")
+    client.post(f"/api/v1/projects/{project_id}/members", json={"user_id": member["id"]}, headers=owner["headers"])
+    task = client.post(
+        "/api/v1/tasks/",
+        json={"title": "Handed off", "project_id": project_id, "assignee_id": member["id"]},
+        headers=owner["headers"],
+    ).json()
+    cursor = client.get("/api/v1/tasks/changes", headers=owner["headers"]).json()["cursor"]
+
+    client.delete(f"/api/v1/projects/{project_id}/members/{member['id']}", headers=owner["headers"])
+
+    delta = client.get("/api/v1/tasks/changes", params={"since": cursor}, headers=owner["headers"]).json()
+    assert [(entry["id"], entry["assignee"]) for entry in delta["changed"]] == [(task["id"], None)]
+    assert delta["changed"][0]["updated_at"] > task["updated_at"]
+
+
+def test_project_delete_reaches_sync_clients_before_the_purge(make_user, monkeypatch):
+    monkeypatch.setattr(settings, "TASK_CHANGES_SETTLE_SECONDS", 0)
+    owner = make_user("sync_doomed_owner", role="manager")
+    admin = make_user("sync_doomed_admin", role="admin")
+    project_id = _create_project(owner["headers"], "Doomed sync")
+    task_id = _create_task(owner["headers"], project_id, "Doomed")
+    owner_cursor = client.get("/api/v1/tasks/changes", headers=owner["headers"]).json()["cursor"]
+    admin_cursor = client.get("/api/v1/tasks/changes", params={"limit": 1000}, headers=admin["headers"]).json()["cursor"]
+
+    assert client.delete(f"/api/v1/projects/{project_id}", headers=owner["headers"]).status_code == 204
+
+    member_view = client.get("/api/v1/tasks/changes", params={"since": owner_cursor}, headers=owner["headers"]).json()
+    assert member_view["removed_projects"] == [project_id]
+    admin_view = client.get("/api/v1/tasks/changes", params={"since": admin_cursor}, headers=admin["headers"]).json()
+    assert [entry["task_id"] for entry in admin_view["deleted"]] == [task_id]
+
+
+def test_bulk_membership_diff_applies_adds_role_changes_and_removals(make_user):
+    owner = make_user("bulk_owner", role="manager")
+    keep, promote, drop = (make_user(f"bulk_{name}") for name in ("keep", "promote", "drop"))
+    project_id = _create_project(owner["headers"], "Bulk members")
+    url = f"/api/v1/projects/{project_id}/members"
+
+    response = client.put(url, json={"upsert": [
+        {"user_id": keep["id"]},
+        {"user_id": promote["id"]},
+        {"user_id": drop["id"]},
+    ]}, headers=owner["headers"])
+    assert response.status_code == 200
+    assert len(response.json()) == 4
+
+    task_id = client.post(
+        "/api/v1/tasks/",
+        json={"title": "Owned by drop", "project_id": project_id, "assignee_id": drop["id"]},
+        headers=owner["headers"],
+    ).json()["id"]
+
+    response = client.put(url, json={
+        "upsert": [{"user_id": promote["id"], "role": "manager"}],
+        "remove": [drop["id"]],
+    }, headers=owner["headers"])
+    assert response.status_code == 200
+    roles = {member["user"]["id"]: member["role"] for member in response.json()}
+    assert roles == {owner["id"]: "owner", keep["id"]: "member", promote["id"]: "manager"}
+    assert client.get(f"/api/v1/tasks/{task_id}", headers=owner["headers"]).json()["assignee"] is None
+
+    # Managers may add or remove members, but role changes stay with the owner.
+    denied = client.put(url, json={"upsert": [{"user_id": keep["id"], "role": "manager"}]}, headers=promote["headers"])
+    assert denied.status_code == 403
+    conflict = client.put(url, json={"remove": [owner["id"]]}, headers=owner["headers"])
+    assert conflict.status_code == 400
+
+
+def test_project_list_returns_summaries_and_detail_opts_into_members(make_user):
+    owner = make_user("summary_owner", role="manager")
+    members = [make_user(f"summary_member{index}") for index in range(6)]
+    project_id = _create_project(owner["headers"], "Summary project")
+    client.put(
+        f"/api/v1/projects/{project_id}/members",
+        json={"upsert": [{"user_id": member["id"]} for member in members]},
+        headers=owner["headers"],
+    )
+
+    listed = client.get("/api/v1/projects/", params={"search": "Summary project"}, headers=members[0]["headers"])
+    assert listed.status_code == 200
+    summary = next(item for item in listed.json() if item["id"] == project_id)
+    assert "memberships" not in summary
+    assert summary["member_count"] == 7
+    assert summary["viewer_role"] == "member"
+    assert [user["id"] for user in summary["member_preview"]][0] == owner["id"]
+    assert len(summary["member_preview"]) == 5
+
+    lean = client.get(f"/api/v1/projects/{project_id}", headers=members[0]["headers"]).json()
+    assert lean["memberships"] is None
+    assert lean["member_count"] == 7
+
+    full = client.get(f"/api/v1/projects/{project_id}?include=members", headers=members[0]["headers"]).json()
+    assert len(full["memberships"]) == 7
+
+    outsider = make_user("summary_outsider")
+    assert client.get(f"/api/v1/projects/{project_id}", headers=outsider["headers"]).status_code == 403
+
+
+def test_task_history_records_field_changes_and_survives_soft_delete(make_user):
+    owner = make_user("history_owner", role="manager")
+    member = make_user("history_member")
+    project_id = _create_project(owner["headers"], "History project")
+    client.post(f"/api/v1/projects/{project_id}/members", json={"user_id": member["id"]}, headers=owner["headers"])
+    task_id = _create_task(owner["headers"], project_id, "Audited")
+    client.put(f"/api/v1/tasks/{task_id}", json={"title": "Audited and renamed", "assignee_id": member["id"]}, headers=owner["headers"])
+    client.put(f"/api/v1/tasks/{task_id}", json={"title": "Audited and renamed"}, headers=owner["headers"])
+    client.delete(f"/api/v1/projects/{project_id}/members/{member['id']}", headers=owner["headers"])
+    client.delete(f"/api/v1/tasks/{task_id}", headers=owner["headers"])
+
+    first = client.get(f"/api/v1/tasks/{task_id}/history", params={"limit": 2}, headers=owner["headers"])
+    assert first.status_code == 200
+    page = first.json()
+    assert [event["action"] for event in page["items"]] == ["deleted", "updated"]
+    assert page["items"][1]["changes"] == {"assignee_id": [member["id"], None]}
+    rest = client.get(
+        f"/api/v1/tasks/{task_id}/history", params={"cursor": page["next_cursor"]}, headers=owner["headers"]
+    ).json()
+    assert [event["action"] for event in rest["items"]] == ["updated", "created"]
+    assert rest["items"][0]["changes"] == {
+        "title": ["Audited", "Audited and renamed"],
+        "assignee_id": [None, member["id"]],
+    }
+    assert rest["next_cursor"] is None
+
+    project_history = client.get(f"/api/v1/projects/{project_id}/history", headers=owner["headers"]).json()
+    assert len(project_history["items"]) == 4
+    assert client.get(f"/api/v1/tasks/{task_id}/history", headers=member["headers"]).status_code == 403
+
+
+def test_project_board_pages_each_column_with_its_own_cursor(make_user):
+    owner = make_user("board_owner", role="manager")
+    outsider = make_user("board_outsider")
+    headers = owner["headers"]
+    project_id = _create_project(headers, "Board project")
+    for day, title in ((3, "Third"), (1, "First"), (2, "Second")):
+        response = client.post(
+            "/api/v1/tasks/",
+            json={"title": title, "project_id": project_id, "status": "to_do", "due_date": f"2031-01-0{day}T09:00:00"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+    _create_task(headers, project_id, "Undated")
+    _create_task(headers, project_id, "Shipped", status="done")
+    removed = _create_task(headers, project_id, "Removed")
+    client.delete(f"/api/v1/tasks/{removed}", headers=headers)
+
+    board = client.get(f"/api/v1/projects/{project_id}/board", params={"limit": 2}, headers=headers)
+    assert board.status_code == 200
+    columns = {column["status"]: column for column in board.json()["columns"]}
+    assert [column["status"] for column in board.json()["columns"]] == ["to_do", "in_progress", "done"]
+    assert columns["to_do"]["total"] == 4
+    assert [task["title"] for task in columns["to_do"]["items"]] == ["First", "Second"]
+    assert columns["in_progress"] == {"status": "in_progress", "total": 0, "items": [], "next_cursor": None}
+    assert [task["title"] for task in columns["done"]["items"]] == ["Shipped"]
+    assert columns["done"]["next_cursor"] is None
+
+    titles, cursor = [], columns["to_do"]["next_cursor"]
+    while cursor:
+        page = client.get(
+            f"/api/v1/projects/{project_id}/board/to_do", params={"limit": 1, "cursor": cursor}, headers=headers
+        ).json()
+        titles += [task["title"] for task in page["items"]]
+        cursor = page["next_cursor"]
+    assert titles == ["Third", "Undated"]
+
+    bad = client.get(f"/api/v1/projects/{project_id}/board/to_do", params={"cursor": "nope"}, headers=headers)
+    assert bad.status_code == 400
+    assert client.get(f"/api/v1/projects/{project_id}/board", headers=outsider["headers"]).status_code == 403
@@ -0,0 +1,60 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def test_public_team_list_is_cached_with_etag():
+    first = client.get("/api/v1/teams/public/")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"].startswith("public, max-age=")
+
+    revalidated = client.get("/api/v1/teams/public/", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+
+
+def test_team_writes_invalidate_cached_lists(admin_headers):
+    headers = admin_headers
+    before = client.get("/api/v1/teams/public/")
+    name = f"Cache team {time.time_ns()}"
+    created = client.post("/api/v1/teams/", json={"name": name}, headers=headers)
+    assert created.status_code == 201
+
+    after = client.get("/api/v1/teams/public/", headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 200
+    assert name in [team["name"] for team in after.json()]
+
+    renamed = client.put(f"/api/v1/teams/{created.json()['id']}/", json={"name": name + " v2"}, headers=headers)
+    assert renamed.status_code == 200
+    admin_list = client.get("/api/v1/teams/", headers=headers)
+    assert name + " v2" in [team["name"] for team in admin_list.json()]
+    assert admin_list.headers["Cache-Control"] == "private, no-cache"
+
+
+def test_team_membership_is_batched_and_paginated(admin_headers, make_user):
+    team = client.post("/api/v1/teams/", json={"name": f"Batch {time.time_ns()}"}, headers=admin_headers).json()
+    users = [make_user(f"teamed{index}") for index in range(3)]
+    user_ids = [user["id"] for user in users]
+    members_url = f"/api/v1/teams/{team['id']}/members/"
+
+    added = client.post(members_url, json=user_ids + [user_ids[0]], headers=admin_headers)
+    assert added.status_code == 200
+    assert added.json()["updated"] == 3
+    assert client.post(members_url, json=[10**9], headers=admin_headers).status_code == 400
+
+    first = client.get(members_url, params={"limit": 2}, headers=admin_headers).json()
+    assert first["total"] == 3
+    assert [member["id"] for member in first["items"]] == user_ids[:2]
+    rest = client.get(members_url, params={"limit": 2, "cursor": first["next_cursor"]}, headers=users[0]["headers"])
+    assert rest.status_code == 200
+    assert [member["id"] for member in rest.json()["items"]] == user_ids[2:]
+
+    removed = client.request("DELETE", members_url, json=user_ids[:2], headers=admin_headers)
+    assert removed.json()["updated"] == 2
+    assert client.get(members_url, headers=admin_headers).json()["total"] == 1
+    assert client.get(members_url, headers=users[0]["headers"]).status_code == 403
@@ -0,0 +1,63 @@
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from backend.core import tracing
+from backend.core.config import settings
+from backend.core.request_context import request_id_var
+from backend.db.database import engine
+from main import app
+
+client = TestClient(app)
+
+
+def test_request_id_is_echoed_or_generated():
+    echoed = client.get("/healthz", headers={"X-Request-ID": "req-abc.123"})
+    assert echoed.headers["X-Request-ID"] == "req-abc.123"
+
+    unsafe = client.get("/healthz", headers={"X-Request-ID": "bad id */ drop"})
+    generated = unsafe.headers["X-Request-ID"]
+    assert generated != "bad id */ drop"
+    assert len(generated) == 32
+
+
+def test_sql_carries_request_id_comment():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "after_cursor_execute", capture)
+    token = request_id_var.set("req-sql-1")
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        request_id_var.reset(token)
+        event.remove(engine, "after_cursor_execute", capture)
+    assert statements[-1].endswith("/* request_id=req-sql-1 */")
+
+
+def test_sampled_request_writes_otlp_trace(tmp_path, monkeypatch, make_user):
+    user = make_user("tracer")
+    monkeypatch.setattr(settings, "TRACING_ENABLED", True)
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(tracing._trace_logger, "handlers", [])
+
+    response = client.get("/api/v1/tasks/", headers=user["headers"])
+    assert response.status_code == 200
+    for handler in tracing._trace_logger.handlers:
+        handler.close()
+
+    lines = (tmp_path / settings.TRACE_FILE).read_text().splitlines()
+    assert len(lines) == 1
+    spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    root = spans[0]
+    assert root["name"] == "GET /api/v1/tasks/"
+    assert "parentSpanId" not in root
+    assert {span["traceId"] for span in spans} == {response.headers["X-Request-ID"]}
+    names = {span["name"] for span in spans[1:]}
+    assert {"auth", "db", "endpoint", "serialize"} <= names
+    assert all(span["parentSpanId"] == root["spanId"] for span in spans[1:])
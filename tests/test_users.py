@@ -0,0 +1,106 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from backend.db.database import SessionLocal
+from backend.db.db_structure import User
+from main import app
+
+client = TestClient(app)
+
+
+def _make_named_user(username: str, display_name: str, team_id=None) -> int:
+    db = SessionLocal()
+    try:
+        user = User(
+            username=username,
+            email=f"{username}@example.com",
+            hashed_password="hashed",
+            display_name=display_name,
+            team_id=team_id,
+        )
+        db.add(user)
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def _search(headers: dict, **params):
+    response = client.get("/api/v1/users/search/", params=params, headers=headers)
+    assert response.status_code == 200
+    return [user["id"] for user in response.json()]
+
+
+def test_search_ranks_exact_then_prefix_and_falls_back_to_substring(make_user):
+    searcher = make_user("searcher")
+    tag = f"zq{time.time_ns() % 10**8}"
+    substring = _make_named_user(f"x{tag}x_sub", f"Has {tag} inside")
+    prefix = _make_named_user(f"{tag}_prefix", "Prefix Person")
+    exact = _make_named_user(f"exact_{tag}", tag.upper())
+
+    assert _search(searcher["headers"], q=tag) == [exact, prefix]
+    assert _search(searcher["headers"], q=tag, limit=1) == [exact]
+    # Substring matches are only looked up when nothing starts with the term.
+    assert _search(searcher["headers"], q=f"{tag}x") == [substring]
+    # Short terms never fall back to a substring scan.
+    assert substring not in _search(searcher["headers"], q=tag[:2], limit=25)
+
+
+def test_search_normalizes_renamed_users_and_escapes_wildcards(make_user):
+    searcher = make_user("searcher_rename")
+    tag = f"rn{time.time_ns() % 10**8}"
+    user_id = _make_named_user(f"{tag}_old", "Old Name")
+    db = SessionLocal()
+    try:
+        db.get(User, user_id).display_name = f"{tag} Renamed"
+        db.commit()
+    finally:
+        db.close()
+
+    assert user_id in _search(searcher["headers"], q=f"{tag} REN")
+    assert _search(searcher["headers"], q="%") == []
+
+
+def test_search_can_be_scoped_to_a_project(make_user):
+    manager = make_user("search_scope", role="manager")
+    outsider = make_user("search_outsider")
+    project = client.post("/api/v1/projects/", json={"name": "Scoped"}, headers=manager["headers"]).json()
+
+    assert _search(manager["headers"], q="search_", project_id=project["id"]) == [manager["id"]]
+    forbidden = client.get(
+        "/api/v1/users/search/", params={"q": "search_", "project_id": project["id"]}, headers=outsider["headers"]
+    )
+    assert forbidden.status_code == 403
+
+
+def test_admin_user_list_is_paginated_and_filtered(admin_headers):
+    headers = admin_headers
+    role = f"auditor{time.time_ns() % 10**6}"
+    ids = []
+    for index in range(3):
+        user_id = _make_named_user(f"{role}_{index}", f"Auditor {index}")
+        db = SessionLocal()
+        try:
+            db.get(User, user_id).role = role
+            db.commit()
+        finally:
+            db.close()
+        ids.append(user_id)
+
+    first = client.get("/api/v1/users/", params={"role": role, "limit": 2}, headers=headers)
+    assert first.status_code == 200
+    page = first.json()
+    assert page["total"] == 3
+    assert [user["id"] for user in page["items"]] == ids[:2]
+    assert page["next_cursor"]
+
+    second = client.get(
+        "/api/v1/users/", params={"role": role, "limit": 2, "cursor": page["next_cursor"]}, headers=headers
+    ).json()
+    assert [user["id"] for user in second["items"]] == ids[2:]
+    assert second["total"] == 3
+    assert second["next_cursor"] is None
+
+    bad = client.get("/api/v1/users/", params={"cursor": "nope"}, headers=headers)
+    assert bad.status_code == 400